@@ -0,0 +1,29 @@
+"""add tailored render inputs
+
+Revision ID: 0007_add_tailored_render_inputs
+Revises: 0006_visitor_ip_tracking
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0007_add_tailored_render_inputs"
+down_revision = "0006_visitor_ip_tracking"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("tailored_resumes", sa.Column("candidate_name", sa.String(length=255), nullable=True))
+    op.add_column(
+        "tailored_resumes",
+        sa.Column("tailored_skills", postgresql.JSON(), nullable=False, server_default="[]"),
+    )
+    op.alter_column("tailored_resumes", "tailored_skills", server_default=None)
+
+
+def downgrade() -> None:
+    op.drop_column("tailored_resumes", "tailored_skills")
+    op.drop_column("tailored_resumes", "candidate_name")
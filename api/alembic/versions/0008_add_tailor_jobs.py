@@ -0,0 +1,41 @@
+"""add tailor jobs queue
+
+Revision ID: 0008_add_tailor_jobs
+Revises: 0007_add_tailored_render_inputs
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0008_add_tailor_jobs"
+down_revision = "0007_add_tailored_render_inputs"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tailor_jobs",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("source_ip", sa.String(length=64), nullable=True),
+        sa.Column("status", sa.String(length=20), nullable=False, server_default="queued"),
+        sa.Column("payload", postgresql.JSON(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("tailored_resume_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["tailored_resume_id"], ["tailored_resumes.id"], ondelete="SET NULL"),
+    )
+    op.create_index("ix_tailor_jobs_user_id", "tailor_jobs", ["user_id"], unique=False)
+    op.create_index("ix_tailor_jobs_status_created_at", "tailor_jobs", ["status", "created_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tailor_jobs_status_created_at", table_name="tailor_jobs")
+    op.drop_index("ix_tailor_jobs_user_id", table_name="tailor_jobs")
+    op.drop_table("tailor_jobs")
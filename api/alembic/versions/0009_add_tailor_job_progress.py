@@ -0,0 +1,27 @@
+"""add tailor job progress events
+
+Revision ID: 0009_add_tailor_job_progress
+Revises: 0008_add_tailor_jobs
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0009_add_tailor_job_progress"
+down_revision = "0008_add_tailor_jobs"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "tailor_jobs",
+        sa.Column("progress", postgresql.JSON(), nullable=False, server_default="[]"),
+    )
+    op.alter_column("tailor_jobs", "progress", server_default=None)
+
+
+def downgrade() -> None:
+    op.drop_column("tailor_jobs", "progress")
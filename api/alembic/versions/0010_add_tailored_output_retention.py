@@ -0,0 +1,30 @@
+"""add tailored output size and purge tracking
+
+Revision ID: 0010_add_tailored_output_retention
+Revises: 0009_add_tailor_job_progress
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0010_add_tailored_output_retention"
+down_revision = "0009_add_tailor_job_progress"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("tailored_resumes", sa.Column("output_bytes", sa.BigInteger(), nullable=True))
+    op.add_column("tailored_resumes", sa.Column("outputs_purged_at", sa.DateTime(), nullable=True))
+    op.create_index(
+        "ix_tailored_resumes_retention",
+        "tailored_resumes",
+        ["outputs_purged_at", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tailored_resumes_retention", table_name="tailored_resumes")
+    op.drop_column("tailored_resumes", "outputs_purged_at")
+    op.drop_column("tailored_resumes", "output_bytes")
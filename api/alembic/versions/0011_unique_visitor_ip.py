@@ -0,0 +1,58 @@
+"""make visitor_identities.ip_address unique
+
+Revision ID: 0011_unique_visitor_ip
+Revises: 0010_add_tailored_output_retention
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+
+revision = "0011_unique_visitor_ip"
+down_revision = "0010_add_tailored_output_retention"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Fold duplicate rows per IP into the most recently seen one: visits are summed, the
+    # earliest first_seen is kept and user_id follows the latest linked row.
+    op.execute(
+        """
+        UPDATE visitor_identities AS keep
+        SET visit_count = agg.visit_count,
+            first_seen = agg.first_seen,
+            user_id = agg.user_id
+        FROM (
+            SELECT d.ip_address,
+                   sum(d.visit_count) AS visit_count,
+                   min(d.first_seen) AS first_seen,
+                   (SELECT v.user_id FROM visitor_identities v
+                     WHERE v.ip_address = d.ip_address AND v.user_id IS NOT NULL
+                     ORDER BY v.last_seen DESC LIMIT 1) AS user_id,
+                   (SELECT v.id FROM visitor_identities v
+                     WHERE v.ip_address = d.ip_address
+                     ORDER BY v.last_seen DESC, v.id LIMIT 1) AS keep_id
+            FROM visitor_identities d
+            GROUP BY d.ip_address
+            HAVING count(*) > 1
+        ) AS agg
+        WHERE keep.id = agg.keep_id
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM visitor_identities v
+        WHERE EXISTS (
+            SELECT 1 FROM visitor_identities o
+            WHERE o.ip_address = v.ip_address
+              AND (o.last_seen > v.last_seen OR (o.last_seen = v.last_seen AND o.id < v.id))
+        )
+        """
+    )
+    op.drop_index("ix_visitor_identities_ip_address", table_name="visitor_identities")
+    op.create_index("ix_visitor_identities_ip_address", "visitor_identities", ["ip_address"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_visitor_identities_ip_address", table_name="visitor_identities")
+    op.create_index("ix_visitor_identities_ip_address", "visitor_identities", ["ip_address"], unique=False)
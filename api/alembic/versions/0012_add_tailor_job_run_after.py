@@ -0,0 +1,22 @@
+"""add tailor job retry backoff
+
+Revision ID: 0012_add_tailor_job_run_after
+Revises: 0011_unique_visitor_ip
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0012_add_tailor_job_run_after"
+down_revision = "0011_unique_visitor_ip"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("tailor_jobs", sa.Column("run_after", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("tailor_jobs", "run_after")
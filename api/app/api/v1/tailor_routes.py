@@ -1,26 +1,61 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Request
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, HTMLResponse, RedirectResponse, Response, StreamingResponse
+import asyncio
+import hashlib
+import json
+import mimetypes
 import os
+import time
 from typing import Any, cast
+from urllib.parse import quote
 from uuid import UUID
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.libs.db.base import get_db
+from app.libs.archive.zip_stream import stream_zip
+from app.libs.db.base import get_async_db, get_db
+from app.libs.storage.registry import get_storage
 from app.schemas.job_analysis_schema import JobAnalyzeRequest, JobAnalyzeResponse
 from app.schemas.resume_profile_schema import ResumeParseRequest, ResumeParseResponse
 from app.schemas.tailored_resume_schema import TailorResumeRequest, TailorResumeResponse
 from app.schemas.tailor_regenerate_schema import TailorRegenerateRequest
 from app.schemas.tailor_result_schema import TailorResultResponse
+from app.schemas.tailor_job_schema import TailorJobResponse
+from app.schemas.tailor_batch_schema import TailorBatchRequest, TailorBatchResponse
+from app.services.job_queue_service import (
+    JOB_FAILED,
+    JOB_SUCCEEDED,
+    enqueue_tailor_job_async,
+    get_tailor_job_async,
+    progress_events_after,
+)
 from app.services.tailor_service import (
-    create_job_analysis,
-    create_resume_profile,
-    create_tailored_resume,
-    update_resume_profile_data,
+    create_job_analysis_async,
+    create_resume_profile_async,
     get_job_analysis,
     get_resume_profile,
     get_tailored_resume,
+    get_tailored_resume_async,
+    get_tailored_result_row_async,
+    get_tailored_resumes,
+    ensure_tailored_file,
+    invalidate_tailored_output_paths,
+    preview_tailored_resume,
+    regenerate_tailored_resume,
+    resolve_tailored_output_path,
     extract_text_from_upload,
+    run_tailor_batch,
+    run_tailor_pipeline,
+)
+from app.services.render_service import RenderTimeoutError
+from app.services.visitor_service import (
+    get_client_ip,
+    get_user_id_for_ip,
+    get_user_id_for_ip_async,
+    track_visitor_by_ip,
+    track_visitor_by_ip_async,
 )
-from app.services.visitor_service import get_client_ip, get_user_id_for_ip, track_visitor_by_ip
 from app.config.config import Config
 
 router = APIRouter(prefix="/tailor", tags=["tailor"])
@@ -54,15 +89,19 @@ def _as_list_dict(value: Any) -> list[dict]:
     return cast(list[dict], value)
 
 @router.post("/analyze-job", response_model=JobAnalyzeResponse)
-def analyze_job(payload: JobAnalyzeRequest, request: Request, db: Session = Depends(get_db)):
+async def analyze_job(
+    payload: JobAnalyzeRequest,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db, scope="function"),
+):
     if not payload.job_text and not payload.job_url:
         raise HTTPException(status_code=400, detail="job_text or job_url is required")
 
     ip_address = get_client_ip(request)
-    inferred_user_id = _as_optional_uuid(payload.user_id or get_user_id_for_ip(db, ip_address))
-    track_visitor_by_ip(db, ip_address, inferred_user_id)
+    inferred_user_id = _as_optional_uuid(payload.user_id or await get_user_id_for_ip_async(db, ip_address))
+    await track_visitor_by_ip_async(db, ip_address, inferred_user_id)
 
-    analysis = create_job_analysis(
+    analysis = await create_job_analysis_async(
         db=db,
         job_text=payload.job_text,
         job_url=str(payload.job_url) if payload.job_url else None,
@@ -72,15 +111,19 @@ def analyze_job(payload: JobAnalyzeRequest, request: Request, db: Session = Depe
     return analysis
 
 @router.post("/parse-resume", response_model=ResumeParseResponse)
-def parse_resume(payload: ResumeParseRequest, request: Request, db: Session = Depends(get_db)):
+async def parse_resume(
+    payload: ResumeParseRequest,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db, scope="function"),
+):
     if not payload.resume_text.strip():
         raise HTTPException(status_code=400, detail="resume_text is required")
 
     ip_address = get_client_ip(request)
-    inferred_user_id = _as_optional_uuid(payload.user_id or get_user_id_for_ip(db, ip_address))
-    track_visitor_by_ip(db, ip_address, inferred_user_id)
+    inferred_user_id = _as_optional_uuid(payload.user_id or await get_user_id_for_ip_async(db, ip_address))
+    await track_visitor_by_ip_async(db, ip_address, inferred_user_id)
 
-    profile = create_resume_profile(
+    profile = await create_resume_profile_async(
         db=db,
         resume_text=payload.resume_text,
         file_name=payload.file_name,
@@ -90,13 +133,7 @@ def parse_resume(payload: ResumeParseRequest, request: Request, db: Session = De
     return profile
 
 
-@router.post("/parse-resume-file", response_model=ResumeParseResponse)
-async def parse_resume_file(
-    request: Request,
-    file: UploadFile = File(...),
-    user_id: UUID | None = Form(default=None),
-    db: Session = Depends(get_db),
-):
+async def _read_upload_text(file: UploadFile) -> str:
     if not file.filename:
         raise HTTPException(status_code=400, detail="file is required")
 
@@ -105,15 +142,25 @@ async def parse_resume_file(
         raise HTTPException(status_code=400, detail="file is empty")
 
     try:
-        resume_text = extract_text_from_upload(file.filename, data)
+        return await run_in_threadpool(extract_text_from_upload, file.filename, data)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
+
+@router.post("/parse-resume-file", response_model=ResumeParseResponse)
+async def parse_resume_file(
+    request: Request,
+    file: UploadFile = File(...),
+    user_id: UUID | None = Form(default=None),
+    db: AsyncSession = Depends(get_async_db, scope="function"),
+):
+    resume_text = await _read_upload_text(file)
+
     ip_address = get_client_ip(request)
-    inferred_user_id = _as_optional_uuid(user_id or get_user_id_for_ip(db, ip_address))
-    track_visitor_by_ip(db, ip_address, inferred_user_id)
+    inferred_user_id = _as_optional_uuid(user_id or await get_user_id_for_ip_async(db, ip_address))
+    await track_visitor_by_ip_async(db, ip_address, inferred_user_id)
 
-    profile = create_resume_profile(
+    profile = await create_resume_profile_async(
         db=db,
         resume_text=resume_text,
         file_name=file.filename,
@@ -123,56 +170,159 @@ async def parse_resume_file(
     return profile
 
 @router.post("/generate", response_model=TailorResumeResponse)
-def generate_resume(payload: TailorResumeRequest, request: Request, db: Session = Depends(get_db)):
-    job_analysis = None
-    resume_profile = None
+def generate_resume(payload: TailorResumeRequest, request: Request, db: Session = Depends(get_db, scope="function")):
     ip_address = get_client_ip(request)
     inferred_user_id = _as_optional_uuid(payload.user_id or get_user_id_for_ip(db, ip_address))
     track_visitor_by_ip(db, ip_address, inferred_user_id)
 
-    if payload.job_analysis_id:
-        job_analysis = get_job_analysis(db, payload.job_analysis_id)
-    if payload.resume_profile_id:
-        resume_profile = get_resume_profile(db, payload.resume_profile_id)
-
-    if not job_analysis:
-        if not payload.job_text and not payload.job_url:
-            raise HTTPException(
-                status_code=400,
-                detail="job_text/job_url or job_analysis_id is required",
-            )
-        job_analysis = create_job_analysis(
-            db=db,
-            job_text=payload.job_text,
-            job_url=str(payload.job_url) if payload.job_url else None,
-            user_id=inferred_user_id,
-            source_ip=ip_address,
-        )
+    try:
+        tailored = run_tailor_pipeline(db, payload, inferred_user_id, ip_address)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except RenderTimeoutError as exc:
+        raise HTTPException(status_code=504, detail=str(exc)) from exc
+    return tailored
+
+
+@router.post("/batch", response_model=TailorBatchResponse)
+def generate_resume_batch(payload: TailorBatchRequest, request: Request, db: Session = Depends(get_db, scope="function")):
+    ip_address = get_client_ip(request)
+    inferred_user_id = _as_optional_uuid(payload.user_id or get_user_id_for_ip(db, ip_address))
+    track_visitor_by_ip(db, ip_address, inferred_user_id)
+
+    try:
+        return run_tailor_batch(db, payload, inferred_user_id, ip_address)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except RenderTimeoutError as exc:
+        raise HTTPException(status_code=504, detail=str(exc)) from exc
+
+
+@router.post("/jobs", response_model=TailorJobResponse, status_code=202)
+async def enqueue_generate_job(
+    payload: TailorResumeRequest,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db, scope="function"),
+):
+    if not payload.job_analysis_id and not payload.job_text and not payload.job_url:
+        raise HTTPException(status_code=400, detail="job_text/job_url or job_analysis_id is required")
+    if not payload.resume_profile_id and not payload.resume_text:
+        raise HTTPException(status_code=400, detail="resume_text or resume_profile_id is required")
+
+    ip_address = get_client_ip(request)
+    inferred_user_id = _as_optional_uuid(payload.user_id or await get_user_id_for_ip_async(db, ip_address))
+    await track_visitor_by_ip_async(db, ip_address, inferred_user_id)
+
+    return await enqueue_tailor_job_async(db, payload, inferred_user_id, ip_address)
+
+
+# Upload variant of /jobs: only the text extraction happens here, so job analysis and
+# resume parsing run in the worker and show up as stages on /jobs/{id}/events.
+@router.post("/jobs/file", response_model=TailorJobResponse, status_code=202)
+async def enqueue_generate_job_file(
+    request: Request,
+    file: UploadFile = File(...),
+    job_text: str | None = Form(default=None),
+    job_url: str | None = Form(default=None),
+    target_role: str | None = Form(default=None),
+    style: str | None = Form(default=None),
+    user_id: UUID | None = Form(default=None),
+    db: AsyncSession = Depends(get_async_db, scope="function"),
+):
+    if not job_text and not job_url:
+        raise HTTPException(status_code=400, detail="job_text or job_url is required")
+    resume_text = await _read_upload_text(file)
 
-    if not resume_profile:
-        if not payload.resume_text:
-            raise HTTPException(
-                status_code=400,
-                detail="resume_text or resume_profile_id is required",
-            )
-        resume_profile = create_resume_profile(
-            db=db,
-            resume_text=payload.resume_text,
-            file_name=payload.file_name,
-            user_id=inferred_user_id,
-            source_ip=ip_address,
+    try:
+        payload = TailorResumeRequest(
+            job_text=job_text,
+            job_url=job_url,
+            resume_text=resume_text,
+            file_name=file.filename,
+            target_role=target_role,
+            style=style,
         )
+    except ValidationError as exc:
+        raise HTTPException(status_code=400, detail="job_url is not a valid URL") from exc
 
-    tailored = create_tailored_resume(
-        db=db,
-        job_analysis=job_analysis,
-        resume_profile=resume_profile,
-        target_role=payload.target_role,
-        user_id=inferred_user_id,
-        style=payload.style,
-        source_ip=ip_address,
+    ip_address = get_client_ip(request)
+    inferred_user_id = _as_optional_uuid(user_id or await get_user_id_for_ip_async(db, ip_address))
+    await track_visitor_by_ip_async(db, ip_address, inferred_user_id)
+
+    return await enqueue_tailor_job_async(db, payload, inferred_user_id, ip_address)
+
+
+@router.get("/jobs/{job_id}", response_model=TailorJobResponse)
+async def read_generate_job(job_id: UUID, db: AsyncSession = Depends(get_async_db)):
+    job = await get_tailor_job_async(db, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+# Each poll ends its transaction so the connection goes back to the pool while the stream
+# sleeps, and the next poll sees the worker's latest progress.
+async def _load_job_events(db: AsyncSession, job_id: UUID) -> dict | None:
+    try:
+        job = await get_tailor_job_async(db, job_id)
+        if not job:
+            return None
+
+        result = None
+        if job.status == JOB_SUCCEEDED and job.tailored_resume_id:
+            tailored = await get_tailored_resume_async(db, _as_uuid(job.tailored_resume_id))
+            if tailored:
+                result = TailorResumeResponse.model_validate(tailored, from_attributes=True).model_dump(mode="json")
+
+        return {
+            "status": job.status,
+            "progress": list(job.progress or []),
+            "tailored_resume_id": str(job.tailored_resume_id) if job.tailored_resume_id else None,
+            "error": job.error,
+            "result": result,
+        }
+    finally:
+        await db.rollback()
+
+
+def _sse(event: str, data: dict, event_id: int | None = None) -> str:
+    id_line = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{id_line}event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@router.get("/jobs/{job_id}/events")
+async def stream_generate_job_events(job_id: UUID, request: Request, db: AsyncSession = Depends(get_async_db)):
+    snapshot = await _load_job_events(db, job_id)
+    if snapshot is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    # Positions are tracked by event sequence number, not list index, so events of a retried
+    # attempt are still delivered; a reconnecting EventSource resumes from Last-Event-ID.
+    last_event_id = request.headers.get("last-event-id", "")
+    last_seq = int(last_event_id) if last_event_id.isdigit() else 0
+
+    async def events():
+        nonlocal snapshot, last_seq
+        deadline = time.monotonic() + Config.JOB_EVENTS_TIMEOUT_SECONDS
+        while snapshot is not None:
+            for event in progress_events_after(snapshot["progress"], last_seq):
+                yield _sse("stage", event, event["seq"])
+                last_seq = event["seq"]
+
+            if snapshot["status"] in (JOB_SUCCEEDED, JOB_FAILED):
+                yield _sse("done", {key: value for key, value in snapshot.items() if key != "progress"})
+                return
+            if time.monotonic() > deadline or await request.is_disconnected():
+                return
+
+            await asyncio.sleep(Config.JOB_EVENTS_POLL_SECONDS)
+            snapshot = await _load_job_events(db, job_id)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
-    return tailored
 
 
 @router.post("/regenerate/{tailored_id}", response_model=TailorResumeResponse)
@@ -180,6 +330,28 @@ def regenerate_resume(
     tailored_id: UUID,
     payload: TailorRegenerateRequest,
     request: Request,
+    db: Session = Depends(get_db, scope="function"),
+):
+    tailored = get_tailored_resume(db, tailored_id)
+    if not tailored:
+        raise HTTPException(status_code=404, detail="Tailored resume not found")
+
+    ip_address = get_client_ip(request)
+    inferred_user_id = _as_optional_uuid(tailored.user_id or get_user_id_for_ip(db, ip_address))
+    track_visitor_by_ip(db, ip_address, inferred_user_id)
+
+    try:
+        return regenerate_tailored_resume(db, tailored, payload, inferred_user_id, ip_address)
+    except LookupError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except RenderTimeoutError as exc:
+        raise HTTPException(status_code=504, detail=str(exc)) from exc
+
+
+@router.post("/preview-html/{tailored_id}", response_class=HTMLResponse)
+def preview_tailored_html(
+    tailored_id: UUID,
+    payload: TailorRegenerateRequest,
     db: Session = Depends(get_db),
 ):
     tailored = get_tailored_resume(db, tailored_id)
@@ -192,115 +364,214 @@ def regenerate_resume(
     if not job_analysis or not resume_profile:
         raise HTTPException(status_code=404, detail="Analysis data not found")
 
-    ip_address = get_client_ip(request)
-    inferred_user_id = _as_optional_uuid(tailored.user_id or get_user_id_for_ip(db, ip_address))
-    track_visitor_by_ip(db, ip_address, inferred_user_id)
-
-    resume_profile = update_resume_profile_data(
-        db=db,
+    document = preview_tailored_resume(
+        job_analysis=job_analysis,
         resume_profile=resume_profile,
+        target_role=_as_optional_str(tailored.target_role),
+        style=_as_optional_str(payload.style or tailored.style),
         statement=payload.statement,
         skills=payload.skills,
         experience=payload.experience,
         education=payload.education,
     )
+    return HTMLResponse(document, headers={"Cache-Control": "no-store"})
+
+
+# Files under tailored/{uuid}/ are written once and never change, so the stored path is a
+# strong validator and responses can be cached indefinitely by browsers and CDNs.
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def _file_etag(relative_path: str) -> str:
+    return f'"{hashlib.sha256(relative_path.encode()).hexdigest()[:32]}"'
 
-    regenerated = create_tailored_resume(
-        db=db,
-        job_analysis=job_analysis,
-        resume_profile=resume_profile,
-        target_role=_as_optional_str(tailored.target_role),
-        user_id=inferred_user_id,
-        style=_as_optional_str(payload.style or tailored.style),
-        source_ip=ip_address,
-    )
-    return regenerated
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = [value.strip().removeprefix("W/") for value in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def _resolve_tailored_output(db: Session, tailored_id: UUID, filename: str) -> tuple[str, str]:
+    safe_name = os.path.basename(filename)
+    try:
+        relative_path = resolve_tailored_output_path(db, tailored_id, safe_name)
+    except LookupError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    return relative_path, safe_name
+
+
+def _tailored_file_response(
+    request: Request,
+    db: Session,
+    tailored_id: UUID,
+    relative_path: str,
+    safe_name: str,
+    inline: bool,
+) -> Response:
+    etag = _file_etag(relative_path)
+    headers = {"ETag": etag, "Cache-Control": IMMUTABLE_CACHE_CONTROL}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    storage = get_storage()
+    if not storage.exists(relative_path):
+        # Only lazy renders need the full row; a path that is no longer listed was purged.
+        tailored = get_tailored_resume(db, tailored_id)
+        if not tailored or relative_path not in _as_list_str(tailored.output_files):
+            invalidate_tailored_output_paths(tailored_id, [safe_name])
+            raise HTTPException(status_code=404, detail="File not found")
+        try:
+            found = ensure_tailored_file(db, tailored, relative_path)
+        except RenderTimeoutError as exc:
+            raise HTTPException(status_code=504, detail=str(exc)) from exc
+        if not found:
+            raise HTTPException(status_code=404, detail="File missing on disk")
+
+    file_path = storage.local_path(relative_path)
+    if file_path is None:
+        # Remote storage: send the client straight to a presigned URL instead of proxying bytes.
+        url = storage.download_url(relative_path, safe_name, inline)
+        if not url:
+            raise HTTPException(status_code=404, detail="File missing on disk")
+        cache_seconds = max(Config.S3_PRESIGN_SECONDS - 60, 0)
+        return RedirectResponse(url, status_code=307, headers={"Cache-Control": f"private, max-age={cache_seconds}"})
+
+    if Config.FILE_SERVING_MODE in ("x-accel", "x-sendfile"):
+        return _offloaded_file_response(file_path, relative_path, safe_name, inline, headers)
+
+    if inline:
+        media_type = "application/pdf" if safe_name.lower().endswith(".pdf") else None
+        headers["Content-Disposition"] = f'inline; filename="{safe_name}"'
+        return FileResponse(file_path, media_type=media_type, headers=headers)
+    return FileResponse(file_path, filename=safe_name, headers=headers)
+
+
+# Authorization and lazy rendering stay in Python; the proxy streams the bytes with sendfile
+# (and handles Range/If-Range) from the same storage directory.
+def _offloaded_file_response(
+    file_path: str,
+    relative_path: str,
+    safe_name: str,
+    inline: bool,
+    headers: dict[str, str],
+) -> Response:
+    media_type = mimetypes.guess_type(safe_name)[0] or "application/octet-stream"
+    disposition = "inline" if inline else "attachment"
+    headers["Content-Disposition"] = f"{disposition}; filename*=utf-8''{quote(safe_name)}"
+    if Config.FILE_SERVING_MODE == "x-accel":
+        headers["X-Accel-Redirect"] = f"{Config.X_ACCEL_PREFIX.rstrip('/')}/{quote(relative_path)}"
+    else:
+        headers["X-Sendfile"] = os.path.abspath(file_path)
+    return Response(media_type=media_type, headers=headers)
 
 
 @router.get("/download/{tailored_id}/{filename}")
 def download_tailored_file(
     tailored_id: UUID,
     filename: str,
-    db: Session = Depends(get_db),
+    request: Request,
+    db: Session = Depends(get_db, scope="function"),
 ):
-    tailored = get_tailored_resume(db, tailored_id)
-    if not tailored:
-        raise HTTPException(status_code=404, detail="Tailored resume not found")
-
-    safe_name = os.path.basename(filename)
-    output_files = _as_list_str(tailored.output_files)
-    candidates = [path for path in output_files if _as_str(path).endswith(safe_name)]
-    if not candidates:
-        raise HTTPException(status_code=404, detail="File not found")
-
-    relative_path = _as_str(candidates[0])
-    file_path = os.path.join(Config.STORAGE_PATH, relative_path)
-    if not os.path.exists(file_path):
-        raise HTTPException(status_code=404, detail="File missing on disk")
-
-    return FileResponse(file_path, filename=safe_name)
+    relative_path, safe_name = _resolve_tailored_output(db, tailored_id, filename)
+    return _tailored_file_response(request, db, tailored_id, relative_path, safe_name, inline=False)
 
 
 @router.get("/preview/{tailored_id}/{filename}")
 def preview_tailored_file(
     tailored_id: UUID,
     filename: str,
-    db: Session = Depends(get_db),
+    request: Request,
+    db: Session = Depends(get_db, scope="function"),
 ):
-    tailored = get_tailored_resume(db, tailored_id)
-    if not tailored:
-        raise HTTPException(status_code=404, detail="Tailored resume not found")
+    relative_path, safe_name = _resolve_tailored_output(db, tailored_id, filename)
+    return _tailored_file_response(request, db, tailored_id, relative_path, safe_name, inline=True)
+
+
+def _archive_entries(db: Session, tailored_ids: list[UUID]) -> list[tuple[str, str]]:
+    unique_ids = list(dict.fromkeys(tailored_ids))
+    if len(unique_ids) > Config.BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=400, detail=f"archive is limited to {Config.BATCH_MAX_ITEMS} resumes")
+
+    rows = {row.id: row for row in get_tailored_resumes(db, unique_ids)}
+    missing = [str(tailored_id) for tailored_id in unique_ids if tailored_id not in rows]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Tailored resume not found: {', '.join(missing)}")
+
+    entries = []
+    for tailored_id in unique_ids:
+        tailored = rows[tailored_id]
+        for relative_path in _as_list_str(tailored.output_files):
+            try:
+                found = ensure_tailored_file(db, tailored, relative_path)
+            except RenderTimeoutError as exc:
+                raise HTTPException(status_code=504, detail=str(exc)) from exc
+            if not found:
+                raise HTTPException(status_code=404, detail="File missing on disk")
+            name = os.path.basename(relative_path)
+            entries.append((name if len(unique_ids) == 1 else f"{tailored_id}/{name}", relative_path))
+    return entries
+
+
+def _archive_response(entries: list[tuple[str, str]], filename: str) -> StreamingResponse:
+    storage = get_storage()
+    return StreamingResponse(
+        stream_zip((name, storage.iter_chunks(key)) for name, key in entries),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
-    safe_name = os.path.basename(filename)
-    output_files = _as_list_str(tailored.output_files)
-    candidates = [path for path in output_files if _as_str(path).endswith(safe_name)]
-    if not candidates:
-        raise HTTPException(status_code=404, detail="File not found")
 
-    relative_path = _as_str(candidates[0])
-    file_path = os.path.join(Config.STORAGE_PATH, relative_path)
-    if not os.path.exists(file_path):
-        raise HTTPException(status_code=404, detail="File missing on disk")
+@router.get("/archive")
+def download_tailored_archive(ids: list[UUID] = Query(...), db: Session = Depends(get_db, scope="function")):
+    return _archive_response(_archive_entries(db, ids), "tailored-resumes.zip")
+
 
-    media_type = "application/pdf" if safe_name.lower().endswith(".pdf") else None
-    headers = {"Content-Disposition": f'inline; filename="{safe_name}"'}
-    return FileResponse(file_path, media_type=media_type, headers=headers)
+@router.get("/archive/{tailored_id}")
+def download_tailored_resume_archive(tailored_id: UUID, db: Session = Depends(get_db, scope="function")):
+    return _archive_response(_archive_entries(db, [tailored_id]), f"{tailored_id}.zip")
 
 
+# The body depends on the resume profile (edited in place by regenerate) and on retention
+# purges, so the ETag is a hash of the serialized result; clients revalidate every time and
+# get a 304 when nothing changed.
 @router.get("/result/{tailored_id}", response_model=TailorResultResponse)
-def get_tailored_result(tailored_id: UUID, db: Session = Depends(get_db)):
-    tailored = get_tailored_resume(db, tailored_id)
-    if not tailored:
+async def get_tailored_result(tailored_id: UUID, request: Request, db: AsyncSession = Depends(get_async_db)):
+    row = await get_tailored_result_row_async(db, tailored_id)
+    if not row:
         raise HTTPException(status_code=404, detail="Tailored resume not found")
-
-    job_analysis = get_job_analysis(db, _as_uuid(tailored.job_analysis_id))
-    resume_profile = get_resume_profile(db, _as_uuid(tailored.resume_profile_id))
-
-    if not job_analysis or not resume_profile:
+    if row.job_analysis_id is None or row.resume_profile_id is None:
         raise HTTPException(status_code=404, detail="Analysis data not found")
 
-    job_length = len(_as_str(job_analysis.extracted_text or ""))
-    match_score = min(96, 60 + job_length // 55)
-    parsed_data = cast(dict[str, Any], resume_profile.parsed_data or {})
+    match_score = min(96, 60 + (row.job_length or 0) // 55)
+    parsed_data = cast(dict[str, Any], row.parsed_data or {})
     candidate_name = cast(str | None, parsed_data.get("name"))
     statement = cast(str | None, parsed_data.get("summary"))
     skills = _as_list_str(parsed_data.get("skills", []))
     experience = _as_list_dict(parsed_data.get("experience", []))
     education = _as_list_dict(parsed_data.get("education", []))
 
-    return TailorResultResponse(
-        id=_as_uuid(tailored.id),
+    result = TailorResultResponse(
+        id=_as_uuid(row.id),
         match_score=match_score,
-        summary=_as_str(job_analysis.summary),
-        keywords=_as_list_str(job_analysis.keywords),
-        signals=_as_signals(job_analysis.signals),
-        outputs=_as_list_str(tailored.output_files),
+        summary=_as_str(row.summary),
+        keywords=_as_list_str(row.keywords),
+        signals=_as_signals(row.signals),
+        outputs=_as_list_str(row.output_files),
         statement=statement,
         skills=skills,
         experience=experience,
         education=education,
-        target_role=_as_optional_str(tailored.target_role),
-        style=_as_optional_str(tailored.style),
+        target_role=_as_optional_str(row.target_role),
+        style=_as_optional_str(row.style),
         candidate_name=candidate_name,
-        created_at=cast(Any, tailored.created_at),
+        created_at=cast(Any, row.created_at),
     )
+    body = result.model_dump_json().encode()
+    etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -21,7 +21,7 @@ router = APIRouter(
 
 
 @router.post("/signup", response_model=SignupResponse)
-def signup_user(payload: UserCreate, request: Request, db: Session = Depends(get_db)):
+def signup_user(payload: UserCreate, request: Request, db: Session = Depends(get_db, scope="function")):
     existing_by_email = get_user_by_email(db, payload.email)
     if existing_by_email is not None:
         raise HTTPException(status_code=409, detail="Email already in use")
@@ -34,7 +34,8 @@ def signup_user(payload: UserCreate, request: Request, db: Session = Depends(get
     user = create_user(db, payload)
     attach_anonymous_data_to_user_by_ip(db, ip_address, user.id)
     link_visitor_ip_to_user(db, ip_address, user.id)
-    track_visitor_by_ip(db, ip_address, user.id)
+    # The visitor row was just written in this transaction, so the visit is recorded in it too.
+    track_visitor_by_ip(db, ip_address, user.id, own_transaction=False)
 
     return {
         "user": user,
@@ -43,13 +44,13 @@ def signup_user(payload: UserCreate, request: Request, db: Session = Depends(get
 
 
 @router.post("/track-visit")
-def track_visit(request: Request, db: Session = Depends(get_db)):
+def track_visit(request: Request, db: Session = Depends(get_db, scope="function")):
     ip_address = get_client_ip(request)
-    visitor = track_visitor_by_ip(db, ip_address)
+    visit_count = track_visitor_by_ip(db, ip_address, buffered=False)
     return {
         "message": "Visit tracked",
         "ip_address": ip_address,
-        "visit_count": visitor.visit_count,
+        "visit_count": visit_count,
     }
 
 # Get user by ID
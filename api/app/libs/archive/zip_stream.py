@@ -0,0 +1,59 @@
+# Streams a ZIP archive chunk by chunk without holding the archive in memory
+import os
+import time
+import zipfile
+from typing import Iterable, Iterator
+
+# Formats that are already compressed (PDF streams are deflated, DOCX is itself a ZIP)
+# are stored as-is; recompressing them costs CPU and saves almost nothing.
+STORED_EXTENSIONS = {".pdf", ".docx", ".zip", ".png", ".jpg", ".jpeg"}
+
+
+class _ChunkWriter:
+    # Minimal unseekable file object; zipfile falls back to data descriptors for it.
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self._offset = 0
+
+    def write(self, data: bytes) -> int:
+        if data:
+            self._chunks.append(bytes(data))
+            self._offset += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._offset
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def compression_for(name: str) -> int:
+    extension = os.path.splitext(name)[1].lower()
+    return zipfile.ZIP_STORED if extension in STORED_EXTENSIONS else zipfile.ZIP_DEFLATED
+
+
+# Yields the bytes of a ZIP holding each (archive_name, chunks) entry; chunk iterables are
+# consumed one at a time so only the current chunk is held in memory.
+def stream_zip(entries: Iterable[tuple[str, Iterable[bytes]]]) -> Iterator[bytes]:
+    writer = _ChunkWriter()
+    with zipfile.ZipFile(writer, mode="w", allowZip64=True) as archive:  # type: ignore[arg-type]
+        for archive_name, chunks in entries:
+            info = zipfile.ZipInfo(archive_name, date_time=time.localtime()[:6])
+            info.compress_type = compression_for(archive_name)
+            info.external_attr = 0o644 << 16
+            with archive.open(info, mode="w") as target:
+                for chunk in chunks:
+                    target.write(chunk)
+                    data = writer.drain()
+                    if data:
+                        yield data
+            data = writer.drain()
+            if data:
+                yield data
+    yield writer.drain()
@@ -0,0 +1,219 @@
+# Small in-process LRU caches with TTL, hit-rate metrics and optional cross-worker invalidation
+import asyncio
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+from app.config.config import Config
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+_CACHES: dict[str, "TTLCache"] = {}
+_redis_client: Any = None
+_redis_lock = threading.Lock()
+
+
+# Versions live in Redis when CACHE_REDIS_URL is set: a token per key, replaced by
+# invalidate(key), and an epoch per cache, bumped by invalidate_all(). A worker drops its local
+# copy of a key once either has changed (checked at most every CACHE_EPOCH_CHECK_SECONDS per
+# entry); without Redis, entries simply expire after their TTL.
+def _redis():
+    global _redis_client
+    if not Config.CACHE_REDIS_URL:
+        return None
+    with _redis_lock:
+        if _redis_client is None:
+            try:
+                import redis  # pyright: ignore[reportMissingImports]
+            except ImportError:
+                logger.warning("CACHE_REDIS_URL is set but the redis package is not installed")
+                Config.CACHE_REDIS_URL = None
+                return None
+            _redis_client = redis.Redis.from_url(Config.CACHE_REDIS_URL, socket_timeout=0.5)
+        return _redis_client
+
+
+class TTLCache:
+    # shared=True also keeps string values in Redis (when configured), so a miss in one
+    # worker can be served from another worker's load; invalidations reach every worker.
+    def __init__(self, name: str, maxsize: int, ttl_seconds: float, shared: bool = False):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.shared = shared
+        # key -> (expires_at, value, versions when stored, last version check)
+        self._data: OrderedDict[Hashable, tuple[float, Any, Optional[tuple], float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "shared_hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+        _CACHES[name] = self
+
+    @property
+    def _epoch_key(self) -> str:
+        return f"resumetailor:cache-epoch:{self.name}"
+
+    def _version_key(self, key: Hashable) -> str:
+        return f"resumetailor:cache-version:{self.name}:{key}"
+
+    def _shared_key(self, key: Hashable) -> str:
+        return f"resumetailor:cache:{self.name}:{key}"
+
+    def _shared_client(self):
+        return _redis() if self.shared else None
+
+    # (cache epoch, key token) in one round trip; None without Redis or when it is unreachable.
+    def _versions(self, key: Hashable) -> Optional[tuple]:
+        client = _redis()
+        if client is None:
+            return None
+        try:
+            epoch, version = client.mget(self._epoch_key, self._version_key(key))
+        except Exception:
+            logger.warning("cache version check failed for %s", self.name, exc_info=True)
+            return None
+        return epoch, version
+
+    # Redis is only consulted with the lock released; the entry is updated afterwards only if
+    # nobody replaced it in the meantime.
+    def _local_get(self, key: Hashable, now: float) -> Any:
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is not _MISSING and entry[0] < now:
+                del self._data[key]
+                entry = _MISSING
+            if entry is _MISSING:
+                return _MISSING
+            if entry[2] is None or now - entry[3] < Config.CACHE_EPOCH_CHECK_SECONDS:
+                self._data.move_to_end(key)
+                return entry[1]
+
+        versions = self._versions(key)
+        with self._lock:
+            if self._data.get(key) is not entry:
+                return _MISSING
+            if versions is not None and versions != entry[2]:
+                del self._data[key]
+                self._stats["invalidations"] += 1
+                return _MISSING
+            self._data[key] = (entry[0], entry[1], entry[2], now)
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        value = self._local_get(key, time.monotonic())
+        if value is not _MISSING:
+            with self._lock:
+                self._stats["hits"] += 1
+            return value
+
+        client = self._shared_client()
+        if client is not None:
+            try:
+                value = client.get(self._shared_key(key))
+            except Exception:
+                logger.warning("shared cache read failed for %s", self.name, exc_info=True)
+                value = None
+            if value is not None:
+                value = value.decode() if isinstance(value, bytes) else value
+                self._store(key, value, self._versions(key))
+                with self._lock:
+                    self._stats["shared_hits"] += 1
+                return value
+
+        with self._lock:
+            self._stats["misses"] += 1
+        return default
+
+    # Local lookup only: no Redis round trip and no effect on the hit-rate counters.
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING or entry[0] < time.monotonic():
+                return default
+            return entry[1]
+
+    def _store(self, key: Hashable, value: Any, versions: Optional[tuple]) -> None:
+        if self.maxsize <= 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            self._data[key] = (now + self.ttl_seconds, value, versions, now)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._store(key, value, self._versions(key))
+        client = self._shared_client()
+        if client is not None:
+            try:
+                client.set(self._shared_key(key), value, ex=max(int(self.ttl_seconds), 1))
+            except Exception:
+                logger.warning("shared cache write failed for %s", self.name, exc_info=True)
+
+    # Event-loop variants: with Redis configured, get (version check, shared tier) and set make
+    # blocking round trips, so they run in a worker thread; local-only caches stay inline.
+    async def get_async(self, key: Hashable, default: Any = None) -> Any:
+        if _redis() is None:
+            return self.get(key, default)
+        return await asyncio.to_thread(self.get, key, default)
+
+    async def set_async(self, key: Hashable, value: Any) -> None:
+        if self._shared_client() is None:
+            self.set(key, value)
+            return
+        await asyncio.to_thread(self.set, key, value)
+
+    # Only these keys are dropped, here and (through their tokens) in every other worker. A token
+    # outlives every local entry stored under the previous one, so it can expire with the TTL.
+    def invalidate(self, *keys: Hashable) -> None:
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+        client = _redis()
+        if client is not None and keys:
+            try:
+                pipe = client.pipeline(transaction=False)
+                for key in keys:
+                    pipe.set(self._version_key(key), uuid.uuid4().hex, ex=int(self.ttl_seconds) + 1)
+                if self.shared:
+                    pipe.delete(*(self._shared_key(key) for key in keys))
+                pipe.execute()
+            except Exception:
+                logger.warning("shared cache invalidation failed for %s", self.name, exc_info=True)
+
+    # Drops everything locally and, with Redis configured, in every other worker too.
+    def invalidate_all(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._stats["invalidations"] += 1
+        client = _redis()
+        if client is not None:
+            try:
+                stale = list(client.scan_iter(match=self._shared_key("*"), count=1000)) if self.shared else []
+                if stale:
+                    client.delete(*stale)
+                client.incr(self._epoch_key)
+            except Exception:
+                logger.warning("cache epoch bump failed for %s", self.name, exc_info=True)
+
+    def stats(self) -> dict:
+        with self._lock:
+            hits = self._stats["hits"] + self._stats["shared_hits"]
+            lookups = hits + self._stats["misses"]
+            return {
+                **self._stats,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl_seconds,
+                "hit_rate": round(hits / lookups, 4) if lookups else None,
+                "shared": self.shared,
+                "redis": bool(Config.CACHE_REDIS_URL),
+            }
+
+
+def cache_stats() -> dict:
+    return {name: cache.stats() for name, cache in _CACHES.items()}
@@ -1,5 +1,8 @@
 # Database Base Setup for the API
-from sqlalchemy import create_engine
+from contextvars import ContextVar
+from typing import Optional
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
 from app.config.database import DatabaseConfig
 
@@ -11,20 +14,68 @@ engine = create_engine(
     pool_pre_ping = True
 )
 
-# Session factory
+# Session factory. Objects stay loaded after commit so response models can be built from
+# them without another SELECT per row.
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
+    expire_on_commit=False,
     bind=engine
 )
 
+# Async engine for I/O-bound routes (psycopg 3 async on the same URL). The sync engine
+# stays for migrations, the worker and the render-heavy routes.
+async_engine = create_async_engine(
+    DatabaseConfig.SQLALCHEMY_DATABASE_URI,
+    pool_size = DatabaseConfig.ASYNC_DB_POOL_SIZE,
+    max_overflow = DatabaseConfig.ASYNC_DB_MAX_OVERFLOW,
+    pool_pre_ping = True
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+# Statements (and commits) issued while handling the current request; see
+# DB_STATEMENT_HEADER in main.py.
+statement_counter: ContextVar[Optional[list[int]]] = ContextVar("statement_counter", default=None)
+
+
+@event.listens_for(engine, "before_cursor_execute")
+@event.listens_for(engine, "commit")
+@event.listens_for(async_engine.sync_engine, "before_cursor_execute")
+@event.listens_for(async_engine.sync_engine, "commit")
+def _count_statement(*_args, **_kwargs):
+    counter = statement_counter.get()
+    if counter is not None:
+        counter[0] += 1
+
 # Base class for models
 class Base(DeclarativeBase):
     pass
 
+# One unit of work per request: services only flush, and the request's changes are committed
+# together here (or rolled back if the handler raised). Routes that write should depend on
+# it with scope="function" so the commit happens before the response is sent.
 def get_db():
     db = SessionLocal()
     try:
         yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
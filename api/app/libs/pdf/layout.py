@@ -0,0 +1,110 @@
+# Metric-based text layout for ReportLab canvases
+from functools import lru_cache
+from reportlab.pdfbase import pdfmetrics  # pyright: ignore[reportMissingImports, reportMissingModuleSource]
+
+
+@lru_cache(maxsize=32768)
+def text_width(text: str, font: str, size: float) -> float:
+    return pdfmetrics.stringWidth(text, font, size)
+
+
+def _break_word(word: str, font: str, size: float, max_width: float) -> list[str]:
+    pieces = []
+    current = ""
+    for char in word:
+        if current and text_width(current + char, font, size) > max_width:
+            pieces.append(current)
+            current = char
+        else:
+            current += char
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def wrap_text(text: str, font: str, size: float, max_width: float) -> list[str]:
+    space_width = text_width(" ", font, size)
+    lines: list[str] = []
+    current: list[str] = []
+    current_width = 0.0
+
+    for word in text.split():
+        word_width = text_width(word, font, size)
+        if word_width > max_width:
+            if current:
+                lines.append(" ".join(current))
+            *full, last = _break_word(word, font, size, max_width)
+            lines.extend(full)
+            current = [last]
+            current_width = text_width(last, font, size)
+            continue
+
+        if current and current_width + space_width + word_width > max_width:
+            lines.append(" ".join(current))
+            current = [word]
+            current_width = word_width
+        elif current:
+            current.append(word)
+            current_width += space_width + word_width
+        else:
+            current = [word]
+            current_width = word_width
+
+    if current:
+        lines.append(" ".join(current))
+    return lines
+
+
+class PdfLayout:
+    def __init__(self, canvas_obj, page_width: float, page_height: float, margin: float):
+        self.canvas = canvas_obj
+        self.x = margin
+        self.top = page_height - margin
+        self.bottom = margin
+        self.max_width = page_width - 2 * margin
+        self.y = self.top
+
+    def skip(self, amount: float) -> None:
+        self.y -= amount
+
+    def rule(self, color, line_width: float = 1) -> None:
+        self.canvas.setStrokeColor(color)
+        self.canvas.setLineWidth(line_width)
+        self.canvas.line(self.x, self.y, self.x + self.max_width, self.y)
+
+    # Emits lines top-down with one text object per page instead of a drawString per line.
+    def lines(self, lines: list[str], font: str, size: float, color, leading: float) -> None:
+        index = 0
+        while index < len(lines):
+            if self.y < self.bottom:
+                self.canvas.showPage()
+                self.y = self.top
+            fit = int((self.y - self.bottom) // leading) + 1
+            chunk = lines[index : index + fit]
+
+            text_obj = self.canvas.beginText(self.x, self.y)
+            text_obj.setFont(font, size, leading)
+            text_obj.setFillColor(color)
+            for line in chunk:
+                text_obj.textLine(line)
+            self.canvas.drawText(text_obj)
+
+            self.y -= leading * len(chunk)
+            index += len(chunk)
+
+    def line(self, text: str, font: str, size: float, color, advance: float) -> None:
+        self.lines([text], font, size, color, advance)
+
+    def paragraph(self, text: str, font: str, size: float, color, leading: float) -> None:
+        self.lines(wrap_text(text, font, size, self.max_width), font, size, color, leading)
+
+    def bullet(self, text: str, font: str, size: float, color, leading: float, prefix: str = "- ") -> None:
+        indent = " " * len(prefix)
+        wrapped = wrap_text(text, font, size, self.max_width - text_width(prefix, font, size))
+        self.lines(
+            [f"{prefix if index == 0 else indent}{line}" for index, line in enumerate(wrapped)],
+            font,
+            size,
+            color,
+            leading,
+        )
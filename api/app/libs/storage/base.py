@@ -0,0 +1,41 @@
+# Storage interface for rendered outputs; keys are the relative paths kept in output_files
+from abc import ABC, abstractmethod
+from typing import Iterator, Optional
+
+CHUNK_SIZE = 64 * 1024
+
+
+class StorageBackend(ABC):
+    name = "base"
+
+    # Absolute path when the object can be served straight from this node's disk.
+    def local_path(self, key: str) -> Optional[str]:
+        return None
+
+    @abstractmethod
+    def exists(self, key: str) -> bool:
+        ...
+
+    # Moves a finished local file into storage under `key`; the staging file is consumed.
+    @abstractmethod
+    def save_file(self, staging_path: str, key: str, content_type: Optional[str] = None) -> None:
+        ...
+
+    @abstractmethod
+    def iter_chunks(self, key: str, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+        ...
+
+    # Time-limited URL that lets clients fetch the object without going through the API.
+    def download_url(self, key: str, filename: str, inline: bool = False) -> Optional[str]:
+        return None
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        ...
+
+    # Removes stored data nothing refers to any more; returns how many objects were removed.
+    def collect_garbage(self) -> int:
+        return 0
+
+    def stats(self) -> dict:
+        return {"backend": self.name}
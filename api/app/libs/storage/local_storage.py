@@ -0,0 +1,136 @@
+# Local-disk storage rooted at Config.STORAGE_PATH (the original layout)
+import hashlib
+import os
+import threading
+from typing import Iterator, Optional
+from app.libs.storage.base import CHUNK_SIZE, StorageBackend
+
+BLOB_DIR = "blobs"
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class LocalStorage(StorageBackend):
+    name = "local"
+
+    # With dedup, each distinct file body lives once under blobs/ab/cd/<sha256> and every
+    # key is a hard link to it, so identical renders share one inode. The blob's link count
+    # is its reference count: a blob with st_nlink == 1 is no longer referenced by any key.
+    def __init__(self, root: str, dedup: bool = True):
+        self.root = root
+        self.dedup = dedup
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, key)
+
+    def blob_path(self, sha256: str) -> str:
+        return os.path.join(self.root, BLOB_DIR, sha256[:2], sha256[2:4], sha256)
+
+    def local_path(self, key: str) -> Optional[str]:
+        return self._path(key)
+
+    def exists(self, key: str) -> bool:
+        return os.path.exists(self._path(key))
+
+    def save_file(self, staging_path: str, key: str, content_type: Optional[str] = None) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if self.dedup:
+            try:
+                self._save_deduplicated(staging_path, path)
+                return
+            except OSError:
+                # Filesystems without hard links fall back to plain files.
+                pass
+        if os.path.abspath(staging_path) != os.path.abspath(path):
+            os.replace(staging_path, path)
+
+    def _save_deduplicated(self, staging_path: str, path: str) -> None:
+        blob = self.blob_path(file_sha256(staging_path))
+        os.makedirs(os.path.dirname(blob), exist_ok=True)
+        try:
+            # Atomic create-if-absent: the first writer's file becomes the blob.
+            os.link(staging_path, blob)
+        except FileExistsError:
+            pass
+
+        if os.path.exists(path) and os.path.samefile(blob, path):
+            return
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        os.link(blob, temp_path)
+        os.replace(temp_path, path)
+        if os.path.abspath(staging_path) != os.path.abspath(path):
+            os.remove(staging_path)
+
+    def iter_chunks(self, key: str, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+        with open(self._path(key), "rb") as handle:
+            while True:
+                chunk = handle.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+
+    def delete(self, key: str) -> None:
+        path = self._path(key)
+        blob = None
+        if self.dedup:
+            try:
+                blob = self.blob_path(file_sha256(path))
+            except OSError:
+                blob = None
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        # Drop the per-resume folder once its last file is gone.
+        try:
+            os.rmdir(os.path.dirname(path))
+        except OSError:
+            pass
+        if blob:
+            self._remove_if_unreferenced(blob)
+
+    def _remove_if_unreferenced(self, blob: str) -> bool:
+        try:
+            if os.stat(blob).st_nlink == 1:
+                os.remove(blob)
+                return True
+        except FileNotFoundError:
+            pass
+        return False
+
+    # Removes blobs nothing links to any more (e.g. after render-cache eviction).
+    def collect_garbage(self) -> int:
+        removed = 0
+        for folder, _, files in os.walk(os.path.join(self.root, BLOB_DIR)):
+            for filename in files:
+                if self._remove_if_unreferenced(os.path.join(folder, filename)):
+                    removed += 1
+        return removed
+
+    def stats(self) -> dict:
+        blobs = 0
+        stored_bytes = 0
+        logical_bytes = 0
+        for folder, _, files in os.walk(os.path.join(self.root, BLOB_DIR)):
+            for filename in files:
+                try:
+                    stat_result = os.stat(os.path.join(folder, filename))
+                except FileNotFoundError:
+                    continue
+                blobs += 1
+                stored_bytes += stat_result.st_size
+                logical_bytes += stat_result.st_size * max(stat_result.st_nlink - 1, 0)
+        return {
+            "backend": self.name,
+            "dedup": self.dedup,
+            "blobs": blobs,
+            "blob_bytes": stored_bytes,
+            "linked_bytes": logical_bytes,
+        }
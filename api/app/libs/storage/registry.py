@@ -0,0 +1,31 @@
+# Resolves the configured storage backend once per process
+from functools import lru_cache
+from app.config.config import Config
+from app.libs.storage.base import StorageBackend
+
+
+@lru_cache(maxsize=None)
+def _build_storage(backend: str, root: str, dedup: bool) -> StorageBackend:
+    if backend == "s3":
+        from app.libs.storage.s3_storage import S3Storage
+
+        return S3Storage(
+            bucket=Config.S3_BUCKET,
+            endpoint_url=Config.S3_ENDPOINT_URL,
+            region=Config.S3_REGION,
+            access_key_id=Config.S3_ACCESS_KEY_ID,
+            secret_access_key=Config.S3_SECRET_ACCESS_KEY,
+            prefix=Config.S3_PREFIX,
+            presign_seconds=Config.S3_PRESIGN_SECONDS,
+            multipart_threshold=Config.S3_MULTIPART_THRESHOLD_BYTES,
+        )
+    if backend != "local":
+        raise RuntimeError(f"Unknown STORAGE_BACKEND: {backend}")
+
+    from app.libs.storage.local_storage import LocalStorage
+
+    return LocalStorage(root, dedup=dedup)
+
+
+def get_storage() -> StorageBackend:
+    return _build_storage(Config.STORAGE_BACKEND, Config.STORAGE_PATH, Config.STORAGE_DEDUP)
@@ -0,0 +1,99 @@
+# S3-compatible object storage (AWS S3, MinIO, R2); boto3 is only needed when this backend is used
+import os
+from typing import Iterator, Optional
+from urllib.parse import quote
+from app.libs.storage.base import CHUNK_SIZE, StorageBackend
+
+
+class S3Storage(StorageBackend):
+    name = "s3"
+
+    def __init__(
+        self,
+        bucket: str,
+        endpoint_url: Optional[str] = None,
+        region: Optional[str] = None,
+        access_key_id: Optional[str] = None,
+        secret_access_key: Optional[str] = None,
+        prefix: str = "",
+        presign_seconds: int = 300,
+        multipart_threshold: int = 8 * 1024 * 1024,
+    ):
+        try:
+            import boto3  # pyright: ignore[reportMissingImports]
+            from boto3.s3.transfer import TransferConfig  # pyright: ignore[reportMissingImports]
+            from botocore.config import Config as BotoConfig  # pyright: ignore[reportMissingImports]
+            from botocore.exceptions import ClientError  # pyright: ignore[reportMissingImports]
+        except ImportError as exc:
+            raise RuntimeError("STORAGE_BACKEND=s3 requires boto3 (pip install boto3)") from exc
+
+        if not bucket:
+            raise RuntimeError("STORAGE_BACKEND=s3 requires S3_BUCKET")
+
+        self.bucket = bucket
+        self.prefix = prefix.strip("/")
+        self.presign_seconds = presign_seconds
+        self.client = boto3.client(
+            "s3",
+            endpoint_url=endpoint_url or None,
+            region_name=region or None,
+            aws_access_key_id=access_key_id or None,
+            aws_secret_access_key=secret_access_key or None,
+            # Path-style addressing keeps MinIO and other single-host endpoints working.
+            config=BotoConfig(signature_version="s3v4", s3={"addressing_style": "path"}),
+        )
+        # upload_file streams from disk and switches to multipart above the threshold.
+        self.transfer_config = TransferConfig(
+            multipart_threshold=multipart_threshold,
+            multipart_chunksize=multipart_threshold,
+        )
+        self._client_error = ClientError
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}/{key}" if self.prefix else key
+
+    def exists(self, key: str) -> bool:
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=self._key(key))
+        except self._client_error as exc:
+            if exc.response.get("ResponseMetadata", {}).get("HTTPStatusCode") == 404:
+                return False
+            raise
+        return True
+
+    def save_file(self, staging_path: str, key: str, content_type: Optional[str] = None) -> None:
+        extra_args = {"ContentType": content_type} if content_type else None
+        self.client.upload_file(
+            staging_path,
+            self.bucket,
+            self._key(key),
+            ExtraArgs=extra_args,
+            Config=self.transfer_config,
+        )
+        os.remove(staging_path)
+        try:
+            os.rmdir(os.path.dirname(staging_path))
+        except OSError:
+            pass
+
+    def iter_chunks(self, key: str, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+        body = self.client.get_object(Bucket=self.bucket, Key=self._key(key))["Body"]
+        try:
+            yield from body.iter_chunks(chunk_size)
+        finally:
+            body.close()
+
+    def download_url(self, key: str, filename: str, inline: bool = False) -> Optional[str]:
+        disposition = "inline" if inline else "attachment"
+        return self.client.generate_presigned_url(
+            "get_object",
+            Params={
+                "Bucket": self.bucket,
+                "Key": self._key(key),
+                "ResponseContentDisposition": f"{disposition}; filename*=utf-8''{quote(filename)}",
+            },
+            ExpiresIn=self.presign_seconds,
+        )
+
+    def delete(self, key: str) -> None:
+        self.client.delete_object(Bucket=self.bucket, Key=self._key(key))
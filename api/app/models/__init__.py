@@ -7,6 +7,7 @@ from app.models.job_analysis_model import JobAnalysis
 from app.models.resume_profile_model import ResumeProfile
 from app.models.tailored_resume_model import TailoredResume
 from app.models.visitor_identity_model import VisitorIdentity
+from app.models.tailor_job_model import TailorJob
 
 __all__ = [
 	"User",
@@ -18,4 +19,5 @@ __all__ = [
 	"ResumeProfile",
 	"TailoredResume",
 	"VisitorIdentity",
+	"TailorJob",
 ]
@@ -0,0 +1,23 @@
+from datetime import datetime
+from uuid import uuid4
+from sqlalchemy import Column, DateTime, Index, Integer, JSON, String, Text, UUID, ForeignKey
+from app.libs.db.base import Base
+
+
+class TailorJob(Base):
+    __tablename__ = "tailor_jobs"
+    __table_args__ = (Index("ix_tailor_jobs_status_created_at", "status", "created_at"),)
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4, index=True)
+    user_id = Column(UUID(as_uuid=True), nullable=True, index=True)
+    source_ip = Column(String(64), nullable=True)
+    status = Column(String(20), nullable=False, default="queued")
+    payload = Column(JSON, nullable=False)
+    attempts = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+    progress = Column(JSON, nullable=False, default=list)
+    tailored_resume_id = Column(UUID(as_uuid=True), ForeignKey("tailored_resumes.id", ondelete="SET NULL"), nullable=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    run_after = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
@@ -1,10 +1,11 @@
 from datetime import datetime
 from uuid import uuid4
-from sqlalchemy import Column, DateTime, Text, JSON, String, UUID, ForeignKey
+from sqlalchemy import BigInteger, Column, DateTime, Index, Text, JSON, String, UUID, ForeignKey
 from app.libs.db.base import Base
 
 class TailoredResume(Base):
     __tablename__ = "tailored_resumes"
+    __table_args__ = (Index("ix_tailored_resumes_retention", "outputs_purged_at", "created_at"),)
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4, index=True)
     user_id = Column(UUID(as_uuid=True), nullable=True, index=True)
@@ -13,9 +14,13 @@ class TailoredResume(Base):
     resume_profile_id = Column(UUID(as_uuid=True), ForeignKey("resume_profiles.id"), nullable=False)
     target_role = Column(String(255), nullable=True)
     style = Column(String(40), nullable=True)
+    candidate_name = Column(String(255), nullable=True)
     tailored_summary = Column(Text, nullable=False)
     tailored_bullets = Column(JSON, nullable=False)
     tailored_experience = Column(JSON, nullable=False, default=list)
     tailored_education = Column(JSON, nullable=False, default=list)
+    tailored_skills = Column(JSON, nullable=False, default=list)
     output_files = Column(JSON, nullable=False)
+    output_bytes = Column(BigInteger, nullable=True)
+    outputs_purged_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
@@ -0,0 +1,23 @@
+from typing import Optional
+from uuid import UUID
+from pydantic import BaseModel, HttpUrl
+from app.schemas.tailored_resume_schema import TailorResumeResponse
+
+class TailorBatchJob(BaseModel):
+    job_analysis_id: Optional[UUID] = None
+    job_text: Optional[str] = None
+    job_url: Optional[HttpUrl] = None
+    target_role: Optional[str] = None
+
+class TailorBatchRequest(BaseModel):
+    resume_profile_id: Optional[UUID] = None
+    resume_text: Optional[str] = None
+    file_name: Optional[str] = None
+    user_id: Optional[UUID] = None
+    target_role: Optional[str] = None
+    jobs: list[TailorBatchJob]
+    styles: Optional[list[str]] = None
+
+class TailorBatchResponse(BaseModel):
+    resume_profile_id: UUID
+    items: list[TailorResumeResponse]
@@ -0,0 +1,18 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+from pydantic import BaseModel
+
+class TailorJobResponse(BaseModel):
+    id: UUID
+    status: str
+    attempts: int
+    error: Optional[str]
+    progress: list[dict]
+    tailored_resume_id: Optional[UUID]
+    created_at: datetime
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+
+    class Config:
+        orm_mode = True
@@ -0,0 +1,187 @@
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+from uuid import UUID
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.config.config import Config
+from app.models.tailor_job_model import TailorJob
+from app.schemas.tailored_resume_schema import TailorResumeRequest
+from app.services.tailor_service import ProgressCallback, run_tailor_pipeline
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+
+def _new_tailor_job(payload: TailorResumeRequest, user_id: Optional[UUID], source_ip: Optional[str]) -> TailorJob:
+    return TailorJob(
+        user_id=user_id,
+        source_ip=source_ip,
+        status=JOB_QUEUED,
+        payload=payload.model_dump(mode="json"),
+        attempts=0,
+        progress=[],
+    )
+
+
+def enqueue_tailor_job(
+    db: Session,
+    payload: TailorResumeRequest,
+    user_id: Optional[UUID],
+    source_ip: Optional[str] = None,
+) -> TailorJob:
+    job = _new_tailor_job(payload, user_id, source_ip)
+    db.add(job)
+    db.flush()
+    return job
+
+
+async def enqueue_tailor_job_async(
+    db: AsyncSession,
+    payload: TailorResumeRequest,
+    user_id: Optional[UUID],
+    source_ip: Optional[str] = None,
+) -> TailorJob:
+    job = _new_tailor_job(payload, user_id, source_ip)
+    db.add(job)
+    await db.flush()
+    return job
+
+
+def get_tailor_job(db: Session, job_id: UUID) -> Optional[TailorJob]:
+    return db.query(TailorJob).filter(TailorJob.id == job_id).first()
+
+
+async def get_tailor_job_async(db: AsyncSession, job_id: UUID) -> Optional[TailorJob]:
+    return await db.scalar(select(TailorJob).where(TailorJob.id == job_id))
+
+
+# Claims the oldest runnable job. SKIP LOCKED lets many workers poll the same table without
+# blocking on (or double-claiming) rows another worker already holds. Running jobs whose
+# worker died are picked up again once they go stale, unless they have used up their
+# attempts (a job that keeps crashing the worker would otherwise be reclaimed forever).
+def claim_next_tailor_job(db: Session) -> Optional[TailorJob]:
+    now = datetime.utcnow()
+    stale_before = now - timedelta(seconds=Config.JOB_STALE_SECONDS)
+    stale = and_(TailorJob.status == JOB_RUNNING, TailorJob.started_at < stale_before)
+    exhausted = (
+        db.query(TailorJob)
+        .filter(stale, TailorJob.attempts >= Config.JOB_MAX_ATTEMPTS)
+        .update(
+            {
+                TailorJob.status: JOB_FAILED,
+                TailorJob.error: "worker stopped before the job finished",
+                TailorJob.finished_at: now,
+            },
+            synchronize_session=False,
+        )
+    )
+    if exhausted:
+        logger.warning("failed %s stale tailor job(s) that ran out of attempts", exhausted)
+        db.commit()
+
+    job = (
+        db.query(TailorJob)
+        .filter(
+            or_(
+                and_(
+                    TailorJob.status == JOB_QUEUED,
+                    or_(TailorJob.run_after.is_(None), TailorJob.run_after <= now),
+                ),
+                stale,
+            )
+        )
+        .order_by(TailorJob.created_at)
+        .with_for_update(skip_locked=True)
+        .first()
+    )
+    if not job:
+        db.rollback()
+        return None
+
+    job.status = JOB_RUNNING
+    job.started_at = now
+    job.run_after = None
+    job.attempts = (job.attempts or 0) + 1
+    db.commit()
+    return job
+
+
+# Exponential backoff between retries: JOB_RETRY_BACKOFF_SECONDS, then twice that, ...
+def _retry_delay(attempts: int) -> timedelta:
+    return timedelta(seconds=Config.JOB_RETRY_BACKOFF_SECONDS * 2 ** max(attempts - 1, 0))
+
+
+# Stage events are written through their own short session so progress is visible to
+# /tailor/jobs/{id}/events while the pipeline's own transaction is still open. A retry appends
+# to the events of earlier attempts; every event carries its attempt and a sequence number
+# that keeps increasing across attempts, which is what event streams resume from.
+def _progress_recorder(db: Session, job: TailorJob) -> ProgressCallback:
+    job_id = job.id
+    attempt = job.attempts
+    events: list[dict] = list(job.progress or [])
+
+    def record(stage: str, details: dict) -> None:
+        events.append(
+            {
+                "seq": event_seq(events[-1], len(events) - 1) + 1 if events else 1,
+                "attempt": attempt,
+                "stage": stage,
+                **details,
+                "at": datetime.utcnow().isoformat(),
+            }
+        )
+        logger.info("tailor job %s stage %s %s", job_id, stage, details)
+        with Session(bind=db.get_bind()) as progress_db:
+            progress_db.query(TailorJob).filter(TailorJob.id == job_id).update(
+                {TailorJob.progress: list(events)}, synchronize_session=False
+            )
+            progress_db.commit()
+
+    return record
+
+
+# Events stored before sequence numbers existed are numbered by position.
+def event_seq(event: dict, index: int) -> int:
+    return int(event.get("seq") or index + 1)
+
+
+def progress_events_after(progress: list[dict], last_seq: int) -> list[dict]:
+    return [
+        {**event, "seq": event_seq(event, index)}
+        for index, event in enumerate(progress)
+        if event_seq(event, index) > last_seq
+    ]
+
+
+def run_tailor_job(db: Session, job: TailorJob) -> TailorJob:
+    try:
+        tailored = run_tailor_pipeline(
+            db,
+            TailorResumeRequest(**job.payload),
+            job.user_id,
+            job.source_ip,
+            on_progress=_progress_recorder(db, job),
+        )
+    except Exception as exc:
+        db.rollback()
+        retryable = not isinstance(exc, ValueError) and job.attempts < Config.JOB_MAX_ATTEMPTS
+        logger.warning("tailor job %s failed (attempt %s)", job.id, job.attempts, exc_info=True)
+        job.status = JOB_QUEUED if retryable else JOB_FAILED
+        job.error = str(exc) or exc.__class__.__name__
+        job.finished_at = None if retryable else datetime.utcnow()
+        job.run_after = datetime.utcnow() + _retry_delay(job.attempts) if retryable else None
+        db.commit()
+        return job
+
+    job.status = JOB_SUCCEEDED
+    job.error = None
+    job.tailored_resume_id = tailored.id
+    job.finished_at = datetime.utcnow()
+    db.commit()
+    return job
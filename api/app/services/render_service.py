@@ -0,0 +1,706 @@
+import hashlib
+import html
+import io
+import json
+import logging
+import multiprocessing
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import CancelledError, ProcessPoolExecutor, TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from typing import Optional
+from docx import Document  # pyright: ignore[reportMissingImports]
+from docx.enum.style import WD_STYLE_TYPE  # pyright: ignore[reportMissingImports]
+from docx.oxml.ns import qn  # pyright: ignore[reportMissingImports]
+from docx.shared import Pt, Inches, RGBColor  # pyright: ignore[reportMissingImports]
+from reportlab.lib import colors  # pyright: ignore[reportMissingImports, reportMissingModuleSource]
+from reportlab.lib.pagesizes import letter  # pyright: ignore[reportMissingImports, reportMissingModuleSource]
+from reportlab.pdfbase import pdfmetrics  # pyright: ignore[reportMissingImports, reportMissingModuleSource]
+from reportlab.pdfbase.ttfonts import TTFont  # pyright: ignore[reportMissingImports, reportMissingModuleSource]
+from reportlab.pdfgen import canvas  # pyright: ignore[reportMissingImports, reportMissingModuleSource]
+from app.config.config import Config
+from app.libs.pdf.layout import PdfLayout
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever renderer output changes so the render cache stops serving stale files.
+RENDERER_VERSION = "5"
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+_cache_lock = threading.Lock()
+_cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
+_cache_bytes: Optional[int] = None
+
+
+RENDER_STYLES = ("Modern", "Slim", "Fancy")
+
+
+class RenderTimeoutError(RuntimeError):
+    pass
+
+
+# Unknown styles fall back to Modern, so anything keyed on a style goes through this first.
+def _style_name(style: Optional[str]) -> str:
+    name = (style or "Modern").lower()
+    return name if name in ("slim", "fancy") else "modern"
+
+
+def _style_profile(style: Optional[str]) -> dict:
+    name = _style_name(style)
+    if name == "slim":
+        return {
+            "title_size": 16,
+            "subtitle_size": 11,
+            "body_size": 10,
+            "accent": RGBColor(140, 96, 64),
+            "spacing_after": 4,
+            "line_spacing": 1.0,
+            "pdf_margin": 60,
+            "pdf_leading": 14,
+            "pdf_accent": colors.HexColor("#8C6040"),
+            "pdf_font_family": "IBMPlexSans",
+        }
+    if name == "fancy":
+        return {
+            "title_size": 20,
+            "subtitle_size": 12,
+            "body_size": 11,
+            "accent": RGBColor(201, 95, 60),
+            "spacing_after": 8,
+            "line_spacing": 1.15,
+            "pdf_margin": 64,
+            "pdf_leading": 15,
+            "pdf_accent": colors.HexColor("#C95F3C"),
+            "pdf_font_family": "Lora",
+        }
+    return {
+        "title_size": 18,
+        "subtitle_size": 12,
+        "body_size": 11,
+        "accent": RGBColor(201, 95, 60),
+        "spacing_after": 6,
+        "line_spacing": 1.1,
+        "pdf_margin": 64,
+        "pdf_leading": 15,
+        "pdf_accent": colors.HexColor("#C95F3C"),
+        "pdf_font_family": "Inter",
+    }
+
+
+DOCX_MUTED = RGBColor(120, 120, 120)
+
+DOCX_STYLE_IDS = {
+    "RT Title": "RTTitle",
+    "RT Subtitle": "RTSubtitle",
+    "RT Summary": "RTSummary",
+    "RT Heading": "RTHeading",
+    "RT Bullet": "RTBullet",
+    "RT Entry": "RTEntry",
+    "RT Meta": "RTMeta",
+    "RT Spacer": "RTSpacer",
+}
+
+DOCX_KEEP_STYLE_IDS = {
+    "Normal",
+    "DefaultParagraphFont",
+    "TableNormal",
+    "NoList",
+    "ListBullet",
+    *DOCX_STYLE_IDS.values(),
+}
+
+
+def _add_paragraph_style(document, name: str, base: str = "Normal"):
+    style = document.styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
+    style.base_style = document.styles[base]
+    style.quick_style = True
+    return style
+
+
+# Builds the per-style template once: every font, size, color and spacing lives in named
+# styles, so rendering only appends paragraphs that reference them.
+@lru_cache(maxsize=None)
+def _docx_template(style_name: str) -> bytes:
+    document = Document()
+    profile = _style_profile(style_name)
+
+    base_style = document.styles["Normal"]
+    base_style.font.name = "Calibri"
+    base_style.font.size = Pt(profile["body_size"])
+    base_style.paragraph_format.space_after = Pt(profile["spacing_after"])
+    base_style.paragraph_format.line_spacing = profile["line_spacing"]
+
+    title = _add_paragraph_style(document, "RT Title")
+    title.font.size = Pt(profile["title_size"])
+    title.font.bold = True
+    title.font.color.rgb = RGBColor(45, 45, 45)
+
+    subtitle = _add_paragraph_style(document, "RT Subtitle")
+    subtitle.font.size = Pt(profile["subtitle_size"])
+    subtitle.font.color.rgb = DOCX_MUTED
+    subtitle.paragraph_format.space_after = Pt(10)
+
+    summary = _add_paragraph_style(document, "RT Summary")
+    summary.paragraph_format.space_after = Pt(12)
+
+    heading = _add_paragraph_style(document, "RT Heading")
+    heading.font.bold = True
+    heading.font.size = Pt(profile["subtitle_size"])
+    heading.font.color.rgb = profile["accent"]
+    heading.paragraph_format.space_after = Pt(6)
+
+    bullet = _add_paragraph_style(document, "RT Bullet", base="List Bullet")
+    bullet.paragraph_format.left_indent = Inches(0.15)
+    bullet.paragraph_format.space_after = Pt(4)
+
+    entry = _add_paragraph_style(document, "RT Entry")
+    entry.font.bold = True
+    entry.font.size = Pt(11)
+    entry.paragraph_format.space_after = Pt(4)
+
+    meta = document.styles.add_style("RT Meta", WD_STYLE_TYPE.CHARACTER)
+    meta.font.bold = False
+    meta.font.color.rgb = DOCX_MUTED
+
+    spacer = _add_paragraph_style(document, "RT Spacer")
+    spacer.paragraph_format.space_after = Pt(15)
+
+    # Drop the ~160 unused built-in styles and latent style table the default template
+    # ships with; they are most of styles.xml and would otherwise be copied into every file.
+    styles_element = document.styles.element
+    for latent in styles_element.findall(qn("w:latentStyles")):
+        styles_element.remove(latent)
+    for style_element in styles_element.findall(qn("w:style")):
+        if style_element.get(qn("w:styleId")) not in DOCX_KEEP_STYLE_IDS:
+            styles_element.remove(style_element)
+    # stylesWithEffects is a Word 2010 copy of the full style table; Word rebuilds it on save.
+    for rel_id, rel in list(document.part.rels.items()):
+        if rel.reltype.endswith("/stylesWithEffects"):
+            document.part.drop_rel(rel_id)
+
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def _join_dates(start: Optional[str], end: Optional[str]) -> str:
+    return " - ".join([part for part in [start, end] if part])
+
+
+def _add_meta_run(paragraph, text: str) -> None:
+    run = paragraph.add_r()
+    run.style = DOCX_STYLE_IDS["RT Meta"]
+    run.text = text
+
+
+def render_docx(
+    path: str,
+    name: str,
+    role: str,
+    summary: str,
+    skills: list[str],
+    bullets: list[str],
+    experiences: list[dict],
+    education: list[dict],
+    style: Optional[str],
+) -> None:
+    document = Document(io.BytesIO(_docx_template(_style_name(style))))
+    body = document.element.body
+
+    # Style ids are set on the XML directly; python-docx resolves style names by scanning
+    # every style in the document on each call, which dominated render time.
+    def add_paragraph(text: str, style: str):
+        paragraph = body.add_p()
+        paragraph.style = DOCX_STYLE_IDS[style]
+        if text:
+            paragraph.add_r().text = text
+        return paragraph
+
+    add_paragraph(name, style="RT Title")
+    add_paragraph(role, style="RT Subtitle")
+    add_paragraph(summary, style="RT Summary")
+
+    add_paragraph("Highlights", style="RT Heading")
+    for bullet in bullets:
+        add_paragraph(bullet, style="RT Bullet")
+
+    if experiences:
+        add_paragraph("Experience", style="RT Heading")
+        for experience in experiences:
+            header = " - ".join(
+                [part for part in [experience.get("title", ""), experience.get("company", "")] if part]
+            )
+            if header:
+                header_line = add_paragraph(header, style="RT Entry")
+                dates = _join_dates(experience.get("start_date"), experience.get("end_date"))
+                meta = " · ".join([part for part in [experience.get("location") or "", dates] if part])
+                if meta:
+                    _add_meta_run(header_line, f"  {meta}")
+            for bullet in experience.get("bullets", []):
+                add_paragraph(bullet, style="RT Bullet")
+            add_paragraph("", style="RT Spacer")
+
+    if education:
+        add_paragraph("Education", style="RT Heading")
+        for edu in education:
+            header = " - ".join(
+                [
+                    part
+                    for part in [edu.get("institution", ""), edu.get("degree", ""), edu.get("field_of_study", "")]
+                    if part
+                ]
+            )
+            if header:
+                header_line = add_paragraph(header, style="RT Entry")
+                dates = _join_dates(edu.get("start_date"), edu.get("end_date"))
+                if dates:
+                    _add_meta_run(header_line, f"  {dates}")
+            for bullet in edu.get("bullets", []):
+                add_paragraph(bullet, style="RT Bullet")
+            add_paragraph("", style="RT Spacer")
+
+    if skills:
+        add_paragraph("Skills", style="RT Heading")
+        add_paragraph(", ".join([skill for skill in skills if skill]), style="RT Spacer")
+    document.save(path)
+
+
+PDF_INK = colors.HexColor("#1D1A15")
+PDF_MUTED = colors.HexColor("#6A5F55")
+
+
+# Registers {family}-Regular.ttf / {family}-Bold.ttf from PDF_FONT_DIR when present. ReportLab
+# embeds TrueType fonts as subsets holding only the glyphs a document uses.
+@lru_cache(maxsize=None)
+def _pdf_fonts(family: str) -> tuple[str, str]:
+    font_dir = Config.PDF_FONT_DIR
+    if font_dir:
+        regular = os.path.join(font_dir, f"{family}-Regular.ttf")
+        bold = os.path.join(font_dir, f"{family}-Bold.ttf")
+        if os.path.exists(regular) and os.path.exists(bold):
+            pdfmetrics.registerFont(TTFont(family, regular))
+            pdfmetrics.registerFont(TTFont(f"{family}-Bold", bold))
+            return family, f"{family}-Bold"
+    return "Helvetica", "Helvetica-Bold"
+
+
+def render_pdf(
+    path: str,
+    name: str,
+    role: str,
+    summary: str,
+    skills: list[str],
+    bullets: list[str],
+    experiences: list[dict],
+    education: list[dict],
+    style: Optional[str],
+) -> None:
+    # Fonts are written once and referenced from every page's resources. invariant drops the
+    # creation timestamp and random document id so identical inputs produce identical bytes.
+    canvas_obj = canvas.Canvas(
+        path,
+        pagesize=letter,
+        pageCompression=1 if Config.PDF_PAGE_COMPRESSION else 0,
+        invariant=1,
+    )
+    width, height = letter
+    profile = _style_profile(style)
+    layout = PdfLayout(canvas_obj, width, height, profile["pdf_margin"])
+    accent = profile["pdf_accent"]
+    leading = profile["pdf_leading"]
+    body_size = profile["body_size"]
+    meta_size = max(body_size - 1, 9)
+    regular, bold = _pdf_fonts(profile["pdf_font_family"])
+
+    layout.line(name, bold, profile["title_size"] + 2, PDF_INK, 18)
+    layout.line(role, regular, profile["subtitle_size"], PDF_MUTED, 18)
+    layout.rule(accent)
+    layout.skip(18)
+
+    layout.paragraph(summary, regular, body_size, PDF_INK, leading)
+
+    layout.skip(10)
+    layout.line("Highlights", bold, profile["subtitle_size"], accent, 16)
+    for bullet in bullets:
+        layout.bullet(bullet, regular, body_size, PDF_INK, leading)
+
+    if experiences:
+        layout.skip(8)
+        layout.line("Experience", bold, profile["subtitle_size"], accent, 16)
+        for experience in experiences:
+            header = " - ".join(
+                [part for part in [experience.get("title", ""), experience.get("company", "")] if part]
+            )
+            if header:
+                layout.line(header, bold, body_size, PDF_INK, 14)
+                dates = _join_dates(experience.get("start_date"), experience.get("end_date"))
+                meta = " · ".join([part for part in [experience.get("location"), dates] if part])
+                if meta:
+                    layout.line(meta, regular, meta_size, PDF_MUTED, 12)
+            for bullet in experience.get("bullets", []):
+                layout.bullet(bullet, regular, body_size, PDF_INK, leading)
+            layout.skip(15)
+
+    if education:
+        layout.skip(8)
+        layout.line("Education", bold, profile["subtitle_size"], accent, 16)
+        for edu in education:
+            header = " - ".join(
+                [
+                    part
+                    for part in [edu.get("institution", ""), edu.get("degree", ""), edu.get("field_of_study", "")]
+                    if part
+                ]
+            )
+            if header:
+                layout.line(header, bold, body_size, PDF_INK, 14)
+                dates = _join_dates(edu.get("start_date"), edu.get("end_date"))
+                if dates:
+                    layout.line(dates, regular, meta_size, PDF_MUTED, 12)
+            for bullet in edu.get("bullets", []):
+                layout.bullet(bullet, regular, body_size, PDF_INK, leading)
+            layout.skip(15)
+
+    if skills:
+        layout.skip(8)
+        layout.line("Skills", bold, profile["subtitle_size"], accent, 16)
+        layout.paragraph(", ".join([skill for skill in skills if skill]), regular, body_size, PDF_INK, leading)
+
+    canvas_obj.save()
+
+
+HTML_FONT_STACKS = {
+    "Inter": "Inter, 'Helvetica Neue', Arial, sans-serif",
+    "IBMPlexSans": "'IBM Plex Sans', 'Helvetica Neue', Arial, sans-serif",
+    "Lora": "Lora, Georgia, serif",
+}
+# Same ink and muted tones as PDF_INK / PDF_MUTED.
+HTML_INK = "#1D1A15"
+HTML_MUTED = "#6A5F55"
+
+
+# In-memory HTML rendition of the PDF layout for live previews; never touches disk.
+def render_html(
+    name: str,
+    role: str,
+    summary: str,
+    skills: list[str],
+    bullets: list[str],
+    experiences: list[dict],
+    education: list[dict],
+    style: Optional[str],
+) -> str:
+    profile = _style_profile(style)
+    accent = f"#{profile['accent']}"
+    parts = [
+        "<!doctype html><html><head><meta charset=\"utf-8\"><style>",
+        # pdf_margin is in points, like the body and heading sizes.
+        f"body{{margin:0;padding:{profile['pdf_margin']}pt;color:{HTML_INK};"
+        f"font-family:{HTML_FONT_STACKS[profile['pdf_font_family']]};"
+        f"font-size:{profile['body_size']}pt;line-height:{profile['line_spacing']}}}",
+        f"h1{{font-size:{profile['title_size']}pt;margin:0 0 4px}}",
+        f".role{{color:{HTML_MUTED};font-size:{profile['subtitle_size']}pt;margin:0 0 10px}}",
+        f"hr{{border:0;border-top:1px solid {accent};margin:10px 0}}",
+        f"h2{{font-size:{profile['subtitle_size']}pt;margin:14px 0 {profile['spacing_after']}px}}",
+        f"p,li{{margin:0 0 {profile['spacing_after']}px}}",
+        "ul{margin:0 0 8px;padding-left:18px}",
+        f".entry{{font-weight:600;margin-bottom:2px}}.meta{{color:{HTML_MUTED};font-weight:400}}",
+        "</style></head><body>",
+        f"<h1>{html.escape(name)}</h1>",
+        f"<p class=\"role\">{html.escape(role)}</p><hr>",
+        f"<p>{html.escape(summary)}</p>",
+    ]
+
+    def add_bullets(items: list[str]) -> None:
+        if items:
+            parts.append("<ul>" + "".join(f"<li>{html.escape(item)}</li>" for item in items) + "</ul>")
+
+    def add_entry(header: str, meta: str) -> None:
+        if header:
+            meta_html = f" <span class=\"meta\">{html.escape(meta)}</span>" if meta else ""
+            parts.append(f"<p class=\"entry\">{html.escape(header)}{meta_html}</p>")
+
+    parts.append("<h2>Highlights</h2>")
+    add_bullets(bullets)
+
+    if experiences:
+        parts.append("<h2>Experience</h2>")
+        for experience in experiences:
+            header = " - ".join(
+                [part for part in [experience.get("title", ""), experience.get("company", "")] if part]
+            )
+            dates = _join_dates(experience.get("start_date"), experience.get("end_date"))
+            add_entry(header, " · ".join([part for part in [experience.get("location") or "", dates] if part]))
+            add_bullets(experience.get("bullets", []))
+
+    if education:
+        parts.append("<h2>Education</h2>")
+        for edu in education:
+            header = " - ".join(
+                [
+                    part
+                    for part in [edu.get("institution", ""), edu.get("degree", ""), edu.get("field_of_study", "")]
+                    if part
+                ]
+            )
+            add_entry(header, _join_dates(edu.get("start_date"), edu.get("end_date")))
+            add_bullets(edu.get("bullets", []))
+
+    if skills:
+        parts.append("<h2>Skills</h2>")
+        parts.append(f"<p>{html.escape(', '.join([skill for skill in skills if skill]))}</p>")
+
+    parts.append("</body></html>")
+    return "".join(parts)
+
+
+RENDERERS = {
+    "pdf": render_pdf,
+    "docx": render_docx,
+}
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            # Spawned workers only import this module, so they stay free of DB/engine state.
+            _executor = ProcessPoolExecutor(
+                max_workers=Config.RENDER_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _executor
+
+
+# Drops the given pool (the current one by default) so the next render starts a fresh one.
+# With terminate=True its worker processes are killed first: a running render ignores
+# Future.cancel(), so a hung render would otherwise keep its pool slot forever. Queued
+# futures are left alone; other requests' renders fail with BrokenProcessPool and retry.
+def _reset_executor(executor: Optional[ProcessPoolExecutor] = None, terminate: bool = False) -> None:
+    global _executor
+    with _executor_lock:
+        executor = executor or _executor
+        if executor is None:
+            return
+        if terminate:
+            for process in list((getattr(executor, "_processes", None) or {}).values()):
+                process.terminate()
+        executor.shutdown(wait=False)
+        if _executor is executor:
+            _executor = None
+
+
+def shutdown_render_pool() -> None:
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
+
+
+def _timed_render(fmt: str, path: str, content: dict) -> float:
+    started = time.perf_counter()
+    # Write-then-rename so a concurrent reader never sees a half-written file.
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        RENDERERS[fmt](temp_path, **content)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return time.perf_counter() - started
+
+
+def format_for_filename(filename: str) -> Optional[str]:
+    extension = os.path.splitext(filename)[1].lower().lstrip(".")
+    return extension if extension in RENDERERS else None
+
+
+def render_cache_key(fmt: str, content: dict) -> str:
+    payload = json.dumps(
+        {
+            "fmt": fmt,
+            "version": RENDERER_VERSION,
+            "options": [Config.PDF_PAGE_COMPRESSION, Config.PDF_FONT_DIR],
+            "content": content,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _render_cache_dir() -> str:
+    return os.path.join(Config.STORAGE_PATH, "render_cache")
+
+
+def _render_cache_path(fmt: str, key: str) -> str:
+    return os.path.join(_render_cache_dir(), key[:2], f"{key}.{fmt}")
+
+
+def _link_or_copy(source: str, destination: str) -> None:
+    # Hard links let a cache entry and every tailored copy share one inode.
+    temp_path = f"{destination}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.link(source, temp_path)
+    except OSError:
+        shutil.copyfile(source, temp_path)
+    os.replace(temp_path, destination)
+
+
+def _iter_cache_entries() -> list[tuple[float, int, str]]:
+    entries = []
+    for root, _, files in os.walk(_render_cache_dir()):
+        for filename in files:
+            path = os.path.join(root, filename)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_atime, stat.st_size, path))
+    return entries
+
+
+def _cache_fetch(fmt: str, key: str, destination: str) -> bool:
+    cache_path = _render_cache_path(fmt, key)
+    try:
+        _link_or_copy(cache_path, destination)
+        # Recency lives in the access time: entries share an inode with served outputs, so
+        # touching mtime would change their Last-Modified.
+        stat = os.stat(cache_path)
+        os.utime(cache_path, (time.time(), stat.st_mtime))
+    except FileNotFoundError:
+        with _cache_lock:
+            _cache_stats["misses"] += 1
+        return False
+    with _cache_lock:
+        _cache_stats["hits"] += 1
+    return True
+
+
+def _cache_store(fmt: str, key: str, source: str) -> None:
+    global _cache_bytes
+    cache_path = _render_cache_path(fmt, key)
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    try:
+        replaced_size = os.path.getsize(cache_path)
+    except FileNotFoundError:
+        replaced_size = 0
+    _link_or_copy(source, cache_path)
+
+    with _cache_lock:
+        if _cache_bytes is None:
+            _cache_bytes = sum(size for _, size, _ in _iter_cache_entries())
+        else:
+            # Re-storing a key replaces its entry, so only the size difference is new.
+            _cache_bytes += os.path.getsize(cache_path) - replaced_size
+        if _cache_bytes > Config.RENDER_CACHE_MAX_BYTES:
+            _evict_cache_locked()
+
+
+def _evict_cache_locked() -> None:
+    global _cache_bytes
+    entries = sorted(_iter_cache_entries())
+    total = sum(size for _, size, _ in entries)
+    # Evict least recently used entries down to 90% of the budget to avoid thrashing.
+    target = int(Config.RENDER_CACHE_MAX_BYTES * 0.9)
+    for _, size, path in entries:
+        if total <= target:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+        _cache_stats["evictions"] += 1
+    _cache_bytes = total
+
+
+def render_cache_stats() -> dict:
+    with _cache_lock:
+        lookups = _cache_stats["hits"] + _cache_stats["misses"]
+        return {
+            **_cache_stats,
+            "hit_rate": round(_cache_stats["hits"] / lookups, 4) if lookups else 0.0,
+            "bytes": _cache_bytes,
+            "max_bytes": Config.RENDER_CACHE_MAX_BYTES,
+        }
+
+
+def _render_targets(targets: dict[str, str], content: dict) -> dict[str, float]:
+    if Config.RENDER_WORKERS <= 0:
+        return {fmt: _timed_render(fmt, path, content) for fmt, path in targets.items()}
+    try:
+        return _render_in_pool(targets, content)
+    except (BrokenProcessPool, CancelledError):
+        # The pool died under us (a crashed worker, or recycled after another request's
+        # render hung): retry once on a fresh pool.
+        return _render_in_pool(targets, content)
+
+
+def _render_in_pool(targets: dict[str, str], content: dict) -> dict[str, float]:
+    executor = _get_executor()
+    futures = {}
+    timings = {}
+    try:
+        # Another request may have broken or recycled this pool since we fetched it.
+        for fmt, path in targets.items():
+            try:
+                futures[fmt] = executor.submit(_timed_render, fmt, path, content)
+            except RuntimeError as exc:
+                raise BrokenProcessPool("render pool was recycled") from exc
+        deadline = time.monotonic() + Config.RENDER_TIMEOUT_SECONDS
+        for fmt, future in futures.items():
+            remaining = max(deadline - time.monotonic(), 0.0)
+            try:
+                timings[fmt] = future.result(timeout=remaining)
+            except FuturesTimeoutError as exc:
+                # Other requests' renders in this pool fail with BrokenProcessPool and retry.
+                _reset_executor(executor, terminate=True)
+                raise RenderTimeoutError(
+                    f"{fmt} render exceeded {Config.RENDER_TIMEOUT_SECONDS:.0f}s"
+                ) from exc
+    except BrokenProcessPool:
+        _reset_executor(executor)
+        raise
+    finally:
+        for future in futures.values():
+            future.cancel()
+    return timings
+
+
+# Renders each {fmt: path} target and returns per-format render seconds. Identical inputs
+# are served from the content-hash render cache; remaining formats render in parallel.
+def render_outputs(targets: dict[str, str], content: dict) -> dict[str, float]:
+    started = time.perf_counter()
+    cache_enabled = Config.RENDER_CACHE_MAX_BYTES > 0
+    keys = {fmt: render_cache_key(fmt, content) for fmt in targets} if cache_enabled else {}
+
+    pending = {
+        fmt: path
+        for fmt, path in targets.items()
+        if not (cache_enabled and _cache_fetch(fmt, keys[fmt], path))
+    }
+    timings = _render_targets(pending, content) if pending else {}
+
+    if cache_enabled:
+        for fmt, path in pending.items():
+            try:
+                _cache_store(fmt, keys[fmt], path)
+            except OSError:
+                logger.warning("could not cache %s render at %s", fmt, path, exc_info=True)
+
+    logger.info(
+        "rendered %s in %.1fms (%s)",
+        ",".join(targets),
+        (time.perf_counter() - started) * 1000,
+        " ".join(
+            f"{fmt}={timings[fmt] * 1000:.1f}ms" if fmt in timings else f"{fmt}=cached"
+            for fmt in targets
+        ),
+    )
+    return timings
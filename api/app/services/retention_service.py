@@ -0,0 +1,126 @@
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Optional, cast
+from uuid import UUID
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from app.config.config import Config
+from app.libs.storage.registry import get_storage
+from app.models.tailored_resume_model import TailoredResume
+from app.services.tailor_service import invalidate_tailored_output_paths
+
+logger = logging.getLogger(__name__)
+
+
+def _expired_outputs(
+    db: Session, anonymous: bool, cutoff: datetime, limit: int, skip: set[UUID]
+) -> list[TailoredResume]:
+    owner = TailoredResume.user_id.is_(None) if anonymous else TailoredResume.user_id.isnot(None)
+    query = db.query(TailoredResume).filter(
+        TailoredResume.outputs_purged_at.is_(None),
+        TailoredResume.created_at < cutoff,
+        owner,
+    )
+    if skip:
+        query = query.filter(TailoredResume.id.notin_(skip))
+    return (
+        query
+        .order_by(TailoredResume.created_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+
+
+# Deletes stored files for tailored resumes older than the retention window, one batch per
+# commit. Rows are kept (history, analysis links) but flagged and their output_files cleared.
+# Keys that fail to delete stay in output_files and the row stays unflagged, so the next
+# sweep retries them.
+def sweep_expired_outputs(db: Session, now: Optional[datetime] = None, max_batches: int = 50) -> dict:
+    now = now or datetime.utcnow()
+    storage = get_storage()
+    purged = {"rows": 0, "files": 0, "bytes": 0, "failed_files": 0}
+    retry_later: set[UUID] = set()
+
+    for anonymous, days in ((True, Config.RETENTION_DAYS_ANONYMOUS), (False, Config.RETENTION_DAYS_USER)):
+        if days <= 0:
+            continue
+        cutoff = now - timedelta(days=days)
+        for _ in range(max_batches):
+            rows = _expired_outputs(db, anonymous, cutoff, Config.RETENTION_BATCH_SIZE, retry_later)
+            if not rows:
+                break
+            for row in rows:
+                failed = []
+                for key in cast(list[str], row.output_files or []):
+                    try:
+                        storage.delete(key)
+                    except Exception:
+                        logger.warning("could not delete %s", key, exc_info=True)
+                        failed.append(key)
+                        continue
+                    purged["files"] += 1
+                row_any = cast(Any, row)
+                if failed:
+                    # Sizes are not tracked per file, so output_bytes is left as is until the
+                    # remaining keys are gone.
+                    row_any.output_files = failed
+                    purged["failed_files"] += len(failed)
+                    retry_later.add(cast(UUID, row.id))
+                    continue
+                purged["bytes"] += cast(int, row.output_bytes or 0)
+                purged["rows"] += 1
+                row_any.output_files = []
+                row_any.output_bytes = 0
+                row_any.outputs_purged_at = now
+            db.commit()
+            if len(rows) < Config.RETENTION_BATCH_SIZE:
+                break
+
+    if purged["files"]:
+        # Cached download paths for purged rows would otherwise outlive their files.
+        invalidate_tailored_output_paths()
+    purged["garbage"] = storage.collect_garbage()
+    if purged["rows"] or purged["failed_files"]:
+        logger.info(
+            "retention purged %(rows)s resumes, %(files)s files, %(bytes)s bytes; %(failed_files)s files failed",
+            purged,
+        )
+    return purged
+
+
+# Bytes held by tailored outputs that are still stored, globally, for anonymous visitors and
+# for the heaviest users.
+def storage_usage(db: Session, top_users: int = 10) -> dict:
+    live = TailoredResume.outputs_purged_at.is_(None)
+    total_bytes, total_resumes = db.query(
+        func.coalesce(func.sum(TailoredResume.output_bytes), 0), func.count(TailoredResume.id)
+    ).filter(live).one()
+    anonymous_bytes = (
+        db.query(func.coalesce(func.sum(TailoredResume.output_bytes), 0))
+        .filter(live, TailoredResume.user_id.is_(None))
+        .scalar()
+    )
+    per_user = (
+        db.query(TailoredResume.user_id, func.sum(TailoredResume.output_bytes).label("bytes"))
+        .filter(live, TailoredResume.user_id.isnot(None))
+        .group_by(TailoredResume.user_id)
+        .order_by(func.sum(TailoredResume.output_bytes).desc())
+        .limit(top_users)
+        .all()
+    )
+    return {
+        "total_bytes": int(total_bytes),
+        "stored_resumes": int(total_resumes),
+        "anonymous_bytes": int(anonymous_bytes or 0),
+        "top_users": [{"user_id": str(user_id), "bytes": int(size or 0)} for user_id, size in per_user],
+    }
+
+
+def user_storage_bytes(db: Session, user_id: UUID) -> int:
+    return int(
+        db.query(func.coalesce(func.sum(TailoredResume.output_bytes), 0))
+        .filter(TailoredResume.outputs_purged_at.is_(None), TailoredResume.user_id == user_id)
+        .scalar()
+        or 0
+    )
@@ -1,24 +1,35 @@
+import asyncio
 import html
 import io
+import logging
+import mimetypes
 import os
 import re
-import textwrap
+import threading
+import time
 from collections import Counter
-from typing import Any, Optional, cast
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, cast
 from uuid import UUID, uuid4
 from httpx import get
 from pdfminer.high_level import extract_text as extract_pdf_text  # pyright: ignore[reportMissingImports]
-from reportlab.lib import colors  # pyright: ignore[reportMissingImports, reportMissingModuleSource]
 from docx import Document  # pyright: ignore[reportMissingImports]
-from reportlab.lib.pagesizes import letter  # pyright: ignore[reportMissingImports, reportMissingModuleSource]
-from reportlab.pdfgen import canvas  # pyright: ignore[reportMissingImports, reportMissingModuleSource]
+from sqlalchemy import Row, event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.config.config import Config
+from app.libs.cache import TTLCache
+from app.libs.storage.registry import get_storage
 from app.models.job_analysis_model import JobAnalysis
 from app.models.resume_profile_model import ResumeProfile
 from app.models.tailored_resume_model import TailoredResume
+from app.schemas.tailor_batch_schema import TailorBatchRequest, TailorBatchResponse
+from app.schemas.tailor_regenerate_schema import TailorRegenerateRequest
+from app.schemas.tailored_resume_schema import TailorResumeRequest, TailorResumeResponse
 from app.services.ai_service import analyze_job_with_openai, parse_resume_with_openai
-from docx.shared import Pt, Inches, RGBColor  # pyright: ignore[reportMissingImports]
+from app.services.render_service import format_for_filename, render_html, render_outputs
+
+logger = logging.getLogger(__name__)
 
 STOPWORDS = {
     "the",
@@ -104,6 +115,43 @@ SECTION_HEADERS = {
     "summary",
 }
 
+# Receives pipeline stage events: (stage, {"elapsed_ms": ..., ...}).
+ProgressCallback = Callable[[str, dict], None]
+
+# Striped locks keep concurrent first hits on the same lazy file to a single render.
+_RENDER_LOCKS = [threading.Lock() for _ in range(64)]
+
+
+_REGENERATE_SLOTS_LOCK = threading.Lock()
+
+
+# Per tailored-resume coalescing state for regenerate: callers merge their edits into
+# `pending`, one caller at a time renders the merged edits and everyone up to `done_seq`
+# shares the result. Waiters block on `changed` and wake as soon as a run is published.
+class _RegenerateSlot:
+    def __init__(self) -> None:
+        self.changed = threading.Condition(_REGENERATE_SLOTS_LOCK)
+        self.seq = 0
+        self.done_seq = 0
+        self.running = False
+        self.waiters = 0
+        self.pending: Optional[TailorRegenerateRequest] = None
+        self.result: Optional[TailorResumeResponse] = None
+        self.error: Optional[Exception] = None
+
+    def publish(self, run_seq: int, result: Optional[TailorResumeResponse], error: Optional[Exception]) -> None:
+        with self.changed:
+            if self.done_seq >= run_seq:
+                return
+            self.done_seq = run_seq
+            self.result = result
+            self.error = error
+            self.running = False
+            self.changed.notify_all()
+
+
+_REGENERATE_SLOTS: dict[str, _RegenerateSlot] = {}
+
 DATE_PATTERN = re.compile(
     r"(\b(?:\d{4}|\w{3,9}\s+\d{4})\b\s*(?:-|to)\s*\b(?:present|current|\d{4}|\w{3,9}\s+\d{4})\b)",
     re.IGNORECASE,
@@ -364,385 +412,36 @@ def sanitize_filename(value: str) -> str:
     return cleaned or "Resume"
 
 
-def _style_profile(style: Optional[str]) -> dict:
-    name = (style or "Modern").lower()
-    if name == "slim":
-        return {
-            "title_size": 16,
-            "subtitle_size": 11,
-            "body_size": 10,
-            "accent": RGBColor(140, 96, 64),
-            "spacing_after": 4,
-            "line_spacing": 1.0,
-        }
-    if name == "fancy":
-        return {
-            "title_size": 20,
-            "subtitle_size": 12,
-            "body_size": 11,
-            "accent": RGBColor(201, 95, 60),
-            "spacing_after": 8,
-            "line_spacing": 1.15,
-        }
-    return {
-        "title_size": 18,
-        "subtitle_size": 12,
-        "body_size": 11,
-        "accent": RGBColor(201, 95, 60),
-        "spacing_after": 6,
-        "line_spacing": 1.1,
-    }
+def _report_progress(
+    on_progress: Optional[ProgressCallback],
+    stage: str,
+    started: float,
+    **details: Any,
+) -> float:
+    now = time.perf_counter()
+    if on_progress is not None:
+        on_progress(stage, {"elapsed_ms": round((now - started) * 1000, 1), **details})
+    return now
 
 
-def render_docx(
-    path: str,
-    name: str,
-    role: str,
-    summary: str,
-    skills: list[str],
-    bullets: list[str],
-    experiences: list[dict],
-    education: list[dict],
-    style: Optional[str],
-) -> None:
-    document = Document()
-
-    profile = _style_profile(style)
-    base_style = document.styles["Normal"]
-    base_style.font.name = "Calibri"
-    base_style.font.size = Pt(profile["body_size"])
-    base_style.paragraph_format.space_after = Pt(profile["spacing_after"])
-    base_style.paragraph_format.line_spacing = profile["line_spacing"]
-
-    title = document.add_paragraph()
-    title_run = title.add_run(f"{name}")
-    title_run.font.size = Pt(profile["title_size"])
-    title_run.font.bold = True
-    title_run.font.color.rgb = RGBColor(45, 45, 45)
-
-    subtitle = document.add_paragraph()
-    subtitle_run = subtitle.add_run(role)
-    subtitle_run.font.size = Pt(profile["subtitle_size"])
-    subtitle_run.font.color.rgb = RGBColor(120, 120, 120)
-    subtitle.paragraph_format.space_after = Pt(10)
-
-    summary_para = document.add_paragraph(summary)
-    summary_para.paragraph_format.space_after = Pt(12)
-
-    highlight_heading = document.add_paragraph("Highlights")
-    highlight_heading.runs[0].bold = True
-    highlight_heading.runs[0].font.size = Pt(profile["subtitle_size"])
-    highlight_heading.runs[0].font.color.rgb = profile["accent"]
-    highlight_heading.paragraph_format.space_after = Pt(6)
-
-    for bullet in bullets:
-        para = document.add_paragraph(bullet, style="List Bullet")
-        para.paragraph_format.left_indent = Inches(0.15)
-        para.paragraph_format.space_after = Pt(4)
-
-    if experiences:
-        experience_heading = document.add_paragraph("Experience")
-        experience_heading.runs[0].bold = True
-        experience_heading.runs[0].font.size = Pt(profile["subtitle_size"])
-        experience_heading.runs[0].font.color.rgb = profile["accent"]
-        experience_heading.paragraph_format.space_after = Pt(6)
-        for experience in experiences:
-            title = experience.get("title", "")
-            company = experience.get("company", "")
-            location = experience.get("location") or ""
-            dates = ""
-            if experience.get("start_date") or experience.get("end_date"):
-                dates = " - ".join(
-                    [
-                        part
-                        for part in [
-                            experience.get("start_date"),
-                            experience.get("end_date"),
-                        ]
-                        if part
-                    ]
-                )
-            header = " - ".join([part for part in [title, company] if part])
-            if header:
-                header_line = document.add_paragraph()
-                header_run = header_line.add_run(header)
-                header_run.bold = True
-                header_run.font.size = Pt(11)
-                meta = " · ".join([part for part in [location, dates] if part])
-                if meta:
-                    meta_run = header_line.add_run(f"  {meta}")
-                    meta_run.font.color.rgb = RGBColor(120, 120, 120)
-                header_line.paragraph_format.space_after = Pt(4)
-            for bullet in experience.get("bullets", []):
-                para = document.add_paragraph(bullet, style="List Bullet")
-                para.paragraph_format.left_indent = Inches(0.15)
-                para.paragraph_format.space_after = Pt(4)
-            spacer = document.add_paragraph("")
-            spacer.paragraph_format.space_after = Pt(15)
-
-    if education:
-        education_heading = document.add_paragraph("Education")
-        education_heading.runs[0].bold = True
-        education_heading.runs[0].font.size = Pt(profile["subtitle_size"])
-        education_heading.runs[0].font.color.rgb = profile["accent"]
-        education_heading.paragraph_format.space_after = Pt(6)
-        for edu in education:
-            institution = edu.get("institution", "")
-            degree = edu.get("degree", "")
-            field = edu.get("field_of_study", "")
-            dates = ""
-            if edu.get("start_date") or edu.get("end_date"):
-                dates = " - ".join(
-                    [
-                        part
-                        for part in [edu.get("start_date"), edu.get("end_date")]
-                        if part
-                    ]
-                )
-            header = " - ".join([part for part in [institution, degree, field] if part])
-            if header:
-                header_line = document.add_paragraph()
-                header_run = header_line.add_run(header)
-                header_run.bold = True
-                header_run.font.size = Pt(11)
-                if dates:
-                    meta_run = header_line.add_run(f"  {dates}")
-                    meta_run.font.color.rgb = RGBColor(120, 120, 120)
-                header_line.paragraph_format.space_after = Pt(4)
-            for bullet in edu.get("bullets", []):
-                para = document.add_paragraph(bullet, style="List Bullet")
-                para.paragraph_format.left_indent = Inches(0.15)
-                para.paragraph_format.space_after = Pt(4)
-            spacer = document.add_paragraph("")
-            spacer.paragraph_format.space_after = Pt(15)
-
-    if skills:
-        skills_heading = document.add_paragraph("Skills")
-        skills_heading.runs[0].bold = True
-        skills_heading.runs[0].font.size = Pt(profile["subtitle_size"])
-        skills_heading.runs[0].font.color.rgb = profile["accent"]
-        skills_heading.paragraph_format.space_after = Pt(6)
-
-        skills_para = document.add_paragraph(", ".join([skill for skill in skills if skill]))
-        skills_para.paragraph_format.space_after = Pt(15)
-    document.save(path)
-
-
-def render_pdf(
-    path: str,
-    name: str,
-    role: str,
-    summary: str,
-    skills: list[str],
-    bullets: list[str],
-    experiences: list[dict],
-    education: list[dict],
-    style: Optional[str],
-) -> None:
-    canvas_obj = canvas.Canvas(path, pagesize=letter)
-    width, height = letter
-    profile = _style_profile(style)
-    margin = 60 if (style or "").lower() == "slim" else 64
-    y = height - margin
-
-    accent = (
-        colors.HexColor("#8C6040")
-        if (style or "").lower() == "slim"
-        else colors.HexColor("#C95F3C")
-    )
-    muted = colors.HexColor("#6A5F55")
-
-    canvas_obj.setFont("Helvetica-Bold", profile["title_size"] + 2)
-    canvas_obj.setFillColor(colors.HexColor("#1D1A15"))
-    canvas_obj.drawString(margin, y, name)
-    y -= 18
-    canvas_obj.setFont("Helvetica", profile["subtitle_size"])
-    canvas_obj.setFillColor(muted)
-    canvas_obj.drawString(margin, y, role)
-    y -= 18
-
-    canvas_obj.setStrokeColor(accent)
-    canvas_obj.setLineWidth(1)
-    canvas_obj.line(margin, y, width - margin, y)
-    y -= 18
-
-    canvas_obj.setFont("Helvetica", profile["body_size"])
-    canvas_obj.setFillColor(colors.HexColor("#1D1A15"))
-    for line in textwrap.wrap(summary, width=95):
-        if y < margin:
-            canvas_obj.showPage()
-            y = height - margin
-            canvas_obj.setFont("Helvetica", 11)
-        canvas_obj.drawString(margin, y, line)
-        y -= 14 if (style or "").lower() == "slim" else 15
-
-    y -= 10
-    canvas_obj.setFont("Helvetica-Bold", profile["subtitle_size"])
-    canvas_obj.setFillColor(accent)
-    canvas_obj.drawString(margin, y, "Highlights")
-    y -= 16
-    canvas_obj.setFont("Helvetica", profile["body_size"])
-    canvas_obj.setFillColor(colors.HexColor("#1D1A15"))
-
-    for bullet in bullets:
-        wrapped = textwrap.wrap(bullet, width=92)
-        for index, line in enumerate(wrapped):
-            if y < margin:
-                canvas_obj.showPage()
-                y = height - margin
-                canvas_obj.setFont("Helvetica", 11)
-            prefix = "- " if index == 0 else "  "
-            canvas_obj.drawString(margin, y, f"{prefix}{line}")
-            y -= 14 if (style or "").lower() == "slim" else 15
-
-    if experiences:
-        y -= 8
-        canvas_obj.setFont("Helvetica-Bold", profile["subtitle_size"])
-        canvas_obj.setFillColor(accent)
-        canvas_obj.drawString(margin, y, "Experience")
-        y -= 16
-        canvas_obj.setFont("Helvetica", profile["body_size"])
-        canvas_obj.setFillColor(colors.HexColor("#1D1A15"))
-        for experience in experiences:
-            header = " - ".join(
-                [
-                    part
-                    for part in [
-                        experience.get("title", ""),
-                        experience.get("company", ""),
-                    ]
-                    if part
-                ]
-            )
-            if header:
-                canvas_obj.setFont("Helvetica-Bold", profile["body_size"])
-                canvas_obj.drawString(margin, y, header)
-                y -= 14
-                canvas_obj.setFont("Helvetica", max(profile["body_size"] - 1, 9))
-                meta = " · ".join(
-                    [
-                        part
-                        for part in [
-                            experience.get("location"),
-                            " - ".join(
-                                [
-                                    part
-                                    for part in [
-                                        experience.get("start_date"),
-                                        experience.get("end_date"),
-                                    ]
-                                    if part
-                                ]
-                            ),
-                        ]
-                        if part
-                    ]
-                )
-                if meta:
-                    canvas_obj.setFillColor(muted)
-                    canvas_obj.drawString(margin, y, meta)
-                    canvas_obj.setFillColor(colors.HexColor("#1D1A15"))
-                    y -= 12
-                canvas_obj.setFont("Helvetica", profile["body_size"])
-            for bullet in experience.get("bullets", []):
-                wrapped = textwrap.wrap(bullet, width=92)
-                for index, line in enumerate(wrapped):
-                    if y < margin:
-                        canvas_obj.showPage()
-                        y = height - margin
-                        canvas_obj.setFont("Helvetica", 11)
-                    prefix = "- " if index == 0 else "  "
-                    canvas_obj.drawString(margin, y, f"{prefix}{line}")
-                    y -= 14 if (style or "").lower() == "slim" else 15
-            y -= 15
-
-    if education:
-        y -= 8
-        canvas_obj.setFont("Helvetica-Bold", profile["subtitle_size"])
-        canvas_obj.setFillColor(accent)
-        canvas_obj.drawString(margin, y, "Education")
-        y -= 16
-        canvas_obj.setFont("Helvetica", profile["body_size"])
-        canvas_obj.setFillColor(colors.HexColor("#1D1A15"))
-        for edu in education:
-            header = " - ".join(
-                [
-                    part
-                    for part in [
-                        edu.get("institution", ""),
-                        edu.get("degree", ""),
-                        edu.get("field_of_study", ""),
-                    ]
-                    if part
-                ]
-            )
-            if header:
-                canvas_obj.setFont("Helvetica-Bold", profile["body_size"])
-                canvas_obj.drawString(margin, y, header)
-                y -= 14
-                dates = " - ".join(
-                    [
-                        part
-                        for part in [edu.get("start_date"), edu.get("end_date")]
-                        if part
-                    ]
-                )
-                if dates:
-                    canvas_obj.setFont("Helvetica", max(profile["body_size"] - 1, 9))
-                    canvas_obj.setFillColor(muted)
-                    canvas_obj.drawString(margin, y, dates)
-                    canvas_obj.setFillColor(colors.HexColor("#1D1A15"))
-                    y -= 12
-                canvas_obj.setFont("Helvetica", profile["body_size"])
-            for bullet in edu.get("bullets", []):
-                wrapped = textwrap.wrap(bullet, width=92)
-                for index, line in enumerate(wrapped):
-                    if y < margin:
-                        canvas_obj.showPage()
-                        y = height - margin
-                        canvas_obj.setFont("Helvetica", 11)
-                    prefix = "- " if index == 0 else "  "
-                    canvas_obj.drawString(margin, y, f"{prefix}{line}")
-                    y -= 14 if (style or "").lower() == "slim" else 15
-            y -= 15
-
-    if skills:
-        y -= 8
-        canvas_obj.setFont("Helvetica-Bold", profile["subtitle_size"])
-        canvas_obj.setFillColor(accent)
-        canvas_obj.drawString(margin, y, "Skills")
-        y -= 16
-        canvas_obj.setFont("Helvetica", profile["body_size"])
-        canvas_obj.setFillColor(colors.HexColor("#1D1A15"))
-        skills_line = ", ".join([skill for skill in skills if skill])
-        for line in textwrap.wrap(skills_line, width=95):
-            if y < margin:
-                canvas_obj.showPage()
-                y = height - margin
-                canvas_obj.setFont("Helvetica", profile["body_size"])
-                canvas_obj.setFillColor(colors.HexColor("#1D1A15"))
-            canvas_obj.drawString(margin, y, line)
-            y -= 14 if (style or "").lower() == "slim" else 15
-        y -= 15
-
-    canvas_obj.save()
-
-
-def create_job_analysis(
-    db: Session,
+def analyze_job(
     job_text: Optional[str],
     job_url: Optional[str],
     user_id: Optional[UUID],
     source_ip: Optional[str] = None,
+    on_progress: Optional[ProgressCallback] = None,
 ) -> JobAnalysis:
     source_text = job_text or ""
     source_url = None
+    started = time.perf_counter()
 
     if job_url:
         source_url = job_url
         source_text = fetch_job_text(job_url)
+        started = _report_progress(on_progress, "fetched", started)
 
     extracted_text = normalize_text(source_text)
+    started = _report_progress(on_progress, "extracted", started)
     ai_result = analyze_job_with_openai(extracted_text)
 
     ai_raw = None
@@ -758,8 +457,10 @@ def create_job_analysis(
         keywords = extract_keywords(extracted_text)
         signals = extract_signals(extracted_text)
         summary = summarize_text(extracted_text)
+    _report_progress(on_progress, "analyzed", started, ai=bool(ai_result))
 
     analysis = JobAnalysis(
+        id=uuid4(),
         user_id=user_id,
         source_ip=source_ip,
         source_url=source_url,
@@ -771,9 +472,20 @@ def create_job_analysis(
         ai_raw_response=ai_raw,
         ai_model=ai_model,
     )
+    return analysis
+
+
+def create_job_analysis(
+    db: Session,
+    job_text: Optional[str],
+    job_url: Optional[str],
+    user_id: Optional[UUID],
+    source_ip: Optional[str] = None,
+    on_progress: Optional[ProgressCallback] = None,
+) -> JobAnalysis:
+    analysis = analyze_job(job_text, job_url, user_id, source_ip, on_progress)
     db.add(analysis)
-    db.commit()
-    db.refresh(analysis)
+    db.flush()
     return analysis
 
 
@@ -829,15 +541,17 @@ def parse_resume_text(resume_text: str) -> tuple[dict, Optional[dict], Optional[
     )
 
 
-def create_resume_profile(
-    db: Session,
+def parse_resume_profile(
     resume_text: str,
     file_name: Optional[str],
     user_id: Optional[UUID],
     source_ip: Optional[str] = None,
+    on_progress: Optional[ProgressCallback] = None,
 ) -> ResumeProfile:
+    started = time.perf_counter()
     parsed, ai_raw, ai_model = parse_resume_text(resume_text)
-    profile = ResumeProfile(
+    _report_progress(on_progress, "parsed", started, ai=ai_model is not None)
+    return ResumeProfile(
         user_id=user_id,
         source_ip=source_ip,
         file_name=file_name,
@@ -846,21 +560,30 @@ def create_resume_profile(
         ai_raw_response=ai_raw,
         ai_model=ai_model,
     )
+
+
+def create_resume_profile(
+    db: Session,
+    resume_text: str,
+    file_name: Optional[str],
+    user_id: Optional[UUID],
+    source_ip: Optional[str] = None,
+    on_progress: Optional[ProgressCallback] = None,
+) -> ResumeProfile:
+    profile = parse_resume_profile(resume_text, file_name, user_id, source_ip, on_progress)
     db.add(profile)
-    db.commit()
-    db.refresh(profile)
+    db.flush()
     return profile
 
 
-def update_resume_profile_data(
-    db: Session,
-    resume_profile: ResumeProfile,
+def merge_resume_edits(
+    parsed_data: dict[str, Any],
     statement: Optional[str],
     skills: Optional[list[str]],
     experience: Optional[list[dict]],
     education: Optional[list[dict]],
-) -> ResumeProfile:
-    parsed = cast(dict[str, Any], resume_profile.parsed_data or {})
+) -> dict[str, Any]:
+    parsed = dict(parsed_data)
     if statement is not None:
         parsed["summary"] = statement
     if skills is not None:
@@ -869,12 +592,26 @@ def update_resume_profile_data(
         parsed["experience"] = experience
     if education is not None:
         parsed["education"] = education
+    return parsed
+
+
+def update_resume_profile_data(
+    db: Session,
+    resume_profile: ResumeProfile,
+    statement: Optional[str],
+    skills: Optional[list[str]],
+    experience: Optional[list[dict]],
+    education: Optional[list[dict]],
+) -> ResumeProfile:
+    current = cast(dict[str, Any], resume_profile.parsed_data or {})
+    parsed = merge_resume_edits(current, statement, skills, experience, education)
+    if parsed == current:
+        return resume_profile
 
     resume_profile_any = cast(Any, resume_profile)
     resume_profile_any.parsed_data = parsed
     db.add(resume_profile)
-    db.commit()
-    db.refresh(resume_profile)
+    db.flush()
     return resume_profile
 
 
@@ -905,9 +642,11 @@ def build_tailored_output(
     job_analysis: JobAnalysis,
     resume_profile: ResumeProfile,
     target_role: Optional[str],
+    parsed_data: Optional[dict[str, Any]] = None,
 ) -> tuple[str, list[str], str, list[dict], list[dict]]:
     role = target_role or "Role"
-    parsed_data = cast(dict[str, Any], resume_profile.parsed_data or {})
+    if parsed_data is None:
+        parsed_data = cast(dict[str, Any], resume_profile.parsed_data or {})
     skills = cast(list[str], parsed_data.get("skills", []))
     keywords = cast(list[str], job_analysis.keywords or [])
 
@@ -940,8 +679,7 @@ def build_tailored_output(
     return summary, bullets, base_name, tailored_experience, tailored_education
 
 
-def create_tailored_resume(
-    db: Session,
+def build_tailored_resume(
     job_analysis: JobAnalysis,
     resume_profile: ResumeProfile,
     target_role: Optional[str],
@@ -957,40 +695,11 @@ def create_tailored_resume(
     skills = cast(list[str], parsed_data.get("skills", []))
 
     tailored_id = uuid4()
-    folder = ensure_storage_dir("tailored", str(tailored_id))
-    pdf_name = f"{base_name}-tailored.pdf"
-    docx_name = f"{base_name}-tailored.docx"
-    pdf_path = os.path.join(folder, pdf_name)
-    docx_path = os.path.join(folder, docx_name)
-    relative_pdf = f"tailored/{tailored_id}/{pdf_name}"
-    relative_docx = f"tailored/{tailored_id}/{docx_name}"
-
+    relative_pdf = f"tailored/{tailored_id}/{base_name}-tailored.pdf"
+    relative_docx = f"tailored/{tailored_id}/{base_name}-tailored.docx"
     name = cast(str, parsed_data.get("name") or "Candidate")
-    role = target_role or "Role"
-    render_pdf(
-        pdf_path,
-        name,
-        role,
-        summary,
-        skills,
-        bullets,
-        tailored_experience,
-        tailored_education,
-        selected_style,
-    )
-    render_docx(
-        docx_path,
-        name,
-        role,
-        summary,
-        skills,
-        bullets,
-        tailored_experience,
-        tailored_education,
-        selected_style,
-    )
 
-    tailored = TailoredResume(
+    return TailoredResume(
         id=tailored_id,
         user_id=user_id,
         source_ip=source_ip,
@@ -998,18 +707,405 @@ def create_tailored_resume(
         resume_profile_id=resume_profile.id,
         target_role=target_role,
         style=selected_style,
+        candidate_name=name,
         tailored_summary=summary,
         tailored_bullets=bullets,
         tailored_experience=tailored_experience,
         tailored_education=tailored_education,
+        tailored_skills=skills,
         output_files=[relative_pdf, relative_docx],
     )
+
+
+# Renders the row's output files unless rendering is deferred to the first download.
+def render_tailored_files(
+    tailored: TailoredResume,
+    on_progress: Optional[ProgressCallback] = None,
+) -> None:
+    if Config.RENDER_MODE == "lazy":
+        return
+
+    targets = {}
+    keys = {}
+    for relative_path in cast(list[str], tailored.output_files or []):
+        fmt = format_for_filename(relative_path)
+        if fmt is not None:
+            targets[fmt] = os.path.join(Config.STORAGE_PATH, relative_path)
+            keys[fmt] = relative_path
+    ensure_storage_dir("tailored", str(tailored.id))
+    timings = render_outputs(targets, tailored_render_content(tailored))
+    storage = get_storage()
+    output_bytes = 0
+    for fmt, path in targets.items():
+        output_bytes += os.path.getsize(path)
+        storage.save_file(path, keys[fmt], mimetypes.guess_type(path)[0])
+    cast(Any, tailored).output_bytes = output_bytes
+    if on_progress is not None:
+        for fmt in targets:
+            on_progress(
+                f"rendered_{fmt}",
+                {"elapsed_ms": round(timings.get(fmt, 0.0) * 1000, 1), "cached": fmt not in timings},
+            )
+
+
+def create_tailored_resume(
+    db: Session,
+    job_analysis: JobAnalysis,
+    resume_profile: ResumeProfile,
+    target_role: Optional[str],
+    user_id: Optional[UUID],
+    style: Optional[str] = None,
+    source_ip: Optional[str] = None,
+    on_progress: Optional[ProgressCallback] = None,
+) -> TailoredResume:
+    tailored = build_tailored_resume(job_analysis, resume_profile, target_role, user_id, style, source_ip)
+    render_tailored_files(tailored, on_progress)
+
     db.add(tailored)
-    db.commit()
-    db.refresh(tailored)
+    db.flush()
     return tailored
 
 
+# Builds the tailored document from unsaved edits and returns it as HTML; no files are
+# rendered and nothing is written to the database.
+def preview_tailored_resume(
+    job_analysis: JobAnalysis,
+    resume_profile: ResumeProfile,
+    target_role: Optional[str],
+    style: Optional[str],
+    statement: Optional[str] = None,
+    skills: Optional[list[str]] = None,
+    experience: Optional[list[dict]] = None,
+    education: Optional[list[dict]] = None,
+) -> str:
+    parsed_data = merge_resume_edits(
+        cast(dict[str, Any], resume_profile.parsed_data or {}), statement, skills, experience, education
+    )
+    summary, bullets, _, tailored_experience, tailored_education = build_tailored_output(
+        job_analysis, resume_profile, target_role, parsed_data
+    )
+    return render_html(
+        name=cast(str, parsed_data.get("name") or "Candidate"),
+        role=target_role or "Role",
+        summary=summary,
+        skills=cast(list[str], parsed_data.get("skills", [])),
+        bullets=bullets,
+        experiences=tailored_experience,
+        education=tailored_education,
+        style=style or "Modern",
+    )
+
+
+def tailored_render_content(tailored: TailoredResume) -> dict:
+    return {
+        "name": cast(str, tailored.candidate_name or "Candidate"),
+        "role": cast(str, tailored.target_role or "Role"),
+        "summary": cast(str, tailored.tailored_summary),
+        "skills": cast(list[str], tailored.tailored_skills or []),
+        "bullets": cast(list[str], tailored.tailored_bullets or []),
+        "experiences": cast(list[dict], tailored.tailored_experience or []),
+        "education": cast(list[dict], tailored.tailored_education or []),
+        "style": cast(Optional[str], tailored.style),
+    }
+
+
+# Renders a missing output on demand (lazy mode) and stores it; returns False when the
+# path is not a renderable output. The file's size is added to the row's output_bytes.
+def ensure_tailored_file(db: Session, tailored: TailoredResume, relative_path: str) -> bool:
+    storage = get_storage()
+    if storage.exists(relative_path):
+        return True
+
+    fmt = format_for_filename(relative_path)
+    if fmt is None:
+        return False
+
+    with _RENDER_LOCKS[hash(relative_path) % len(_RENDER_LOCKS)]:
+        if not storage.exists(relative_path):
+            file_path = os.path.join(Config.STORAGE_PATH, relative_path)
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            render_outputs({fmt: file_path}, tailored_render_content(tailored))
+            size = os.path.getsize(file_path)
+            storage.save_file(file_path, relative_path, mimetypes.guess_type(file_path)[0])
+            # Incremented in SQL: other workers may be rendering the row's other format.
+            db.query(TailoredResume).filter(TailoredResume.id == tailored.id).update(
+                {TailoredResume.output_bytes: func.coalesce(TailoredResume.output_bytes, 0) + size},
+                synchronize_session=False,
+            )
+    return True
+
+
+def _regenerate_once(
+    db: Session,
+    tailored: TailoredResume,
+    payload: TailorRegenerateRequest,
+    user_id: Optional[UUID],
+    source_ip: Optional[str],
+) -> TailorResumeResponse:
+    job_analysis = get_job_analysis(db, cast(UUID, tailored.job_analysis_id))
+    resume_profile = get_resume_profile(db, cast(UUID, tailored.resume_profile_id))
+    if not job_analysis or not resume_profile:
+        raise LookupError("Analysis data not found")
+
+    resume_profile = update_resume_profile_data(
+        db=db,
+        resume_profile=resume_profile,
+        statement=payload.statement,
+        skills=payload.skills,
+        experience=payload.experience,
+        education=payload.education,
+    )
+    target_role = cast(Optional[str], tailored.target_role)
+    style = payload.style or cast(Optional[str], tailored.style) or "Modern"
+
+    # Nothing that reaches the document changed: keep the existing row and its files.
+    summary, bullets, _, tailored_experience, tailored_education = build_tailored_output(
+        job_analysis, resume_profile, target_role
+    )
+    parsed_data = cast(dict[str, Any], resume_profile.parsed_data or {})
+    content = {
+        "name": cast(str, parsed_data.get("name") or "Candidate"),
+        "role": target_role or "Role",
+        "summary": summary,
+        "skills": cast(list[str], parsed_data.get("skills", [])),
+        "bullets": bullets,
+        "experiences": tailored_experience,
+        "education": tailored_education,
+        "style": style,
+    }
+    if content == tailored_render_content(tailored):
+        return TailorResumeResponse.model_validate(tailored, from_attributes=True)
+
+    regenerated = create_tailored_resume(
+        db=db,
+        job_analysis=job_analysis,
+        resume_profile=resume_profile,
+        target_role=target_role,
+        user_id=user_id,
+        style=style,
+        source_ip=source_ip,
+    )
+    return TailorResumeResponse.model_validate(regenerated, from_attributes=True)
+
+
+# Overlapping regenerates for the same resume are debounced and coalesced: edits are merged
+# field by field (later wins), only the newest merged edit set is rendered, and every caller
+# whose edits it includes receives that result.
+def regenerate_tailored_resume(
+    db: Session,
+    tailored: TailoredResume,
+    payload: TailorRegenerateRequest,
+    user_id: Optional[UUID],
+    source_ip: Optional[str] = None,
+) -> TailorResumeResponse:
+    key = str(tailored.id)
+    with _REGENERATE_SLOTS_LOCK:
+        slot = _REGENERATE_SLOTS.setdefault(key, _RegenerateSlot())
+        slot.seq += 1
+        seq = slot.seq
+        slot.waiters += 1
+        if slot.pending is None:
+            slot.pending = payload
+        else:
+            slot.pending = slot.pending.model_copy(update=payload.model_dump(exclude_none=True))
+
+    try:
+        with slot.changed:
+            waited = slot.running
+            slot.changed.wait_for(lambda: slot.done_seq >= seq or not slot.running)
+            if slot.done_seq >= seq:
+                if slot.error is not None:
+                    raise slot.error
+                return cast(TailorResumeResponse, slot.result)
+
+            slot.running = True
+            if not waited and Config.REGENERATE_DEBOUNCE_SECONDS > 0:
+                # Only the caller that runs the edits waits out the window (later edits keep
+                # merging into `pending`); callers that already waited on a run go at once.
+                slot.changed.wait(Config.REGENERATE_DEBOUNCE_SECONDS)
+            run_seq, run_payload = slot.seq, cast(TailorRegenerateRequest, slot.pending)
+            slot.pending = None
+
+        try:
+            result = _regenerate_once(db, tailored, run_payload, user_id, source_ip)
+        except Exception as exc:
+            slot.publish(run_seq, None, exc)
+            raise
+        _publish_on_commit(db, slot, run_seq, result)
+        return result
+    finally:
+        with _REGENERATE_SLOTS_LOCK:
+            slot.waiters -= 1
+            if slot.waiters == 0:
+                _REGENERATE_SLOTS.pop(key, None)
+
+
+# Coalesced callers get the result only once the running request's transaction (committed
+# by get_db) has made the new row durable; a rollback hands them an error instead.
+def _publish_on_commit(db: Session, slot: _RegenerateSlot, run_seq: int, result: TailorResumeResponse) -> None:
+    def committed(_session) -> None:
+        slot.publish(run_seq, result, None)
+
+    def rolled_back(_session, _transaction) -> None:
+        slot.publish(run_seq, None, RuntimeError("regenerate was rolled back"))
+
+    event.listen(db, "after_commit", committed, once=True)
+    event.listen(db, "after_soft_rollback", rolled_back, once=True)
+
+
+def run_tailor_pipeline(
+    db: Session,
+    payload: TailorResumeRequest,
+    user_id: Optional[UUID],
+    source_ip: Optional[str] = None,
+    on_progress: Optional[ProgressCallback] = None,
+) -> TailoredResume:
+    job_analysis = None
+    resume_profile = None
+
+    if payload.job_analysis_id:
+        job_analysis = get_job_analysis(db, payload.job_analysis_id)
+    if payload.resume_profile_id:
+        resume_profile = get_resume_profile(db, payload.resume_profile_id)
+
+    if not job_analysis:
+        if not payload.job_text and not payload.job_url:
+            raise ValueError("job_text/job_url or job_analysis_id is required")
+        job_analysis = create_job_analysis(
+            db=db,
+            job_text=payload.job_text,
+            job_url=str(payload.job_url) if payload.job_url else None,
+            user_id=user_id,
+            source_ip=source_ip,
+            on_progress=on_progress,
+        )
+
+    if not resume_profile:
+        if not payload.resume_text:
+            raise ValueError("resume_text or resume_profile_id is required")
+        resume_profile = create_resume_profile(
+            db=db,
+            resume_text=payload.resume_text,
+            file_name=payload.file_name,
+            user_id=user_id,
+            source_ip=source_ip,
+            on_progress=on_progress,
+        )
+
+    return create_tailored_resume(
+        db=db,
+        job_analysis=job_analysis,
+        resume_profile=resume_profile,
+        target_role=payload.target_role,
+        user_id=user_id,
+        style=payload.style,
+        source_ip=source_ip,
+        on_progress=on_progress,
+    )
+
+
+# Tailors one resume against many jobs and styles: the profile is loaded once, new job
+# analyses run concurrently, renders share the pool, and all rows land in one commit.
+def run_tailor_batch(
+    db: Session,
+    payload: TailorBatchRequest,
+    user_id: Optional[UUID],
+    source_ip: Optional[str] = None,
+) -> TailorBatchResponse:
+    if not payload.jobs:
+        raise ValueError("jobs is required")
+    styles = payload.styles or ["Modern"]
+    if len(payload.jobs) * len(styles) > Config.BATCH_MAX_ITEMS:
+        raise ValueError(f"batch is limited to {Config.BATCH_MAX_ITEMS} jobs x styles")
+
+    resume_profile = get_resume_profile(db, payload.resume_profile_id) if payload.resume_profile_id else None
+    if not resume_profile:
+        if not payload.resume_text:
+            raise ValueError("resume_text or resume_profile_id is required")
+        resume_profile = create_resume_profile(
+            db=db,
+            resume_text=payload.resume_text,
+            file_name=payload.file_name,
+            user_id=user_id,
+            source_ip=source_ip,
+        )
+
+    analysis_ids = [job.job_analysis_id for job in payload.jobs if job.job_analysis_id]
+    existing = (
+        {analysis.id: analysis for analysis in db.query(JobAnalysis).filter(JobAnalysis.id.in_(analysis_ids))}
+        if analysis_ids
+        else {}
+    )
+    to_analyze = [job for job in payload.jobs if job.job_analysis_id not in existing]
+    for job in to_analyze:
+        if not job.job_text and not job.job_url:
+            raise ValueError("each job needs job_text/job_url or an existing job_analysis_id")
+
+    new_analyses: list[JobAnalysis] = []
+    if to_analyze:
+        with ThreadPoolExecutor(max_workers=max(1, min(Config.BATCH_ANALYSIS_CONCURRENCY, len(to_analyze)))) as pool:
+            new_analyses = list(
+                pool.map(
+                    lambda job: analyze_job(
+                        job.job_text, str(job.job_url) if job.job_url else None, user_id, source_ip
+                    ),
+                    to_analyze,
+                )
+            )
+    analyzed = iter(new_analyses)
+    analyses = [existing.get(job.job_analysis_id) or next(analyzed) for job in payload.jobs]
+
+    rows = [
+        build_tailored_resume(
+            job_analysis=analysis,
+            resume_profile=resume_profile,
+            target_role=job.target_role or payload.target_role,
+            user_id=user_id,
+            style=style,
+            source_ip=source_ip,
+        )
+        for job, analysis in zip(payload.jobs, analyses)
+        for style in styles
+    ]
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, Config.RENDER_WORKERS)) as pool:
+            list(pool.map(render_tailored_files, rows))
+        db.add_all([*new_analyses, *rows])
+        db.flush()
+    except Exception:
+        _discard_outputs(rows)
+        raise
+    _discard_outputs_on_rollback(db, rows)
+    return TailorBatchResponse(
+        resume_profile_id=cast(UUID, resume_profile.id),
+        items=[TailorResumeResponse.model_validate(row, from_attributes=True) for row in rows],
+    )
+
+
+# Files rendered for rows that never get committed are referenced by nothing, so retention
+# would never find them.
+def _discard_outputs(rows: list[TailoredResume]) -> None:
+    storage = get_storage()
+    for row in rows:
+        for key in cast(list[str], row.output_files or []):
+            try:
+                storage.delete(key)
+            except Exception:
+                logger.warning("could not discard %s", key, exc_info=True)
+
+
+def _discard_outputs_on_rollback(db: Session, rows: list[TailoredResume]) -> None:
+    def rolled_back(_session, _transaction) -> None:
+        _discard_outputs(rows)
+
+    def committed(_session) -> None:
+        if event.contains(db, "after_soft_rollback", rolled_back):
+            event.remove(db, "after_soft_rollback", rolled_back)
+
+    event.listen(db, "after_soft_rollback", rolled_back, once=True)
+    event.listen(db, "after_commit", committed, once=True)
+
+
 def get_job_analysis(db: Session, analysis_id: UUID) -> Optional[JobAnalysis]:
     return db.query(JobAnalysis).filter(JobAnalysis.id == analysis_id).first()
 
@@ -1020,3 +1116,104 @@ def get_resume_profile(db: Session, profile_id: UUID) -> Optional[ResumeProfile]
 
 def get_tailored_resume(db: Session, tailored_id: UUID) -> Optional[TailoredResume]:
     return db.query(TailoredResume).filter(TailoredResume.id == tailored_id).first()
+
+
+# Async variants for routes running on the event loop. Parsing and analysis (HTTP fetches,
+# OpenAI calls, text extraction) run in a worker thread; only the database I/O is awaited.
+async def create_job_analysis_async(
+    db: AsyncSession,
+    job_text: Optional[str],
+    job_url: Optional[str],
+    user_id: Optional[UUID],
+    source_ip: Optional[str] = None,
+) -> JobAnalysis:
+    analysis = await asyncio.to_thread(analyze_job, job_text, job_url, user_id, source_ip)
+    db.add(analysis)
+    await db.flush()
+    return analysis
+
+
+async def create_resume_profile_async(
+    db: AsyncSession,
+    resume_text: str,
+    file_name: Optional[str],
+    user_id: Optional[UUID],
+    source_ip: Optional[str] = None,
+) -> ResumeProfile:
+    profile = await asyncio.to_thread(parse_resume_profile, resume_text, file_name, user_id, source_ip)
+    db.add(profile)
+    await db.flush()
+    return profile
+
+
+async def get_job_analysis_async(db: AsyncSession, analysis_id: UUID) -> Optional[JobAnalysis]:
+    return await db.scalar(select(JobAnalysis).where(JobAnalysis.id == analysis_id))
+
+
+async def get_resume_profile_async(db: AsyncSession, profile_id: UUID) -> Optional[ResumeProfile]:
+    return await db.scalar(select(ResumeProfile).where(ResumeProfile.id == profile_id))
+
+
+async def get_tailored_resume_async(db: AsyncSession, tailored_id: UUID) -> Optional[TailoredResume]:
+    return await db.scalar(select(TailoredResume).where(TailoredResume.id == tailored_id))
+
+
+# Everything /tailor/result needs in one round trip: only the columns the response uses, with
+# the job text length computed in SQL instead of loading the text. Outer joins keep a missing
+# analysis or profile distinguishable from a missing tailored resume.
+async def get_tailored_result_row_async(db: AsyncSession, tailored_id: UUID) -> Optional[Row]:
+    stmt = (
+        select(
+            TailoredResume.id,
+            TailoredResume.output_files,
+            TailoredResume.target_role,
+            TailoredResume.style,
+            TailoredResume.created_at,
+            JobAnalysis.id.label("job_analysis_id"),
+            JobAnalysis.summary,
+            JobAnalysis.keywords,
+            JobAnalysis.signals,
+            func.length(JobAnalysis.extracted_text).label("job_length"),
+            ResumeProfile.id.label("resume_profile_id"),
+            ResumeProfile.parsed_data,
+        )
+        .select_from(TailoredResume)
+        .outerjoin(JobAnalysis, JobAnalysis.id == TailoredResume.job_analysis_id)
+        .outerjoin(ResumeProfile, ResumeProfile.id == TailoredResume.resume_profile_id)
+        .where(TailoredResume.id == tailored_id)
+    )
+    return (await db.execute(stmt)).first()
+
+
+def get_tailored_resumes(db: Session, tailored_ids: list[UUID]) -> list[TailoredResume]:
+    if not tailored_ids:
+        return []
+    return db.query(TailoredResume).filter(TailoredResume.id.in_(tailored_ids)).all()
+
+
+# (tailored_id, filename) -> storage key. Output keys never change once written, so repeat
+# downloads resolve without touching the database; a miss reads only the output_files column.
+OUTPUT_PATH_CACHE = TTLCache("output_paths", Config.OUTPUT_PATH_CACHE_SIZE, Config.OUTPUT_PATH_CACHE_TTL_SECONDS)
+
+
+def resolve_tailored_output_path(db: Session, tailored_id: UUID, filename: str) -> str:
+    key = (tailored_id, filename)
+    relative_path = OUTPUT_PATH_CACHE.get(key)
+    if relative_path is not None:
+        return relative_path
+
+    row = db.query(TailoredResume.output_files).filter(TailoredResume.id == tailored_id).first()
+    if row is None:
+        raise LookupError("Tailored resume not found")
+    for path in row.output_files or []:
+        if str(path).endswith(filename):
+            OUTPUT_PATH_CACHE.set(key, str(path))
+            return str(path)
+    raise LookupError("File not found")
+
+
+def invalidate_tailored_output_paths(tailored_id: Optional[UUID] = None, filenames: Optional[list[str]] = None) -> None:
+    if tailored_id is None:
+        OUTPUT_PATH_CACHE.invalidate_all()
+        return
+    OUTPUT_PATH_CACHE.invalidate(*((tailored_id, os.path.basename(name)) for name in filenames or []))
@@ -40,8 +40,7 @@ def create_user(db: Session, user_in: UserCreate):
         updated_at=user_in.updated_at,
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    db.flush()
     return user
 
 
@@ -77,8 +76,6 @@ def attach_anonymous_data_to_user_by_ip(db: Session, ip_address: str, user_id):
         {File.user_id: user_id}, synchronize_session=False
     )
 
-    db.commit()
-
 # Update user
 def update_user(db: Session, user_id: str, updated_user: UserUpdate):
     user = db.query(User).filter(User.id == user_id).first()
@@ -93,8 +90,7 @@ def update_user(db: Session, user_id: str, updated_user: UserUpdate):
     if updated_user.password is not None:
         mutable_user_any.password_hash = hash_password(updated_user.password)
     mutable_user_any.updated_at = updated_user.updated_at or datetime.utcnow()
-    db.commit()
-    db.refresh(mutable_user)
+    db.flush()
     return mutable_user
 
 # Delete user
@@ -103,5 +99,5 @@ def delete_user(db: Session, user_id: str):
     if not user:
         return None
     db.delete(user)
-    db.commit()
+    db.flush()
     return user
\ No newline at end of file
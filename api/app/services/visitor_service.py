@@ -1,8 +1,30 @@
+import logging
+import threading
 from datetime import datetime
+from typing import Optional
+from uuid import UUID, uuid4
+from sqlalchemy import event, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from fastapi import Request
+from app.config.config import Config
+from app.libs.cache import TTLCache
+from app.libs.db.base import SessionLocal
 from app.models.visitor_identity_model import VisitorIdentity
 
+logger = logging.getLogger(__name__)
+
+# IP -> user_id (as a string, "" for anonymous IPs so they are cached too). Relinking an IP
+# drops its entry in every worker; shared through Redis when CACHE_REDIS_URL is set.
+USER_ID_BY_IP_CACHE = TTLCache(
+    "user_id_by_ip",
+    Config.USER_ID_BY_IP_CACHE_SIZE,
+    Config.USER_ID_BY_IP_CACHE_TTL_SECONDS,
+    shared=True,
+)
+
 
 def get_client_ip(request: Request) -> str:
     forwarded = request.headers.get("x-forwarded-for")
@@ -19,59 +41,197 @@ def get_client_ip(request: Request) -> str:
     return "unknown"
 
 
-def track_visitor_by_ip(db: Session, ip_address: str, user_id=None) -> VisitorIdentity:
-    visitor = db.query(VisitorIdentity).filter(VisitorIdentity.ip_address == ip_address).first()
-    now = datetime.utcnow()
+# Dialect-specific INSERT so visits can use ON CONFLICT (ip_address) DO UPDATE.
+def _insert(db: Session | AsyncSession):
+    if db.get_bind().dialect.name == "sqlite":
+        return sqlite_insert(VisitorIdentity)
+    return pg_insert(VisitorIdentity)
+
+
+# One statement per batch: new IPs are inserted, known IPs get their counters bumped in place,
+# so concurrent visitors behind the same NAT no longer serialize on a SELECT ... then UPDATE.
+def _upsert_statement(db: Session | AsyncSession):
+    stmt = _insert(db)
+    return stmt.on_conflict_do_update(
+        index_elements=[VisitorIdentity.ip_address],
+        set_={
+            "last_seen": stmt.excluded.last_seen,
+            "visit_count": VisitorIdentity.visit_count + stmt.excluded.visit_count,
+            "user_id": func.coalesce(stmt.excluded.user_id, VisitorIdentity.user_id),
+        },
+    )
+
+
+# A visit that carries a user_id links the IP to that user (the upsert keeps the newest
+# user_id), so the cached mapping is written through rather than invalidated.
+def _remember_mapping(ip_address: str, user_id) -> None:
+    if user_id is not None and USER_ID_BY_IP_CACHE.peek(ip_address) != str(user_id):
+        USER_ID_BY_IP_CACHE.set(ip_address, str(user_id))
+
+
+async def _remember_mapping_async(ip_address: str, user_id) -> None:
+    if user_id is not None and USER_ID_BY_IP_CACHE.peek(ip_address) != str(user_id):
+        await USER_ID_BY_IP_CACHE.set_async(ip_address, str(user_id))
+
+
+def _visit(ip_address: str, user_id, count: int, now: datetime) -> dict:
+    return {
+        "id": uuid4(),
+        "ip_address": ip_address,
+        "user_id": user_id,
+        "first_seen": now,
+        "last_seen": now,
+        "visit_count": count,
+    }
+
+
+class _VisitBuffer:
+    # Visits aggregated per IP in memory and written in one upsert every
+    # VISITOR_FLUSH_SECONDS (or sooner once VISITOR_BUFFER_MAX_IPS is reached).
+    def __init__(self):
+        self._pending: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, ip_address: str, user_id) -> None:
+        now = datetime.utcnow()
+        with self._lock:
+            visit = self._pending.get(ip_address)
+            if visit is None:
+                self._pending[ip_address] = _visit(ip_address, user_id, 1, now)
+            else:
+                visit["visit_count"] += 1
+                visit["last_seen"] = now
+                if user_id is not None:
+                    visit["user_id"] = user_id
+            full = len(self._pending) >= Config.VISITOR_BUFFER_MAX_IPS
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="visit-flusher", daemon=True)
+                self._thread.start()
+        if full:
+            self._wake.set()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(Config.VISITOR_FLUSH_SECONDS)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.warning("visitor flush failed", exc_info=True)
 
-    if not visitor:
-        visitor = VisitorIdentity(
-            ip_address=ip_address,
-            user_id=user_id,
-            first_seen=now,
-            last_seen=now,
-            visit_count=1,
-        )
-        db.add(visitor)
-    else:
-        visitor.last_seen = now
-        visitor.visit_count = (visitor.visit_count or 0) + 1
-        if user_id is not None:
-            visitor.user_id = user_id
-
-    db.commit()
-    db.refresh(visitor)
-    return visitor
+    def flush(self) -> int:
+        with self._lock:
+            visits = list(self._pending.values())
+            self._pending = {}
+        if not visits:
+            return 0
+        db = SessionLocal()
+        try:
+            db.execute(_upsert_statement(db), visits)
+            db.commit()
+        except Exception:
+            db.rollback()
+            # Put the batch back so counts are not lost; newer visits keep their timestamps.
+            with self._lock:
+                for visit in visits:
+                    pending = self._pending.get(visit["ip_address"])
+                    if pending is None:
+                        self._pending[visit["ip_address"]] = visit
+                    else:
+                        pending["visit_count"] += visit["visit_count"]
+                        pending["user_id"] = pending["user_id"] or visit["user_id"]
+            raise
+        finally:
+            db.close()
+        return len(visits)
+
+
+_VISIT_BUFFER = _VisitBuffer()
+
+
+def flush_visitor_buffer() -> int:
+    return _VISIT_BUFFER.flush()
+
+
+# With VISITOR_WRITE_BEHIND the visit is only buffered and None is returned; pass
+# buffered=False when the caller needs the stored visit_count. The upsert is committed in its
+# own short transaction: held until the end of the request, its row lock would serialize
+# every request from the same IP behind the slow AI and render work. Callers that have already
+# written the visitor row in db pass own_transaction=False, since a second session would wait
+# on their own uncommitted row; the visit then commits (or rolls back) with the request.
+def track_visitor_by_ip(
+    db: Session, ip_address: str, user_id=None, buffered: bool = True, own_transaction: bool = True
+) -> Optional[int]:
+    if buffered and Config.VISITOR_WRITE_BEHIND:
+        _VISIT_BUFFER.add(ip_address, user_id)
+        _remember_mapping(ip_address, user_id)
+        return None
+
+    visit = _visit(ip_address, user_id, 1, datetime.utcnow())
+    if not own_transaction:
+        statement = _upsert_statement(db).values(**visit).returning(VisitorIdentity.visit_count)
+        visit_count = db.execute(statement).scalar_one()
+        event.listen(db, "after_commit", lambda _session: _remember_mapping(ip_address, user_id), once=True)
+        return visit_count
+
+    with Session(bind=db.get_bind()) as visit_db:
+        statement = _upsert_statement(visit_db).values(**visit).returning(VisitorIdentity.visit_count)
+        visit_count = visit_db.execute(statement).scalar_one()
+        visit_db.commit()
+    _remember_mapping(ip_address, user_id)
+    return visit_count
+
+
+# Same as track_visitor_by_ip. The request session is left untouched, so it does not hold a
+# pooled connection while the route awaits its slow work.
+async def track_visitor_by_ip_async(db: AsyncSession, ip_address: str, user_id=None, buffered: bool = True) -> Optional[int]:
+    if buffered and Config.VISITOR_WRITE_BEHIND:
+        _VISIT_BUFFER.add(ip_address, user_id)
+        await _remember_mapping_async(ip_address, user_id)
+        return None
+
+    visit = _visit(ip_address, user_id, 1, datetime.utcnow())
+    async with AsyncSession(bind=db.bind) as visit_db:
+        statement = _upsert_statement(visit_db).values(**visit).returning(VisitorIdentity.visit_count)
+        visit_count = (await visit_db.execute(statement)).scalar_one()
+        await visit_db.commit()
+    await _remember_mapping_async(ip_address, user_id)
+    return visit_count
 
 
 def link_visitor_ip_to_user(db: Session, ip_address: str, user_id):
-    visitors = db.query(VisitorIdentity).filter(VisitorIdentity.ip_address == ip_address).all()
     now = datetime.utcnow()
+    stmt = _insert(db)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[VisitorIdentity.ip_address],
+        set_={"user_id": stmt.excluded.user_id, "last_seen": stmt.excluded.last_seen},
+    )
+    db.execute(stmt, [_visit(ip_address, user_id, 1, now)])
+    # Dropped again once the new link is committed, in case another worker re-cached the
+    # old mapping in between.
+    USER_ID_BY_IP_CACHE.invalidate(ip_address)
+    event.listen(db, "after_commit", lambda _session: USER_ID_BY_IP_CACHE.invalidate(ip_address), once=True)
 
-    if not visitors:
-        visitor = VisitorIdentity(
-            ip_address=ip_address,
-            user_id=user_id,
-            first_seen=now,
-            last_seen=now,
-            visit_count=1,
-        )
-        db.add(visitor)
-    else:
-        for visitor in visitors:
-            visitor.user_id = user_id
-            visitor.last_seen = now
 
-    db.commit()
+def get_user_id_for_ip(db: Session, ip_address: str):
+    cached = USER_ID_BY_IP_CACHE.get(ip_address)
+    if cached is None:
+        user_id = db.query(VisitorIdentity.user_id).filter(VisitorIdentity.ip_address == ip_address).scalar()
+        cached = str(user_id) if user_id else ""
+        USER_ID_BY_IP_CACHE.set(ip_address, cached)
+    return UUID(cached) if cached else None
 
 
-def get_user_id_for_ip(db: Session, ip_address: str):
-    visitor = (
-        db.query(VisitorIdentity)
-        .filter(
-            VisitorIdentity.ip_address == ip_address,
-            VisitorIdentity.user_id.isnot(None),
-        )
-        .order_by(VisitorIdentity.last_seen.desc())
-        .first()
-    )
-    return visitor.user_id if visitor else None
+# Cache misses are read through a short session of their own, like track_visitor_by_ip_async.
+async def get_user_id_for_ip_async(db: AsyncSession, ip_address: str):
+    cached = await USER_ID_BY_IP_CACHE.get_async(ip_address)
+    if cached is None:
+        async with AsyncSession(bind=db.bind) as lookup_db:
+            user_id = await lookup_db.scalar(
+                select(VisitorIdentity.user_id).where(VisitorIdentity.ip_address == ip_address)
+            )
+        cached = str(user_id) if user_id else ""
+        await USER_ID_BY_IP_CACHE.set_async(ip_address, cached)
+    return UUID(cached) if cached else None
@@ -0,0 +1,209 @@
+# Render benchmark suite for render_pdf / render_docx across resume sizes and styles.
+#
+#   python benchmarks/render_benchmark.py                      # run and compare to baseline
+#   python benchmarks/render_benchmark.py --update-baseline    # store a new baseline
+#   python benchmarks/render_benchmark.py --entries 20 --formats pdf   # long (5+ page) PDFs only
+#
+# Results are written as JSON (benchmarks/results/latest.json by default). PDF cases also
+# report page count and bytes per page. The run exits with status 1 when any case regresses
+# past --threshold against benchmarks/baseline.json (median time only with MIN_TIMING_RUNS
+# runs or more), or when the baseline was recorded with a different RENDERER_VERSION
+# (refresh it with --update-baseline).
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import re
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from app.config.config import Config  # noqa: E402
+from app.services.render_service import RENDERER_VERSION, RENDERERS, RENDER_STYLES  # noqa: E402
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baseline.json")
+DEFAULT_OUTPUT = os.path.join(BENCH_DIR, "results", "latest.json")
+ENTRY_COUNTS = [1, 5, 10, 20, 30]
+# Timings from fewer runs than this (in the current run or the baseline) are too noisy to
+# gate on; deterministic metrics (bytes, peak memory) are still compared.
+MIN_TIMING_RUNS = 5
+
+WORDS = [
+    "shipped", "accessible", "design", "system", "components", "research", "roadmap",
+    "experimentation", "stakeholders", "onboarding", "latency", "dashboards", "metrics",
+    "prototype", "workshops", "platform", "migration", "reliability", "customers", "growth",
+]
+UNICODE_WORDS = ["résumé", "naïve", "Zoë", "façade", "Ñandú", "Øresund", "São", "Müller"]
+
+
+def synthetic_profile(entries: int, seed: int = 7) -> dict:
+    rng = random.Random(seed + entries)
+
+    def sentence(min_words: int, max_words: int) -> str:
+        words = [rng.choice(WORDS) for _ in range(rng.randint(min_words, max_words))]
+        words[rng.randrange(len(words))] = rng.choice(UNICODE_WORDS)
+        return " ".join(words).capitalize()
+
+    return {
+        "name": "Zoë Ramírez-Okafor",
+        "role": "Staff Product Designer",
+        "summary": " ".join(sentence(12, 24) + "." for _ in range(4)),
+        "skills": [rng.choice(WORDS).title() for _ in range(18)],
+        "bullets": [sentence(18, 40) for _ in range(4)],
+        "experiences": [
+            {
+                "title": f"Senior Designer {index + 1}",
+                "company": rng.choice(["Northwind", "Contoso", "Fabrikam", "Tailspin Toys"]),
+                "location": rng.choice(["Remote", "São Paulo", "Zürich", None]),
+                "start_date": f"Jan {2000 + index % 20}",
+                "end_date": f"Dec {2001 + index % 20}",
+                "bullets": [sentence(20, 60) for _ in range(rng.randint(3, 7))],
+            }
+            for index in range(entries)
+        ],
+        "education": [
+            {
+                "institution": "Université de Montréal",
+                "degree": "MSc",
+                "field_of_study": "Human–Computer Interaction",
+                "start_date": "2008",
+                "end_date": "2010",
+                "bullets": [sentence(10, 20)],
+            }
+        ],
+    }
+
+
+# Nearest-rank percentile.
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(math.ceil(pct / 100 * len(ordered)) - 1, 0))]
+
+
+def run_case(fmt: str, style: str, content: dict, runs: int, folder: str) -> dict:
+    render = RENDERERS[fmt]
+    path = os.path.join(folder, f"bench.{fmt}")
+    render(path, style=style, **content)
+
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        render(path, style=style, **content)
+        samples.append((time.perf_counter() - started) * 1000)
+
+    tracemalloc.start()
+    render(path, style=style, **content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    metrics = {
+        "median_ms": round(statistics.median(samples), 2),
+        "p95_ms": round(percentile(samples, 95), 2),
+        "peak_kib": round(peak / 1024, 1),
+        "bytes": os.path.getsize(path),
+    }
+    if fmt == "pdf":
+        with open(path, "rb") as handle:
+            metrics["pages"] = len(re.findall(rb"/Type /Page\b", handle.read()))
+        metrics["bytes_per_page"] = metrics["bytes"] // max(metrics["pages"], 1)
+    return metrics
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    # Output sizes and timings are only comparable within one renderer version.
+    if baseline.get("renderer_version") != results["renderer_version"]:
+        return [
+            f"renderer_version: baseline {baseline.get('renderer_version')} != current "
+            f"{results['renderer_version']}; run with --update-baseline"
+        ]
+    metrics = ["peak_kib", "bytes"]
+    if min(results.get("runs", 0), baseline.get("runs", 0)) >= MIN_TIMING_RUNS:
+        metrics.insert(0, "median_ms")
+    regressions = []
+    for case, current in results["cases"].items():
+        previous = baseline.get("cases", {}).get(case)
+        if not previous:
+            continue
+        for metric in metrics:
+            before = previous.get(metric)
+            after = current.get(metric)
+            if before and after > before * (1 + threshold):
+                regressions.append(f"{case} {metric}: {before} -> {after} (+{(after / before - 1) * 100:.0f}%)")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--entries", type=int, nargs="*", default=ENTRY_COUNTS)
+    parser.add_argument("--formats", nargs="*", default=list(RENDERERS))
+    parser.add_argument("--styles", nargs="*", default=list(RENDER_STYLES))
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+    if args.update_baseline and args.runs < MIN_TIMING_RUNS:
+        parser.error(f"--update-baseline needs --runs {MIN_TIMING_RUNS} or more")
+
+    results = {
+        "created_at": datetime.utcnow().isoformat(),
+        "renderer_version": RENDERER_VERSION,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "runs": args.runs,
+        "pdf_page_compression": Config.PDF_PAGE_COMPRESSION,
+        "pdf_fonts": Config.PDF_FONT_DIR or "base14",
+        "cases": {},
+    }
+
+    with tempfile.TemporaryDirectory() as folder:
+        for entries in args.entries:
+            content = synthetic_profile(entries)
+            for style in args.styles:
+                for fmt in args.formats:
+                    case = f"{fmt}/{style.lower()}/{entries}"
+                    results["cases"][case] = run_case(fmt, style, content, args.runs, folder)
+                    metrics = results["cases"][case]
+                    pages = f" pages={metrics['pages']} bytes/page={metrics['bytes_per_page']}" if "pages" in metrics else ""
+                    print(
+                        f"{case:<20} median={metrics['median_ms']:>8.2f}ms p95={metrics['p95_ms']:>8.2f}ms "
+                        f"peak={metrics['peak_kib']:>9.1f}KiB bytes={metrics['bytes']}{pages}"
+                    )
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as handle:
+        json.dump(results, handle, indent=2)
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as handle:
+            json.dump(results, handle, indent=2)
+        print(f"baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("no baseline found; run with --update-baseline to create one")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as handle:
+        baseline = json.load(handle)
+    if min(args.runs, baseline.get("runs", 0)) < MIN_TIMING_RUNS:
+        print(f"timings not compared: fewer than {MIN_TIMING_RUNS} runs in this run or the baseline")
+    regressions = compare(results, baseline, args.threshold)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,17 +1,52 @@
 # Main API application setup
-from fastapi import FastAPI
+import logging
+from contextlib import asynccontextmanager
+from typing import Optional
+from uuid import UUID
+from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from app.libs.db.base import Base, engine
+from sqlalchemy.orm import Session
+from app.libs.cache import cache_stats as app_cache_stats
+from app.libs.db.base import Base, engine, get_db, statement_counter
+from app.libs.storage.registry import get_storage
 from app.api.v1.users_routes import router as users_router
 from app.api.v1.tailor_routes import router as tailor_router
 from app.config.config import Config
+from app.services.render_service import render_cache_stats, shutdown_render_pool
+from app.services.retention_service import storage_usage, user_storage_bytes
+from app.services.visitor_service import flush_visitor_buffer
+
+logging.basicConfig(level=logging.DEBUG if Config.APP_DEBUG else logging.INFO)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    shutdown_render_pool()
+    flush_visitor_buffer()
+
 
 app = FastAPI(
     title="Resume Tailor API",
     description="API for managing users, resumes, education, experience, and files for Resume Tailor application",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
+# Reports how many SQL statements (including commits) a request issued.
+if Config.DB_STATEMENT_HEADER:
+    @app.middleware("http")
+    async def count_db_statements(request: Request, call_next):
+        counter = [0]
+        token = statement_counter.set(counter)
+        try:
+            response = await call_next(request)
+        finally:
+            statement_counter.reset(token)
+        response.headers["X-DB-Statements"] = str(counter[0])
+        return response
+
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=Config.CORS_ORIGINS,
@@ -28,4 +63,18 @@ app.include_router(tailor_router)
 
 @app.get("/health", tags=["health"])
 def health_check():
-    return {"status": "healthy"}
\ No newline at end of file
+    return {"status": "healthy"}
+
+
+@app.get("/health/cache", tags=["health"])
+def cache_stats():
+    return {"render_cache": render_cache_stats(), **app_cache_stats()}
+
+
+@app.get("/health/storage", tags=["health"])
+def storage_stats(user_id: Optional[UUID] = None, db: Session = Depends(get_db)):
+    usage = storage_usage(db)
+    usage["storage"] = get_storage().stats()
+    if user_id is not None:
+        usage["user_bytes"] = user_storage_bytes(db, user_id)
+    return usage
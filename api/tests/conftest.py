@@ -0,0 +1,81 @@
+# Test setup: the API runs against a throwaway SQLite file and storage directory.
+import os
+import sys
+import tempfile
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+os.environ.setdefault("OPENAI_API_KEY", "")
+os.environ["STORAGE_PATH"] = tempfile.mkdtemp(prefix="resumetailor-tests-")
+os.environ["RENDER_WORKERS"] = "0"
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+import app.models  # noqa: E402,F401
+from app.config.config import Config  # noqa: E402
+from app.libs.db.base import Base, SessionLocal, get_async_db  # noqa: E402
+
+RESUME_TEXT = """Jane Doe
+jane@example.com
+Summary
+Designer with ten years of experience.
+Experience
+Lead Designer - Acme, NYC 2020 - 2023
+- Built the design system used by forty teams
+Education
+MIT - BS, Computer Science 2010 - 2014
+Skills
+Figma, SQL, Python
+"""
+
+
+@pytest.fixture()
+def engine(tmp_path):
+    # A file database (not :memory:) so concurrent requests use separate connections.
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'test.db'}",
+        connect_args={"check_same_thread": False, "timeout": 5},
+    )
+    Base.metadata.create_all(engine)
+    SessionLocal.configure(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture()
+def db(engine):
+    session = SessionLocal()
+    yield session
+    session.close()
+
+
+@pytest.fixture()
+def client(engine):
+    from main import app
+
+    # Async routes read the same file through aiosqlite.
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{engine.url.database}")
+    async_session = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+    async def get_test_async_db():
+        async with async_session() as db:
+            yield db
+
+    app.dependency_overrides[get_async_db] = get_test_async_db
+    try:
+        with TestClient(app) as test_client:
+            yield test_client
+    finally:
+        app.dependency_overrides.pop(get_async_db, None)
+
+
+@pytest.fixture()
+def storage_path(tmp_path, monkeypatch):
+    path = tmp_path / "storage"
+    path.mkdir()
+    monkeypatch.setattr(Config, "STORAGE_PATH", str(path))
+    return path
@@ -0,0 +1,45 @@
+import pytest
+from app.libs.storage.registry import get_storage
+from app.schemas.tailor_batch_schema import TailorBatchRequest
+from app.services import tailor_service
+from tests.conftest import RESUME_TEXT
+
+
+def _batch() -> TailorBatchRequest:
+    return TailorBatchRequest(
+        resume_text=RESUME_TEXT,
+        jobs=[{"job_text": "Senior designer, Figma and research"}, {"job_text": "Staff designer, design systems"}],
+        styles=["Modern", "Slim"],
+    )
+
+
+def test_failed_batch_removes_files_it_already_wrote(db, storage_path, monkeypatch):
+    rendered = []
+    calls = []
+    render = tailor_service.render_tailored_files
+
+    def render_then_fail(tailored, on_progress=None):
+        calls.append(tailored)
+        if len(calls) == 3:
+            raise RuntimeError("render worker died")
+        render(tailored, on_progress)
+        rendered.extend(tailored.output_files)
+
+    monkeypatch.setattr(tailor_service, "render_tailored_files", render_then_fail)
+    with pytest.raises(RuntimeError):
+        tailor_service.run_tailor_batch(db, _batch(), None)
+
+    # The other rows render concurrently, so more than two may have finished before it fails.
+    assert len(rendered) >= 4
+    assert not any(get_storage().exists(key) for key in rendered)
+
+
+def test_rolled_back_batch_removes_files_committed_batch_keeps_them(db, storage_path):
+    discarded = tailor_service.run_tailor_batch(db, _batch(), None)
+    db.rollback()
+    kept = tailor_service.run_tailor_batch(db, _batch(), None)
+    db.commit()
+
+    storage = get_storage()
+    assert not any(storage.exists(key) for item in discarded.items for key in item.output_files)
+    assert all(storage.exists(key) for item in kept.items for key in item.output_files)
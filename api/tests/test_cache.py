@@ -0,0 +1,58 @@
+import pytest
+from app.config.config import Config
+from app.libs import cache
+from app.libs.cache import TTLCache
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture()
+def redis_client(monkeypatch):
+    client = fakeredis.FakeRedis()
+    monkeypatch.setattr(Config, "CACHE_REDIS_URL", "redis://fake")
+    monkeypatch.setattr(Config, "CACHE_EPOCH_CHECK_SECONDS", 0)
+    monkeypatch.setattr(cache, "_redis_client", client)
+    return client
+
+
+# Two instances with the same name stand in for the same cache in two workers.
+def _workers(name: str) -> tuple[TTLCache, TTLCache]:
+    return TTLCache(name, 100, 60), TTLCache(name, 100, 60)
+
+
+def test_invalidating_a_key_leaves_other_keys_cached_in_other_workers(redis_client):
+    first, second = _workers("per_key")
+    first.set("203.0.113.1", "user-1")
+    first.set("203.0.113.2", "user-2")
+
+    second.invalidate("203.0.113.1")
+
+    assert first.get("203.0.113.1") is None
+    assert first.get("203.0.113.2") == "user-2"
+    assert first.stats()["invalidations"] == 1
+    first.set("203.0.113.1", "user-3")
+    assert first.get("203.0.113.1") == "user-3"
+
+
+def test_invalidate_all_reaches_other_workers(redis_client):
+    first, second = _workers("whole_cache")
+    first.set("a", "1")
+    first.set("b", "2")
+
+    second.invalidate_all()
+
+    assert first.get("a") is None
+    assert first.get("b") is None
+
+
+def test_version_check_runs_without_the_lock(redis_client, monkeypatch):
+    worker = TTLCache("unlocked", 100, 60)
+    worker.set("a", "1")
+    mget = redis_client.mget
+
+    def checked_mget(*args, **kwargs):
+        assert not worker._lock.locked()
+        return mget(*args, **kwargs)
+
+    monkeypatch.setattr(redis_client, "mget", checked_mget)
+    assert worker.get("a") == "1"
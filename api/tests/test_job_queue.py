@@ -0,0 +1,99 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+from app.config.config import Config
+from app.services import job_queue_service
+from app.services.job_queue_service import JOB_FAILED, JOB_QUEUED, JOB_RUNNING, claim_next_tailor_job
+from app.schemas.tailored_resume_schema import TailorResumeRequest
+from tests.conftest import RESUME_TEXT
+
+
+def _enqueue(db):
+    payload = TailorResumeRequest(job_text="Senior designer, Figma", resume_text=RESUME_TEXT)
+    job = job_queue_service.enqueue_tailor_job(db, payload, None, "203.0.113.9")
+    db.commit()
+    return job
+
+
+def test_failed_job_waits_for_backoff(db, monkeypatch):
+    monkeypatch.setattr(Config, "JOB_RETRY_BACKOFF_SECONDS", 60)
+
+    def crash(*args, **kwargs):
+        raise RuntimeError("model unavailable")
+
+    monkeypatch.setattr(job_queue_service, "run_tailor_pipeline", crash)
+    job = _enqueue(db)
+
+    claimed = claim_next_tailor_job(db)
+    assert claimed.id == job.id
+    job_queue_service.run_tailor_job(db, claimed)
+    assert claimed.status == JOB_QUEUED
+    assert claimed.run_after > datetime.utcnow() + timedelta(seconds=55)
+    assert claim_next_tailor_job(db) is None
+
+    claimed.run_after = datetime.utcnow() - timedelta(seconds=1)
+    db.commit()
+    assert claim_next_tailor_job(db).attempts == 2
+
+
+def test_stale_job_out_of_attempts_is_failed(db):
+    job = _enqueue(db)
+    job.status = JOB_RUNNING
+    job.attempts = Config.JOB_MAX_ATTEMPTS
+    job.started_at = datetime.utcnow() - timedelta(seconds=Config.JOB_STALE_SECONDS + 60)
+    db.commit()
+
+    assert claim_next_tailor_job(db) is None
+    db.refresh(job)
+    assert job.status == JOB_FAILED
+    assert job.finished_at is not None
+
+
+def test_retry_keeps_streaming_new_events(db, monkeypatch):
+    monkeypatch.setattr(Config, "JOB_RETRY_BACKOFF_SECONDS", 0)
+    calls = []
+
+    def flaky_pipeline(db, payload, user_id, source_ip, on_progress=None):
+        calls.append(1)
+        on_progress("analyzed", {"elapsed_ms": 1.0})
+        on_progress("parsed", {"elapsed_ms": 1.0})
+        if len(calls) == 1:
+            raise RuntimeError("render worker died")
+        on_progress("rendered_pdf", {"elapsed_ms": 1.0})
+        return SimpleNamespace(id=uuid4())
+
+    monkeypatch.setattr(job_queue_service, "run_tailor_pipeline", flaky_pipeline)
+    job = _enqueue(db)
+    job_queue_service.run_tailor_job(db, claim_next_tailor_job(db))
+    db.refresh(job)
+    # A stream that delivered the whole first attempt is at seq 2.
+    seen = job_queue_service.progress_events_after(job.progress, 0)
+    assert [event["seq"] for event in seen] == [1, 2]
+
+    job_queue_service.run_tailor_job(db, claim_next_tailor_job(db))
+    db.refresh(job)
+    assert job.status == job_queue_service.JOB_SUCCEEDED
+    retried = job_queue_service.progress_events_after(job.progress, seen[-1]["seq"])
+    assert [(event["seq"], event["attempt"], event["stage"]) for event in retried] == [
+        (3, 2, "analyzed"),
+        (4, 2, "parsed"),
+        (5, 2, "rendered_pdf"),
+    ]
+
+
+def test_event_stream_resumes_unbuffered(db, client):
+    job = _enqueue(db)
+    job.progress = [
+        {"seq": seq, "attempt": 1 if seq < 3 else 2, "stage": stage, "at": "2026-01-01T00:00:00"}
+        for seq, stage in enumerate(["analyzed", "parsed", "analyzed", "parsed", "rendered_pdf"], start=1)
+    ]
+    job.status = job_queue_service.JOB_SUCCEEDED
+    db.commit()
+
+    response = client.get(f"/tailor/jobs/{job.id}/events", headers={"Last-Event-ID": "3"})
+    assert response.status_code == 200
+    # Tells a buffering proxy (nginx) to pass events through as they are written.
+    assert response.headers["x-accel-buffering"] == "no"
+    lines = response.text.splitlines()
+    assert [line for line in lines if line.startswith("id:")] == ["id: 4", "id: 5"]
+    assert "event: done" in lines
@@ -0,0 +1,34 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from uuid import UUID
+from app.config.config import Config
+from app.models.tailored_resume_model import TailoredResume
+from app.services import tailor_service
+from tests.conftest import RESUME_TEXT
+
+
+def test_overlapping_regenerates_share_one_committed_result(db, client, monkeypatch):
+    monkeypatch.setattr(Config, "REGENERATE_DEBOUNCE_SECONDS", 0.5)
+    payload = {"job_text": "Senior designer, Figma and research", "resume_text": RESUME_TEXT}
+    tailored_id = client.post("/tailor/generate", json=payload).json()["id"]
+    rows_before = db.query(TailoredResume).count()
+
+    edits = [{"statement": "First edit"}, {"style": "Fancy"}, {"statement": "Latest edit"}]
+
+    def regenerate(edit):
+        time.sleep(0.05 * edits.index(edit))
+        return client.post(f"/tailor/regenerate/{tailored_id}", json=edit)
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        responses = list(pool.map(regenerate, edits))
+
+    assert [response.status_code for response in responses] == [200, 200, 200]
+    results = [response.json() for response in responses]
+    assert len({result["id"] for result in results}) == 1
+    assert results[0]["style"] == "Fancy"
+    assert results[0]["tailored_summary"] == "Latest edit"
+
+    db.expire_all()
+    assert db.query(TailoredResume).count() == rows_before + 1
+    assert db.get(TailoredResume, UUID(results[0]["id"])) is not None
+    assert tailor_service._REGENERATE_SLOTS == {}
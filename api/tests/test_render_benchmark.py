@@ -0,0 +1,31 @@
+import importlib.util
+import os
+
+_spec = importlib.util.spec_from_file_location(
+    "render_benchmark", os.path.join(os.path.dirname(__file__), "..", "benchmarks", "render_benchmark.py")
+)
+render_benchmark = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(render_benchmark)
+
+
+def _results(runs: int, median_ms: float, version: str = "5") -> dict:
+    case = {"median_ms": median_ms, "p95_ms": median_ms, "peak_kib": 100.0, "bytes": 1000}
+    return {"renderer_version": version, "runs": runs, "cases": {"pdf/modern/1": case}}
+
+
+def test_p95_is_nearest_rank():
+    assert render_benchmark.percentile([5.0, 1.0], 95) == 5.0
+    assert render_benchmark.percentile([float(value) for value in range(1, 21)], 95) == 19.0
+    assert render_benchmark.percentile([3.0], 95) == 3.0
+
+
+def test_timings_are_only_gated_with_enough_runs():
+    baseline = _results(10, 10.0)
+    assert render_benchmark.compare(_results(2, 20.0), baseline, 0.25) == []
+    assert render_benchmark.compare(_results(10, 20.0), baseline, 0.25) == [
+        "pdf/modern/1 median_ms: 10.0 -> 20.0 (+100%)"
+    ]
+
+
+def test_renderer_version_mismatch_fails():
+    assert render_benchmark.compare(_results(10, 10.0), _results(10, 10.0, version="4"), 0.25)
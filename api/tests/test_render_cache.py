@@ -0,0 +1,33 @@
+import os
+from app.services import render_service
+
+
+def test_cache_hit_keeps_output_mtime(storage_path):
+    source = storage_path / "rendered.pdf"
+    source.write_bytes(b"%PDF-1.4 cached")
+    key = "ab" * 32
+    render_service._cache_store("pdf", key, str(source))
+
+    cache_path = render_service._render_cache_path("pdf", key)
+    os.utime(cache_path, (1_000_000, 1_000_000))
+    destination = storage_path / "served.pdf"
+    assert render_service._cache_fetch("pdf", key, str(destination))
+
+    stat = os.stat(destination)
+    assert stat.st_mtime == 1_000_000
+    assert stat.st_atime > 1_000_000
+    assert render_service._iter_cache_entries()[0][0] == stat.st_atime
+
+
+def test_restoring_a_key_does_not_double_count_bytes(storage_path):
+    source = storage_path / "rendered.pdf"
+    source.write_bytes(b"%PDF-1.4 first")
+    render_service._cache_store("pdf", "cd" * 32, str(source))
+    before = render_service.render_cache_stats()["bytes"]
+
+    # A fresh file: the first source shares its inode with the cache entry.
+    rerendered = storage_path / "rerendered.pdf"
+    rerendered.write_bytes(b"%PDF-1.4 first render")
+    render_service._cache_store("pdf", "cd" * 32, str(rerendered))
+    after = render_service.render_cache_stats()["bytes"]
+    assert after - before == len(b" render")
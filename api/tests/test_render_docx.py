@@ -0,0 +1,20 @@
+from app.services import render_service
+
+CONTENT = {
+    "name": "Jane Doe",
+    "role": "Designer",
+    "summary": "Designer with ten years of experience.",
+    "skills": ["Figma"],
+    "bullets": ["Built the design system"],
+    "experiences": [],
+    "education": [],
+}
+
+
+def test_docx_templates_are_cached_per_supported_style(tmp_path):
+    render_service._docx_template.cache_clear()
+    for index, style in enumerate(["Modern", "SLIM", "fancy", "Brutalist", "x" * 200, None]):
+        render_service.render_docx(str(tmp_path / f"{index}.docx"), style=style, **CONTENT)
+
+    # Unknown styles render as Modern instead of adding a template per input string.
+    assert render_service._docx_template.cache_info().currsize == 3
@@ -0,0 +1,8 @@
+from app.services import render_service
+from tests.test_render_docx import CONTENT
+
+
+def test_preview_matches_pdf_margins_and_role_color():
+    html = render_service.render_html(style="Slim", **CONTENT)
+    assert f"padding:{render_service._style_profile('Slim')['pdf_margin']}pt" in html
+    assert f".role{{color:{render_service.HTML_MUTED};" in html
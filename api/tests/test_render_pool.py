@@ -0,0 +1,66 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from app.config.config import Config
+from app.services import render_service
+from app.services.render_service import RenderTimeoutError
+
+
+# Module-level so spawned pool workers can import them.
+def hung_render(fmt: str, path: str, content: dict) -> float:
+    time.sleep(60)
+    return 0.0
+
+
+def quick_render(fmt: str, path: str, content: dict) -> float:
+    return 0.0
+
+
+def test_timed_out_render_recycles_the_pool(monkeypatch, tmp_path):
+    monkeypatch.setattr(Config, "RENDER_WORKERS", 1)
+    monkeypatch.setattr(Config, "RENDER_TIMEOUT_SECONDS", 1.0)
+    render_service.shutdown_render_pool()
+    targets = {"pdf": str(tmp_path / "resume.pdf")}
+
+    monkeypatch.setattr(render_service, "_timed_render", hung_render)
+    started = time.monotonic()
+    with pytest.raises(RenderTimeoutError):
+        render_service._render_targets(targets, {})
+    assert render_service._executor is None
+    assert time.monotonic() - started < 10
+
+    # The only worker slot was held by the hung render; a fresh pool serves the next one.
+    monkeypatch.setattr(render_service, "_timed_render", quick_render)
+    try:
+        assert render_service._render_targets(targets, {}) == {"pdf": 0.0}
+    finally:
+        render_service.shutdown_render_pool()
+
+
+def hang_if_asked(fmt: str, path: str, content: dict) -> float:
+    if content.get("hang"):
+        time.sleep(60)
+    return 0.0
+
+
+def test_timeout_does_not_fail_other_requests_renders(monkeypatch, tmp_path):
+    monkeypatch.setattr(Config, "RENDER_WORKERS", 1)
+    monkeypatch.setattr(Config, "RENDER_TIMEOUT_SECONDS", 2.0)
+    monkeypatch.setattr(render_service, "_timed_render", hang_if_asked)
+    render_service.shutdown_render_pool()
+
+    def render(index: int, content: dict):
+        targets = {fmt: str(tmp_path / f"{index}.{fmt}") for fmt in ("pdf", "docx")}
+        return render_service._render_targets(targets, content)
+
+    try:
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            hung = pool.submit(render, 0, {"hang": True})
+            time.sleep(0.5)
+            # Queued behind the hung render in the same pool; recycling it must not fail them.
+            others = [pool.submit(render, index, {}) for index in range(1, 5)]
+            with pytest.raises(RenderTimeoutError):
+                hung.result()
+            assert [future.result() for future in others] == [{"pdf": 0.0, "docx": 0.0}] * 4
+    finally:
+        render_service.shutdown_render_pool()
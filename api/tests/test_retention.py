@@ -0,0 +1,63 @@
+from datetime import datetime, timedelta
+from app.config.config import Config
+from app.libs.storage.local_storage import LocalStorage
+from app.libs.storage.registry import get_storage
+from app.models.tailored_resume_model import TailoredResume
+from app.schemas.tailored_resume_schema import TailorResumeRequest
+from app.services import retention_service
+from app.services.tailor_service import run_tailor_pipeline
+from tests.conftest import RESUME_TEXT
+
+
+class DocxDeleteFails(LocalStorage):
+    def delete(self, key: str) -> None:
+        if key.endswith(".docx"):
+            raise OSError("storage unavailable")
+        super().delete(key)
+
+
+def _tailor(db) -> TailoredResume:
+    payload = TailorResumeRequest(job_text="Senior designer, Figma and research", resume_text=RESUME_TEXT)
+    tailored = run_tailor_pipeline(db, payload, None, "203.0.113.9")
+    db.commit()
+    return tailored
+
+
+def test_failed_delete_is_retried_by_next_sweep(db, storage_path, monkeypatch):
+    tailored = _tailor(db)
+    pdf_key, docx_key = tailored.output_files
+    output_bytes = tailored.output_bytes
+    later = datetime.utcnow() + timedelta(days=Config.RETENTION_DAYS_ANONYMOUS + 1)
+
+    failing = DocxDeleteFails(str(storage_path), dedup=Config.STORAGE_DEDUP)
+    monkeypatch.setattr(retention_service, "get_storage", lambda: failing)
+    result = retention_service.sweep_expired_outputs(db, now=later)
+    assert result["rows"] == 0 and result["failed_files"] == 1
+
+    db.refresh(tailored)
+    assert tailored.output_files == [docx_key]
+    assert tailored.outputs_purged_at is None
+    assert tailored.output_bytes == output_bytes
+    assert not failing.exists(pdf_key) and failing.exists(docx_key)
+
+    monkeypatch.setattr(retention_service, "get_storage", get_storage)
+    assert retention_service.sweep_expired_outputs(db, now=later)["rows"] == 1
+    db.refresh(tailored)
+    assert tailored.output_files == []
+    assert tailored.outputs_purged_at == later
+    assert not get_storage().exists(docx_key)
+
+
+def test_lazy_render_records_output_bytes(db, client, storage_path, monkeypatch):
+    monkeypatch.setattr(Config, "RENDER_MODE", "lazy")
+    tailored = _tailor(db)
+    assert not tailored.output_bytes
+
+    sizes = 0
+    for key in tailored.output_files:
+        response = client.get(f"/tailor/download/{tailored.id}/{key.rsplit('/', 1)[-1]}")
+        assert response.status_code == 200
+        sizes += len(response.content)
+
+    db.refresh(tailored)
+    assert tailored.output_bytes == sizes
@@ -0,0 +1,16 @@
+from app.models.visitor_identity_model import VisitorIdentity
+
+
+def test_signup_links_and_counts_the_visit(db, client):
+    client.post("/users/track-visit")
+    payload = {"username": "jane", "email": "jane@example.com", "password": "correct horse"}
+
+    response = client.post("/users/signup", json=payload)
+
+    assert response.status_code == 200
+    user_id = response.json()["user"]["id"]
+    visitor = db.query(VisitorIdentity).filter(VisitorIdentity.ip_address == "testclient").one()
+    assert str(visitor.user_id) == user_id
+    # The earlier visit plus the signup one; linking the IP is not a visit.
+    assert visitor.visit_count == 2
+    assert client.post("/users/signup", json=payload).status_code == 409
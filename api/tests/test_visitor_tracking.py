@@ -0,0 +1,24 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from app.api.v1 import tailor_routes
+from app.models.visitor_identity_model import VisitorIdentity
+from app.services.tailor_service import run_tailor_pipeline
+from tests.conftest import RESUME_TEXT
+
+
+def test_same_ip_requests_do_not_wait_on_each_other(db, client, monkeypatch):
+    # Both requests have to be inside the pipeline at once; a visit row lock held until the
+    # end of the first request would keep the second one out until the barrier times out.
+    both_running = threading.Barrier(2, timeout=10)
+
+    def pipeline(*args, **kwargs):
+        both_running.wait()
+        return run_tailor_pipeline(*args, **kwargs)
+
+    monkeypatch.setattr(tailor_routes, "run_tailor_pipeline", pipeline)
+    payload = {"job_text": "Senior designer, Figma and research", "resume_text": RESUME_TEXT}
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        responses = list(pool.map(lambda _: client.post("/tailor/generate", json=payload), range(2)))
+
+    assert [response.status_code for response in responses] == [200, 200]
+    assert db.query(VisitorIdentity.visit_count).filter(VisitorIdentity.ip_address == "testclient").scalar() == 2
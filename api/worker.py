@@ -0,0 +1,59 @@
+# Background worker for queued tailor jobs: python worker.py
+import logging
+import signal
+import time
+from app.config.config import Config
+from app.libs.db.base import SessionLocal
+import app.models  # noqa: F401
+from app.services.job_queue_service import claim_next_tailor_job, run_tailor_job
+from app.services.render_service import shutdown_render_pool
+from app.services.retention_service import sweep_expired_outputs
+
+logging.basicConfig(level=logging.DEBUG if Config.APP_DEBUG else logging.INFO)
+logger = logging.getLogger("worker")
+
+_running = True
+
+
+def _stop(signum, frame):
+    global _running
+    _running = False
+
+
+def main() -> None:
+    signal.signal(signal.SIGINT, _stop)
+    signal.signal(signal.SIGTERM, _stop)
+    logger.info("tailor worker started")
+    next_sweep = time.monotonic()
+
+    while _running:
+        db = SessionLocal()
+        try:
+            if time.monotonic() >= next_sweep:
+                next_sweep = time.monotonic() + Config.RETENTION_SWEEP_INTERVAL_SECONDS
+                sweep_expired_outputs(db)
+
+            job = claim_next_tailor_job(db)
+            if job is None:
+                time.sleep(Config.JOB_POLL_INTERVAL_SECONDS)
+                continue
+            started = time.perf_counter()
+            job = run_tailor_job(db, job)
+            logger.info(
+                "tailor job %s %s in %.1fms",
+                job.id,
+                job.status,
+                (time.perf_counter() - started) * 1000,
+            )
+        except Exception:
+            logger.exception("tailor worker loop error")
+            time.sleep(Config.JOB_POLL_INTERVAL_SECONDS)
+        finally:
+            db.close()
+
+    shutdown_render_pool()
+    logger.info("tailor worker stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,12 @@ import Footer from "../../components/Footer";
 import Button from "../../components/ui/Button";
 import styles from "./analysis.module.scss";
 import { trackVisit } from "../../lib/api";
-import { API_BASE, buildPreviewOutputFiles } from "../../lib/api";
+import {
+  API_BASE,
+  buildArchiveUrl,
+  buildPreviewOutputFiles,
+  fetchPreviewHtml,
+} from "../../lib/api";
 import type {
   AnalysisClientProps,
   EducationEntry,
@@ -75,6 +80,8 @@ export default function AnalysisClient({ data }: AnalysisClientProps) {
   );
   const [isSubmitting, setIsSubmitting] = useState(false);
   const [errorMessage, setErrorMessage] = useState<string | null>(null);
+  const [previewHtml, setPreviewHtml] = useState<string | null>(null);
+  const [savedPayloadKey, setSavedPayloadKey] = useState<string | null>(null);
 
   useEffect(() => {
     trackVisit().catch(() => undefined);
@@ -135,6 +142,60 @@ export default function AnalysisClient({ data }: AnalysisClientProps) {
   const viewerUrl = pdfFile?.previewUrl ?? null;
   const openFile = pdfFile ?? primaryFile;
 
+  const editPayload = useMemo(
+    () => ({
+      statement: statement.trim() || null,
+      skills: skills
+        .split(",")
+        .map((skill) => skill.trim())
+        .filter(Boolean),
+      experience: experience.map((item) => ({
+        title: item.title?.trim() || null,
+        company: item.company?.trim() || null,
+        location: item.location?.trim() || null,
+        start_date: item.start_date?.trim() || null,
+        end_date: item.end_date?.trim() || null,
+        bullets: normalizeBullets(item.bullets),
+      })),
+      education: education.map((item) => ({
+        institution: item.institution?.trim() || null,
+        degree: item.degree?.trim() || null,
+        field_of_study: item.field_of_study?.trim() || null,
+        start_date: item.start_date?.trim() || null,
+        end_date: item.end_date?.trim() || null,
+        bullets: normalizeBullets(item.bullets),
+      })),
+      style: selectedStyle,
+    }),
+    [statement, skills, experience, education, selectedStyle]
+  );
+  const payloadKey = useMemo(() => JSON.stringify(editPayload), [editPayload]);
+
+  // Unsaved edits are previewed as server-rendered HTML; PDF/DOCX files are only
+  // rendered when the user generates the resume.
+  useEffect(() => {
+    if (savedPayloadKey === null) {
+      setSavedPayloadKey(payloadKey);
+      return;
+    }
+    if (payloadKey === savedPayloadKey) {
+      setPreviewHtml(null);
+      return;
+    }
+
+    const controller = new AbortController();
+    const timer = window.setTimeout(() => {
+      fetchPreviewHtml(currentId, editPayload, controller.signal)
+        .then(setPreviewHtml)
+        .catch(() => undefined);
+    }, 250);
+
+    return () => {
+      window.clearTimeout(timer);
+      controller.abort();
+    };
+  }, [currentId, editPayload, payloadKey, savedPayloadKey]);
+
   const updateExperienceEntry = (
     index: number,
     patch: Partial<ExperienceEntry>
@@ -269,36 +330,11 @@ export default function AnalysisClient({ data }: AnalysisClientProps) {
     setIsSubmitting(true);
     setErrorMessage(null);
 
-    const payload = {
-      statement: statement.trim() || null,
-      skills: skills
-        .split(",")
-        .map((skill) => skill.trim())
-        .filter(Boolean),
-      experience: experience.map((item) => ({
-        title: item.title?.trim() || null,
-        company: item.company?.trim() || null,
-        location: item.location?.trim() || null,
-        start_date: item.start_date?.trim() || null,
-        end_date: item.end_date?.trim() || null,
-        bullets: normalizeBullets(item.bullets),
-      })),
-      education: education.map((item) => ({
-        institution: item.institution?.trim() || null,
-        degree: item.degree?.trim() || null,
-        field_of_study: item.field_of_study?.trim() || null,
-        start_date: item.start_date?.trim() || null,
-        end_date: item.end_date?.trim() || null,
-        bullets: normalizeBullets(item.bullets),
-      })),
-      style: selectedStyle,
-    };
-
     try {
       const response = await fetch(`${API_BASE}/tailor/regenerate/${currentId}`, {
         method: "POST",
         headers: { "Content-Type": "application/json" },
-        body: JSON.stringify(payload),
+        body: payloadKey,
       });
 
       if (!response.ok) {
@@ -329,6 +365,8 @@ export default function AnalysisClient({ data }: AnalysisClientProps) {
       setSkills((previewData.skills ?? []).join(", "));
       setExperience(previewData.experience ?? []);
       setEducation(previewData.education ?? []);
+      setPreviewHtml(null);
+      setSavedPayloadKey(null);
 
       if (window.history?.replaceState) {
         window.history.replaceState({}, "", `/analysis/${previewData.id}`);
@@ -379,7 +417,14 @@ export default function AnalysisClient({ data }: AnalysisClientProps) {
             </div>
           </div>
           <div className={styles.viewerFrame}>
-            {viewerUrl ? (
+            {previewHtml ? (
+              <iframe
+                className={styles.viewerIframe}
+                srcDoc={previewHtml}
+                sandbox=""
+                title="Resume preview"
+              />
+            ) : viewerUrl ? (
               <iframe
                 className={styles.viewerIframe}
                 src={viewerUrl}
@@ -396,7 +441,9 @@ export default function AnalysisClient({ data }: AnalysisClientProps) {
             <div>
               <strong>{openFile?.name ?? "Preview file"}</strong>
               <span>
-                {viewerUrl
+                {previewHtml
+                  ? `Live preview of unsaved edits. Style: ${selectedStyle}`
+                  : viewerUrl
                   ? `PDF preview is ready. Style: ${selectedStyle}`
                   : "PDF preview is available after generation."}
               </span>
@@ -411,6 +458,15 @@ export default function AnalysisClient({ data }: AnalysisClientProps) {
                   Download
                 </Button>
               ) : null}
+              {outputs.length > 1 ? (
+                <Button
+                  variant="inline"
+                  type="button"
+                  onClick={() => window.open(buildArchiveUrl([currentId]), "_blank")}
+                >
+                  Download all (ZIP)
+                </Button>
+              ) : null}
             </div>
           </div>
         </section>
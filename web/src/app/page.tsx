@@ -11,14 +11,16 @@ import WorkspaceSection from "../components/WorkspaceSection";
 import StepsSection from "../components/StepsSection";
 import TemplatesSection from "../components/TemplatesSection";
 import Footer from "../components/Footer";
-import { apiPost, apiUpload, buildOutputFiles, trackVisit } from "../lib/api";
-import type {
-  AnalyzeJobResponse,
-  GenerateResumeResponse,
-  ParseResumeResponse,
-  Results,
-  Status,
-} from "../types/tailor";
+import {
+  apiGet,
+  apiUpload,
+  buildOutputFiles,
+  describeStageEvent,
+  streamJobEvents,
+  trackVisit,
+} from "../lib/api";
+import type { AnalysisApiResponse } from "../types/analysis";
+import type { Results, Status, TailorJobResponse } from "../types/tailor";
 
 const sampleJobDescription = `We are looking for a product designer to partner with product and engineering on discovery,
 prototype new experiences, and deliver polished UI. Experience running workshops, creating design systems, and shipping
@@ -60,9 +62,6 @@ const templates = [
   },
 ];
 
-const buildMatchScore = (jobLength: number) =>
-  Math.min(96, 60 + Math.floor(jobLength / 55));
-
 const buildGapList = (focusSignals: string[]) => {
   const defaults = [
     "Metrics definition",
@@ -164,51 +163,40 @@ export default function Home() {
     try {
       setStatus("uploading");
       setProgress(18);
-      logActivity("Uploading resume and extracting sections");
+      logActivity("Uploading resume and queueing the tailoring job");
 
+      // Parsing and job analysis run in the worker; their stages stream back below.
       const formData = new FormData();
       formData.append("file", resumeFile);
-      const parseResponse = await apiUpload<ParseResumeResponse>(
-        "/tailor/parse-resume-file",
-        formData
-      );
+      formData.append("job_text", jobText);
+      formData.append("target_role", targetRole);
+      formData.append("style", "Modern");
+      const job = await apiUpload<TailorJobResponse>("/tailor/jobs/file", formData);
 
       setStatus("analyzing");
-      setProgress(52);
-      logActivity("Analyzing job description and role signals");
-
-      const analyzeResponse = await apiPost<AnalyzeJobResponse>(
-        "/tailor/analyze-job",
-        { job_text: jobText, target_role: targetRole, experience_level: experienceLevel }
-      );
-
-      setStatus("tailoring");
-      setProgress(82);
-      logActivity("Drafting tailored bullet points and summaries");
-
-      const generateResponse = await apiPost<GenerateResumeResponse>(
-        "/tailor/generate",
-        {
-          job_analysis_id: analyzeResponse.id,
-          resume_profile_id: parseResponse.id,
-          target_role: targetRole,
-          style: "Modern",
+      setProgress(30);
+      const generateResponse = await streamJobEvents(job.id, (event) => {
+        if (event.stage === "parsed") {
+          setStatus("tailoring");
         }
-      );
+        logActivity(describeStageEvent(event));
+        setProgress((prev) => Math.min(prev + 12, 96));
+      });
 
-      const matchScore = buildMatchScore(jobText.length);
-      const gaps = buildGapList(analyzeResponse.signals.focus);
+      const result = await apiGet<AnalysisApiResponse>(
+        `/tailor/result/${generateResponse.id}`
+      );
       const outputFiles = buildOutputFiles(
         generateResponse.output_files,
         generateResponse.id
       );
 
       setResults({
-        candidateName: parseResponse.parsed_data?.name ?? "Candidate",
+        candidateName: result.candidate_name ?? "Candidate",
         currentTitle: targetRole,
-        matchScore,
-        keywords: analyzeResponse.keywords,
-        gaps,
+        matchScore: result.match_score,
+        keywords: result.keywords,
+        gaps: buildGapList(result.signals.focus ?? []),
         highlights: generateResponse.tailored_bullets,
         suggestedBullets: generateResponse.tailored_bullets,
         outputFiles,
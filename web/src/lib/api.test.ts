@@ -1,5 +1,12 @@
 import { describe, expect, it } from "vitest";
-import { buildOutputFiles, buildPreviewOutputFiles } from "./api";
+import {
+  buildArchiveUrl,
+  buildJobEventsUrl,
+  buildOutputFiles,
+  buildPreviewHtmlUrl,
+  buildPreviewOutputFiles,
+  describeStageEvent,
+} from "./api";
 
 describe("api helpers", () => {
   it("buildOutputFiles maps file paths to downloadable file objects", () => {
@@ -23,4 +30,26 @@ describe("api helpers", () => {
     expect(outputs[0].url).toContain("/tailor/download/xyz789/");
     expect(outputs[0].previewUrl).toContain("/tailor/preview/xyz789/");
   });
+
+  it("buildArchiveUrl uses the single or multi resume archive route", () => {
+    expect(buildArchiveUrl(["abc"])).toMatch(/\/tailor\/archive\/abc$/);
+    expect(buildArchiveUrl(["abc", "def"])).toMatch(/\/tailor\/archive\?ids=abc&ids=def$/);
+  });
+
+  it("buildPreviewHtmlUrl targets the HTML preview endpoint", () => {
+    expect(buildPreviewHtmlUrl("xyz789")).toMatch(/\/tailor\/preview-html\/xyz789$/);
+  });
+
+  it("buildJobEventsUrl points at the job event stream", () => {
+    expect(buildJobEventsUrl("job-1")).toContain("/tailor/jobs/job-1/events");
+  });
+
+  it("describeStageEvent includes timings and cache reuse", () => {
+    expect(
+      describeStageEvent({ stage: "analyzed", elapsed_ms: 812.4, at: "" })
+    ).toBe("Analyzed job requirements in 812 ms");
+    expect(
+      describeStageEvent({ stage: "rendered_pdf", elapsed_ms: 0, cached: true, at: "" })
+    ).toBe("Rendered PDF (reused)");
+  });
 });
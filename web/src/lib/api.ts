@@ -1,3 +1,10 @@
+import type {
+  GenerateResumeResponse,
+  JobDoneEvent,
+  JobStageEvent,
+  PipelineStage,
+} from "../types/tailor";
+
 export const API_BASE =
   process.env.NEXT_PUBLIC_API_BASE_URL ?? "http://localhost:8000";
 
@@ -15,6 +22,16 @@ export const apiPost = async <T,>(endpoint: string, payload: unknown) => {
   return (await response.json()) as T;
 };
 
+export const apiGet = async <T,>(endpoint: string) => {
+  const response = await fetch(`${API_BASE}${endpoint}`);
+
+  if (!response.ok) {
+    throw new Error("Request failed");
+  }
+
+  return (await response.json()) as T;
+};
+
 export const apiUpload = async <T,>(endpoint: string, formData: FormData) => {
   const response = await fetch(`${API_BASE}${endpoint}`, {
     method: "POST",
@@ -50,3 +67,79 @@ export const buildPreviewOutputFiles = (paths: string[], id: string) =>
       previewUrl: `${API_BASE}/tailor/preview/${id}/${encodeURIComponent(name)}`,
     };
   });
+
+export const buildArchiveUrl = (ids: string[]) =>
+  ids.length === 1
+    ? `${API_BASE}/tailor/archive/${encodeURIComponent(ids[0])}`
+    : `${API_BASE}/tailor/archive?${ids
+        .map((id) => `ids=${encodeURIComponent(id)}`)
+        .join("&")}`;
+
+export const buildPreviewHtmlUrl = (id: string) =>
+  `${API_BASE}/tailor/preview-html/${encodeURIComponent(id)}`;
+
+export const fetchPreviewHtml = async (
+  id: string,
+  payload: unknown,
+  signal?: AbortSignal
+) => {
+  const response = await fetch(buildPreviewHtmlUrl(id), {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify(payload),
+    signal,
+  });
+
+  if (!response.ok) {
+    throw new Error("Preview failed");
+  }
+
+  return response.text();
+};
+
+const stageLabels: Record<PipelineStage, string> = {
+  fetched: "Fetched the job posting",
+  extracted: "Extracted the job description",
+  analyzed: "Analyzed job requirements",
+  parsed: "Parsed resume sections",
+  rendered_pdf: "Rendered PDF",
+  rendered_docx: "Rendered DOCX",
+};
+
+export const describeStageEvent = (event: JobStageEvent) => {
+  const label = stageLabels[event.stage] ?? event.stage;
+  const retry = event.attempt > 1 ? ` (attempt ${event.attempt})` : "";
+  return event.cached
+    ? `${label} (reused)${retry}`
+    : `${label} in ${Math.round(event.elapsed_ms)} ms${retry}`;
+};
+
+export const buildJobEventsUrl = (jobId: string) =>
+  `${API_BASE}/tailor/jobs/${encodeURIComponent(jobId)}/events`;
+
+export const streamJobEvents = (
+  jobId: string,
+  onStage: (event: JobStageEvent) => void
+) =>
+  new Promise<GenerateResumeResponse>((resolve, reject) => {
+    const source = new EventSource(buildJobEventsUrl(jobId));
+
+    source.addEventListener("stage", (message) => {
+      onStage(JSON.parse(message.data) as JobStageEvent);
+    });
+
+    source.addEventListener("done", (message) => {
+      source.close();
+      const done = JSON.parse(message.data) as JobDoneEvent;
+      if (done.status === "succeeded" && done.result) {
+        resolve(done.result);
+      } else {
+        reject(new Error(done.error ?? "Tailoring failed"));
+      }
+    });
+
+    source.onerror = () => {
+      source.close();
+      reject(new Error("Lost connection to progress stream"));
+    };
+  });
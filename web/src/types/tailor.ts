@@ -51,6 +51,37 @@ export type GenerateResumeResponse = {
   output_files: string[];
 };
 
+export type PipelineStage =
+  | "fetched"
+  | "extracted"
+  | "analyzed"
+  | "parsed"
+  | "rendered_pdf"
+  | "rendered_docx";
+
+export type TailorJobResponse = {
+  id: string;
+  status: "queued" | "running" | "succeeded" | "failed";
+  error?: string | null;
+  tailored_resume_id?: string | null;
+};
+
+export type JobStageEvent = {
+  seq: number;
+  attempt: number;
+  stage: PipelineStage;
+  elapsed_ms: number;
+  cached?: boolean;
+  at: string;
+};
+
+export type JobDoneEvent = {
+  status: TailorJobResponse["status"];
+  tailored_resume_id: string | null;
+  error: string | null;
+  result: GenerateResumeResponse | null;
+};
+
 export type ParseResumePayload = {
   fileName?: string;
 };